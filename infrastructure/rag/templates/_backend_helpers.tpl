@@ -87,6 +87,14 @@ basic-auth
 {{- printf "%s-ollama-embedder-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
 {{- end -}}
 
+{{- define "configmap.fastembedEmbedderName" -}}
+{{- printf "%s-fastembed-embedder-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.embeddingReductionName" -}}
+{{- printf "%s-embedding-reduction-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
 {{- define "configmap.fakeEmbedderName" -}}
 {{- printf "%s-fake-embedder-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
 {{- end -}}
@@ -103,6 +111,50 @@ basic-auth
 {{- printf "%s-retriever-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
 {{- end -}}
 
+{{- define "configmap.imageStorageName" -}}
+{{- printf "%s-image-storage-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.citationName" -}}
+{{- printf "%s-citation-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.diversityName" -}}
+{{- printf "%s-diversity-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.coarseToFineName" -}}
+{{- printf "%s-coarse-to-fine-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.sessionContextName" -}}
+{{- printf "%s-session-context-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.chatDeadlineName" -}}
+{{- printf "%s-chat-deadline-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.degradedModeName" -}}
+{{- printf "%s-degraded-mode-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.smallTalkName" -}}
+{{- printf "%s-small-talk-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.batchChatName" -}}
+{{- printf "%s-batch-chat-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.ingestionName" -}}
+{{- printf "%s-ingestion-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
+{{- define "configmap.chainLlmName" -}}
+{{- printf "%s-chain-llm-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
+{{- end -}}
+
 {{- define "configmap.langfuseName" -}}
 {{- printf "%s-langfuse-configmap" .Release.Name | trunc 63 | trimSuffix "-" -}}
 {{- end -}}
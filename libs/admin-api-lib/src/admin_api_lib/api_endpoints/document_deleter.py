@@ -29,3 +29,22 @@ class DocumentDeleter(ABC):
         -------
         None
         """
+
+    async def adelete_documents(self, identifications: list[str]) -> None:
+        """
+        Delete several documents by their identifications asynchronously.
+
+        Implementations should override this to delete the documents in bulk; by default the documents are deleted
+        one by one.
+
+        Parameters
+        ----------
+        identifications : list[str]
+            The unique identifiers of the documents to be deleted.
+
+        Returns
+        -------
+        None
+        """
+        for identification in identifications:
+            await self.adelete_document(identification)
@@ -26,15 +26,17 @@ from fastapi import (  # noqa: F401
     status,
 )
 from pydantic import Field, StrictStr
+from rag_core_lib.impl.utils.fast_json import ORJSONRoute
 
 
 from admin_api_lib.apis.admin_api_base import BaseAdminApi
+from admin_api_lib.models.delete_documents_request import DeleteDocumentsRequest
 from admin_api_lib.models.document_status import DocumentStatus
 from admin_api_lib.models.http_validation_error import HTTPValidationError
 from admin_api_lib.models.key_value_pair import KeyValuePair
 from admin_api_lib.models.extra_models import TokenModel  # noqa: F401
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 ns_pkg = admin_api_lib.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
@@ -78,6 +80,40 @@ async def delete_document(
     return await BaseAdminApi.subclasses[0]().delete_document(identification)
 
 
+@router.post(
+    "/delete_documents",
+    responses={
+        200: {"description": "Deleted"},
+        404: {"description": "Some documents could not be deleted"},
+        500: {"description": "Internal server error"},
+        422: {"model": HTTPValidationError, "description": "Validation Error"},
+    },
+    tags=["admin"],
+    summary="Delete Documents",
+    response_model_by_alias=True,
+)
+async def delete_documents(
+    delete_documents_request: DeleteDocumentsRequest = Body(..., description=""),
+) -> None:
+    """
+    Asynchronously deletes several documents, given by their identifications or a prefix of them.
+
+    Running uploads of the documents are cancelled as for the deletion of a single document.
+
+    Parameters
+    ----------
+    delete_documents_request : DeleteDocumentsRequest
+        The identifications of the documents to delete, or a prefix all their identifications start with.
+
+    Returns
+    -------
+    None
+    """
+    if not BaseAdminApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseAdminApi.subclasses[0]().delete_documents(delete_documents_request)
+
+
 @router.get(
     "/document_reference/{identification}",
     responses={
@@ -9,6 +9,7 @@ from typing_extensions import Annotated
 from pydantic import Field, StrictStr
 from fastapi import Request, Response, UploadFile
 
+from admin_api_lib.models.delete_documents_request import DeleteDocumentsRequest
 from admin_api_lib.models.document_status import DocumentStatus
 from admin_api_lib.models.key_value_pair import KeyValuePair
 
@@ -46,6 +47,23 @@ class BaseAdminApi:
         None
         """
 
+    async def delete_documents(
+        self,
+        delete_documents_request: DeleteDocumentsRequest,
+    ) -> None:
+        """
+        Asynchronously deletes several documents, given by their identifications or a prefix of them.
+
+        Parameters
+        ----------
+        delete_documents_request : DeleteDocumentsRequest
+            The identifications of the documents to delete, or a prefix all their identifications start with.
+
+        Returns
+        -------
+        None
+        """
+
     async def document_reference(
         self,
         identification: Annotated[StrictStr, Field(description="Identifier of the document.")],
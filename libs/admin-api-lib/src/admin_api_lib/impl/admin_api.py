@@ -5,7 +5,7 @@ import logging
 
 from pydantic import StrictStr
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, Request, Response, UploadFile
+from fastapi import Depends, HTTPException, Request, Response, UploadFile, status
 
 from admin_api_lib.api_endpoints.file_uploader import FileUploader
 from admin_api_lib.api_endpoints.source_uploader import SourceUploader
@@ -19,7 +19,9 @@ from admin_api_lib.api_endpoints.documents_status_retriever import (
 )
 from admin_api_lib.apis.admin_api_base import BaseAdminApi
 from admin_api_lib.dependency_container import DependencyContainer
+from admin_api_lib.models.delete_documents_request import DeleteDocumentsRequest
 from admin_api_lib.models.document_status import DocumentStatus
+from admin_api_lib.models.status import Status
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,62 @@ class AdminApi(BaseAdminApi):
         source_uploader.cancel_upload(identification)
         await document_deleter.adelete_document(identification)
 
+    @inject
+    async def delete_documents(
+        self,
+        delete_documents_request: DeleteDocumentsRequest,
+        document_deleter: DocumentDeleter = Depends(Provide[DependencyContainer.document_deleter]),
+        document_status_retriever: DocumentsStatusRetriever = Depends(
+            Provide[DependencyContainer.documents_status_retriever]
+        ),
+        file_uploader: FileUploader = Depends(Provide[DependencyContainer.file_uploader]),
+        source_uploader: SourceUploader = Depends(Provide[DependencyContainer.source_uploader]),
+    ) -> None:
+        """
+        Delete several documents asynchronously.
+
+        Only the uploads of documents that are still uploading or processing are cancelled, so deleting thousands of
+        ready documents does not cost a cancellation per document.
+
+        Parameters
+        ----------
+        delete_documents_request : DeleteDocumentsRequest
+            The identifications of the documents to delete, or a prefix all their identifications start with.
+        document_deleter : DocumentDeleter
+            The document deleter instance, injected by dependency injection
+            (default is Depends(Provide[DependencyContainer.document_deleter])).
+        document_status_retriever : DocumentsStatusRetriever
+            Resolves the prefix and the running uploads
+            (default is Depends(Provide[DependencyContainer.documents_status_retriever])).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        HTTPException
+            If neither identifications nor a prefix are given, raises an HTTP 422 Unprocessable Entity error.
+        """
+        prefix = delete_documents_request.prefix
+        identifications = list(delete_documents_request.identifications or [])
+        if not identifications and not prefix:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Either identifications or a prefix are required.",
+            )
+        document_statuses = await document_status_retriever.aget_all_documents_status()
+        if prefix:
+            identifications += [x.name for x in document_statuses if x.name.startswith(prefix)]
+        identifications = list(dict.fromkeys(identifications))
+
+        requested = set(identifications)
+        for document_status in document_statuses:
+            if document_status.name in requested and document_status.status in (Status.UPLOADING, Status.PROCESSING):
+                file_uploader.cancel_upload(document_status.name)
+                source_uploader.cancel_upload(document_status.name)
+        await document_deleter.adelete_documents(identifications)
+
     @inject
     async def get_all_documents_status(
         self,
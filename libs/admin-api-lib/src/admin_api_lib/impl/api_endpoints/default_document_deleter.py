@@ -1,5 +1,6 @@
 """Module for the DefaultDocumentDeleter class."""
 
+import asyncio
 import json
 import logging
 
@@ -104,6 +105,53 @@ class DefaultDocumentDeleter(DocumentDeleter):
         if error_messages:
             raise HTTPException(404, error_messages)
 
+    async def adelete_documents(self, identifications: list[str]) -> None:
+        """
+        Asynchronously delete several documents.
+
+        The statuses are removed from the key-value store in one pipelined round trip, the files are deleted from
+        the file storage in batches and the information pieces of all documents are removed from the vector database
+        with a single request.
+
+        Parameters
+        ----------
+        identifications : list[str]
+            The unique identifiers of the documents to be deleted.
+
+        Raises
+        ------
+        HTTPException
+            If any errors occur during the deletion process, an HTTPException is raised with a 404 status code
+            and the error messages.
+        """
+        identifications = list(dict.fromkeys(identifications))
+        if not identifications:
+            return
+        logger.debug("Deleting %d existing documents.", len(identifications))
+        error_messages = ""
+        self._key_value_store.remove_many(identifications)
+
+        storage_keys = [
+            storage_key
+            for identification in identifications
+            if (storage_key := self._storage_key_from_identification(identification))
+        ]
+        if storage_keys:
+            errors = await asyncio.to_thread(self._file_service.delete_files, storage_keys)
+            for storage_key, error in errors.items():
+                error_messages += f"Error while deleting {storage_key} from file storage\n {error}\n"
+
+        try:
+            await asyncio.to_thread(
+                self._rag_api.remove_information_piece,
+                DeleteRequest(metadata=[KeyValuePair(key="document", value=json.dumps(identifications))]),
+            )
+            logger.info("Deleted information pieces belonging to %d documents from rag.", len(identifications))
+        except Exception as e:
+            error_messages += f"Error while deleting {len(identifications)} documents from vector db\n{str(e)}"
+        if error_messages:
+            raise HTTPException(404, error_messages)
+
     def _delete_from_storage(self, identification: str, error_messages: str) -> str:
         try:
             storage_key = self._storage_key_from_identification(identification)
@@ -37,6 +37,7 @@ class FileStatusKeyValueStore:
     CANCELLED_RUN_PREFIX = "stackit-rag-template-cancelled-run:"
     CANCEL_TTL_SECONDS = 6 * 60 * 60  # keep cancel markers around for a while to stop late workers
     ACTIVE_TTL_SECONDS = 24 * 60 * 60  # keep last run_id around so late workers can detect staleness
+    REMOVE_BATCH_SIZE = 1000  # number of statuses removed per SREM command
 
     def __init__(self, settings: KeyValueSettings):
         """
@@ -151,6 +152,35 @@ class FileStatusKeyValueStore:
                 FileStatusKeyValueStore._to_str(file_name_related[0], file_name_related[1]),
             )
 
+    def remove_many(self, file_names: list[str]) -> None:
+        """
+        Remove the specified file names from the key-value store.
+
+        The statuses are read once and removed in a single pipelined round trip, so removing thousands of files
+        does not cost a round trip per file.
+
+        Parameters
+        ----------
+        file_names : list[str]
+            The names of the files to be removed from the key-value store.
+
+        Returns
+        -------
+        None
+        """
+        file_names = set(file_names)
+        members = [
+            member
+            for member in self._redis.smembers(self.STORAGE_KEY)
+            if FileStatusKeyValueStore._from_str(member)[0] in file_names
+        ]
+        if not members:
+            return
+        with self._redis.pipeline(transaction=False) as pipeline:
+            for start in range(0, len(members), self.REMOVE_BATCH_SIZE):
+                pipeline.srem(self.STORAGE_KEY, *members[start : start + self.REMOVE_BATCH_SIZE])
+            pipeline.execute()
+
     def get_all(self) -> list[tuple[str, Status]]:
         """
         Retrieve all file status information from the Redis store.
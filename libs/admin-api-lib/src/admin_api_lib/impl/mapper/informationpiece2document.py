@@ -1,7 +1,5 @@
 """Module for mapping between InformationPiece and LangchainDocument."""
 
-import json
-
 from langchain_core.documents import Document as LangchainDocument
 
 from admin_api_lib.extractor_api_client.openapi_client.models.content_type import (
@@ -13,10 +11,8 @@ from admin_api_lib.extractor_api_client.openapi_client.models.information_piece
 from admin_api_lib.rag_backend_client.openapi_client.models.information_piece import (
     InformationPiece as RagInformationPiece,
 )
-from admin_api_lib.rag_backend_client.openapi_client.models.key_value_pair import (
-    KeyValuePair as RagKeyValue,
-)
 from rag_core_lib.impl.data_types.content_type import ContentType as RagInformationType
+from rag_core_lib.impl.utils import fast_json
 
 
 class InformationPiece2Document:
@@ -86,12 +82,14 @@ class InformationPiece2Document:
         RagInformationPiece
             The converted information piece with type, metadata, and page content.
         """
-        metadata = [RagKeyValue(key=str(key), value=json.dumps(value)) for key, value in document.metadata.items()]
+        metadata = [{"key": str(key), "value": fast_json.dumps(value)} for key, value in document.metadata.items()]
         content_type = RagInformationType(document.metadata[InformationPiece2Document.METADATA_TYPE_KEY].upper())
-        return RagInformationPiece(
-            type=content_type,
-            metadata=metadata,
-            page_content=document.page_content,
+        return RagInformationPiece.model_validate(
+            {
+                "type": content_type.value,
+                "metadata": metadata,
+                "page_content": document.page_content,
+            }
         )
 
     @staticmethod
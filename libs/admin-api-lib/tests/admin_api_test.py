@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
 
 from admin_api_lib.impl.admin_api import AdminApi
+from admin_api_lib.models.delete_documents_request import DeleteDocumentsRequest
+from admin_api_lib.models.document_status import DocumentStatus
+from admin_api_lib.models.status import Status
 
 
 @pytest.mark.asyncio
@@ -23,3 +27,48 @@ async def test_delete_document_requests_cancellation_before_delete():
     file_uploader.cancel_upload.assert_called_once_with(identification)
     source_uploader.cancel_upload.assert_called_once_with(identification)
     document_deleter.adelete_document.assert_awaited_once_with(identification)
+
+
+@pytest.mark.asyncio
+async def test_delete_documents_resolves_prefix_and_cancels_running_uploads_only():
+    admin_api = AdminApi()
+    document_deleter = MagicMock()
+    document_deleter.adelete_documents = AsyncMock()
+    document_status_retriever = MagicMock()
+    document_status_retriever.aget_all_documents_status = AsyncMock(
+        return_value=[
+            DocumentStatus(name="sitemap:https://example.com/a", status=Status.READY),
+            DocumentStatus(name="sitemap:https://example.com/b", status=Status.PROCESSING),
+            DocumentStatus(name="file:other.pdf", status=Status.PROCESSING),
+        ]
+    )
+    file_uploader = MagicMock()
+    source_uploader = MagicMock()
+
+    await admin_api.delete_documents(
+        DeleteDocumentsRequest(identifications=["file:gone.pdf"], prefix="sitemap:https://example.com/"),
+        document_deleter=document_deleter,
+        document_status_retriever=document_status_retriever,
+        file_uploader=file_uploader,
+        source_uploader=source_uploader,
+    )
+
+    document_deleter.adelete_documents.assert_awaited_once_with(
+        ["file:gone.pdf", "sitemap:https://example.com/a", "sitemap:https://example.com/b"]
+    )
+    file_uploader.cancel_upload.assert_called_once_with("sitemap:https://example.com/b")
+    source_uploader.cancel_upload.assert_called_once_with("sitemap:https://example.com/b")
+
+
+@pytest.mark.asyncio
+async def test_delete_documents_requires_identifications_or_prefix():
+    with pytest.raises(HTTPException) as exc_info:
+        await AdminApi().delete_documents(
+            DeleteDocumentsRequest(),
+            document_deleter=MagicMock(),
+            document_status_retriever=MagicMock(),
+            file_uploader=MagicMock(),
+            source_uploader=MagicMock(),
+        )
+
+    assert exc_info.value.status_code == 422
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+
+from admin_api_lib.impl.api_endpoints.default_document_deleter import DefaultDocumentDeleter
+
+
+@pytest.fixture
+def mocks():
+    file_service = MagicMock()
+    file_service.delete_files.return_value = {}
+    rag_api = MagicMock()
+    key_value_store = MagicMock()
+    return file_service, rag_api, key_value_store
+
+
+@pytest.mark.asyncio
+async def test_delete_documents_removes_all_documents_in_bulk(mocks):
+    file_service, rag_api, key_value_store = mocks
+    deleter = DefaultDocumentDeleter(file_service, rag_api, key_value_store)
+    identifications = ["file:a.pdf", "b.pdf", "confluence:space", "file:a.pdf"]
+
+    await deleter.adelete_documents(identifications)
+
+    key_value_store.remove_many.assert_called_once_with(["file:a.pdf", "b.pdf", "confluence:space"])
+    key_value_store.remove.assert_not_called()
+    file_service.delete_files.assert_called_once_with(["a.pdf", "b.pdf"])
+    file_service.delete_file.assert_not_called()
+    rag_api.remove_information_piece.assert_called_once()
+    delete_request = rag_api.remove_information_piece.call_args.args[0]
+    assert delete_request.metadata[0].key == "document"
+    assert json.loads(delete_request.metadata[0].value) == ["file:a.pdf", "b.pdf", "confluence:space"]
+
+
+@pytest.mark.asyncio
+async def test_delete_documents_reports_files_that_could_not_be_deleted(mocks):
+    file_service, rag_api, key_value_store = mocks
+    file_service.delete_files.return_value = {"b.pdf": "AccessDenied"}
+    deleter = DefaultDocumentDeleter(file_service, rag_api, key_value_store)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await deleter.adelete_documents(["file:a.pdf", "file:b.pdf"])
+
+    assert "b.pdf" in exc_info.value.detail
+    assert "a.pdf" not in exc_info.value.detail
+    rag_api.remove_information_piece.assert_called_once()
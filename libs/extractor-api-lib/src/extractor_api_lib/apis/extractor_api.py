@@ -23,13 +23,14 @@ from fastapi import (  # noqa: F401
     Security,
     status,
 )
+from rag_core_lib.impl.utils.fast_json import ORJSONRoute
 
 from extractor_api_lib.models.extra_models import TokenModel  # noqa: F401
 from extractor_api_lib.models.extraction_parameters import ExtractionParameters
 from extractor_api_lib.models.extraction_request import ExtractionRequest
 from extractor_api_lib.models.information_piece import InformationPiece
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 ns_pkg = extractor_api_lib.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
@@ -6,7 +6,6 @@ from extractor_api_lib.models.dataclasses.internal_information_piece import (
     InternalInformationPiece,
 )
 from extractor_api_lib.models.information_piece import InformationPiece
-from extractor_api_lib.models.key_value_pair import KeyValuePair as MetaInformationPiece
 
 
 class Internal2ExternalInformationPiece:
@@ -38,12 +37,16 @@ class Internal2ExternalInformationPiece:
         ExternalInformationPiece
             The mapped external information piece.
         """
-        information_type = self._map_information_type(internal.type)
-        meta = self._map_meta(internal.metadata)
-        return InformationPiece(page_content=internal.page_content, type=information_type, metadata=meta)
+        return InformationPiece.model_validate(
+            {
+                "page_content": internal.page_content,
+                "type": self._map_information_type(internal.type),
+                "metadata": self._map_meta(internal.metadata),
+            }
+        )
 
     def _map_information_type(self, internal: InternalContentType) -> ExternalContentType:
         return self.TYPE_LOOKUP_TABLE[internal]
 
-    def _map_meta(self, internal: dict) -> list[MetaInformationPiece]:
-        return [MetaInformationPiece(key=key, value=value) for key, value in internal.items()]
+    def _map_meta(self, internal: dict) -> list[dict]:
+        return [{"key": key, "value": value} for key, value in internal.items()]
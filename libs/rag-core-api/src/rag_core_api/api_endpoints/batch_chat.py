@@ -0,0 +1,32 @@
+"""Module for base class of the batch chat endpoint."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from rag_core_api.models.batch_chat_response_item import BatchChatResponseItem
+from rag_core_api.models.chat_request import ChatRequest
+
+
+class BatchChat(ABC):
+    """Base class for the batch chat endpoint."""
+
+    @abstractmethod
+    def abatch_chat(self, chat_requests: list[ChatRequest]) -> AsyncIterator[BatchChatResponseItem]:
+        """
+        Answer several chat requests at once.
+
+        Parameters
+        ----------
+        chat_requests : list[ChatRequest]
+            The chat requests to answer.
+
+        Returns
+        -------
+        AsyncIterator[BatchChatResponseItem]
+            One item per chat request, in the order of the requests.
+
+        Raises
+        ------
+        ValueError
+            If the batch is invalid, e.g. too large. Raised before the first item is produced.
+        """
@@ -0,0 +1,25 @@
+"""Module for the CitationImageRetriever abstract base class."""
+
+from abc import ABC, abstractmethod
+
+from fastapi import Response
+
+
+class CitationImageRetriever(ABC):
+    """Abstract base class for retrieving the images of cited image pieces."""
+
+    @abstractmethod
+    async def aget_citation_image(self, image_id: str) -> Response:
+        """
+        Get the image with the given ID asynchronously.
+
+        Parameters
+        ----------
+        image_id : str
+            The ID of the image, as found in the ``image_id`` metadata of a cited information piece.
+
+        Returns
+        -------
+        Response
+            The response containing the image.
+        """
@@ -0,0 +1,31 @@
+"""Module for the InformationPiecesFetcher abstract base class."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from rag_core_api.models.information_piece import InformationPiece
+
+
+class InformationPiecesFetcher(ABC):
+    """Abstract base class for fetching complete information pieces by their IDs."""
+
+    @abstractmethod
+    async def afetch_information_pieces(
+        self, ids: list[str], tenant_id: Optional[str] = None
+    ) -> list[InformationPiece]:
+        """
+        Fetch the information pieces with the given IDs asynchronously.
+
+        Parameters
+        ----------
+        ids : list[str]
+            The IDs of the information pieces, as found in the ``id`` metadata of the citations.
+        tenant_id : Optional[str]
+            Only return information pieces of this tenant (default None, meaning the tenant of requests without
+            tenant, as for the search).
+
+        Returns
+        -------
+        list[InformationPiece]
+            The information pieces found, in the order of the IDs.
+        """
@@ -0,0 +1,75 @@
+"""Module for the IngestionJobs abstract base class."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.ingestion_job import IngestionJob
+from rag_core_api.models.ingestion_progress import IngestionProgress
+
+
+class IngestionJobs(ABC):
+    """Abstract base class for running uploads of information pieces outside of the event loop."""
+
+    @abstractmethod
+    async def aupload(self, information_pieces: list[InformationPiece]) -> None:
+        """
+        Upload information pieces and wait for the upload to finish.
+
+        Parameters
+        ----------
+        information_pieces : list[InformationPiece]
+            The information pieces to upload.
+
+        Returns
+        -------
+        None
+        """
+
+    @abstractmethod
+    def aupload_stream(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestionProgress]:
+        """
+        Upload information pieces received as NDJSON, in batches while they arrive.
+
+        Parameters
+        ----------
+        chunks : AsyncIterator[bytes]
+            The chunks of the NDJSON body, one information piece per line.
+
+        Returns
+        -------
+        AsyncIterator[IngestionProgress]
+            The progress after every uploaded batch, followed by a last line once the upload ended.
+        """
+
+    @abstractmethod
+    def submit(self, information_pieces: list[InformationPiece]) -> IngestionJob:
+        """
+        Start the upload of information pieces in the background.
+
+        Parameters
+        ----------
+        information_pieces : list[InformationPiece]
+            The information pieces to upload.
+
+        Returns
+        -------
+        IngestionJob
+            The job of the upload, whose status can be queried with `get_job`.
+        """
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> IngestionJob:
+        """
+        Return the status of an upload job.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+
+        Returns
+        -------
+        IngestionJob
+            The job.
+        """
@@ -27,16 +27,22 @@ from fastapi import (  # noqa: F401
     status,
 )
 
+from fastapi.responses import StreamingResponse
+from rag_core_lib.impl.utils.fast_json import ORJSONRoute
+
 import rag_core_api.impl
 from rag_core_api.apis.rag_api_base import BaseRagApi
+from rag_core_api.models.batch_chat_response_item import BatchChatResponseItem
 from rag_core_api.models.chat_request import ChatRequest
 from rag_core_api.models.chat_response import ChatResponse
 from rag_core_api.models.delete_request import DeleteRequest
 from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.ingestion_job import IngestionJob
+from rag_core_api.models.ingestion_progress import IngestionProgress
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 ns_pkg = rag_core_api.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
@@ -53,6 +59,43 @@ async def _disconnected(request: Request) -> None:
             break
 
 
+@router.post(
+    "/chat/batch",
+    responses={
+        200: {
+            "model": BatchChatResponseItem,
+            "description": "NDJSON stream with one item per chat request, in the order of the requests.",
+        },
+        422: {"description": "Invalid batch."},
+        500: {"description": "Internal Server Error!"},
+    },
+    tags=["rag"],
+    summary="Answer a batch of chat requests",
+    response_model_by_alias=True,
+    response_class=StreamingResponse,
+)
+async def batch_chat(
+    chat_requests: List[ChatRequest] = Body(None, description="The chat requests to answer."),
+) -> StreamingResponse:
+    """
+    Asynchronously answers a batch of chat requests.
+
+    The questions are retrieved for in one batch and answered with bounded concurrency. The answers are
+    streamed as newline-delimited JSON in the order of the requests.
+
+    Parameters
+    ----------
+    chat_requests : List[ChatRequest]
+        The chat requests to answer.
+
+    Returns
+    -------
+    StreamingResponse
+        The NDJSON stream of `BatchChatResponseItem`s.
+    """
+    return await BaseRagApi.subclasses[0]().batch_chat(chat_requests)
+
+
 @router.post(
     "/chat/{session_id}",
     responses={
@@ -112,6 +155,36 @@ async def chat(
     return None
 
 
+@router.get(
+    "/citation_images/{image_id}",
+    responses={
+        200: {"description": "Returns the image in binary form."},
+        404: {"model": str, "description": "Image not found."},
+        500: {"model": str, "description": "Internal Server Error."},
+    },
+    tags=["rag"],
+    summary="Get the image of a cited information piece",
+    response_model_by_alias=True,
+)
+async def get_citation_image(
+    image_id: str = Path(..., description="ID of the image, from the image_id metadata of an information piece."),
+) -> Response:
+    """
+    Asynchronously retrieves the image of a cited image piece.
+
+    Parameters
+    ----------
+    image_id : str
+        The ID of the image, as found in the ``image_id`` metadata of a cited information piece.
+
+    Returns
+    -------
+    Response
+        The image in binary form.
+    """
+    return await BaseRagApi.subclasses[0]().get_citation_image(image_id)
+
+
 @router.post(
     "/evaluate",
     responses={
@@ -132,6 +205,39 @@ async def evaluate() -> None:
     return await BaseRagApi.subclasses[0]().evaluate()
 
 
+@router.get(
+    "/information_pieces",
+    responses={
+        200: {"model": List[InformationPiece], "description": "The information pieces found, in the order of the IDs."},
+        422: {"model": str, "description": "Too many IDs."},
+        500: {"model": str, "description": "Internal Server Error."},
+    },
+    tags=["rag"],
+    summary="Get complete information pieces by ID",
+    response_model_by_alias=True,
+)
+async def get_information_pieces(
+    ids: List[str] = Query(..., description="IDs of the information pieces, from the id metadata of the citations."),
+    tenant_id: str | None = Query(None, description="Only return information pieces of this tenant."),
+) -> List[InformationPiece]:
+    """
+    Asynchronously fetches complete information pieces, e.g. to expand compact citations.
+
+    Parameters
+    ----------
+    ids : List[str]
+        The IDs of the information pieces.
+    tenant_id : str, optional
+        Only return information pieces of this tenant (default None).
+
+    Returns
+    -------
+    List[InformationPiece]
+        The information pieces found, in the order of the IDs.
+    """
+    return await BaseRagApi.subclasses[0]().get_information_pieces(ids, tenant_id)
+
+
 @router.post(
     "/information_pieces/remove",
     responses={
@@ -168,28 +274,111 @@ async def remove_information_piece(
     "/information_pieces/upload",
     responses={
         201: {"description": "The file was successful uploaded."},
+        202: {"model": IngestionJob, "description": "The upload was started in the background."},
         422: {"model": str, "description": "Wrong json format."},
+        429: {"model": str, "description": "Too many background uploads are waiting."},
         500: {"model": str, "description": "Internal Server Error."},
     },
     tags=["rag"],
     summary="Upload information pieces for vectordatabase",
     response_model_by_alias=True,
+    response_model=None,
 )
 async def upload_information_piece(
     information_piece: List[InformationPiece] = Body(None, description=""),
-) -> None:
+    background: bool = Query(
+        False,
+        description=(
+            "Upload in the background and return the job to poll. The job is only known to the replica that accepted "
+            "the upload."
+        ),
+    ),
+) -> Response | None:
     """
     Asynchronously uploads information pieces for vectordatabase.
 
-    This endpoint allows for the upload of information pieces to the vector database.
+    This endpoint allows for the upload of information pieces to the vector database. The upload runs on the
+    ingestion worker pool; with ``background`` the endpoint returns the job immediately.
 
     Parameters
     ----------
     information_piece : List[InformationPiece]
         A list of information pieces to be uploaded (default None).
+    background : bool
+        Whether to return before the upload finished (default False).
 
     Returns
     -------
-    None
+    Response | None
+        The `IngestionJob` with status 202 for background uploads, otherwise None.
+    """
+    return await BaseRagApi.subclasses[0]().upload_information_piece(information_piece, background)
+
+
+@router.post(
+    "/information_pieces/upload/stream",
+    responses={
+        200: {
+            "model": IngestionProgress,
+            "description": "NDJSON stream acknowledging the uploaded information pieces after every batch.",
+        },
+    },
+    tags=["rag"],
+    summary="Upload information pieces streamed as NDJSON",
+    response_model_by_alias=True,
+    response_class=StreamingResponse,
+)
+async def upload_information_piece_stream(request: Request) -> StreamingResponse:
+    """
+    Asynchronously uploads information pieces streamed as NDJSON, one information piece per line.
+
+    The information pieces are embedded and upserted in batches while the body is received.
+
+    Parameters
+    ----------
+    request : Request
+        The request, whose body is read incrementally.
+
+    Returns
+    -------
+    StreamingResponse
+        The NDJSON stream of `IngestionProgress`es; the last line has ``done`` set and contains the error, if any.
+    """
+    return await BaseRagApi.subclasses[0]().upload_information_piece_stream(request)
+
+
+@router.get(
+    "/information_pieces/upload/{job_id}",
+    responses={
+        200: {"model": IngestionJob, "description": "The status of the upload job."},
+        404: {
+            "model": str,
+            "description": "Job not found, e.g. because another replica accepted the upload or the job expired.",
+        },
+    },
+    tags=["rag"],
+    summary="Get the status of a background upload",
+    description=(
+        "The job status is kept in memory of the backend replica that accepted the upload. With more than one replica "
+        "the status must be polled from that replica, e.g. with session affinity, and it is lost when the replica "
+        "restarts."
+    ),
+    response_model_by_alias=True,
+)
+async def get_upload_job(
+    job_id: str = Path(..., description="The ID of the job, as returned by the upload."),
+) -> IngestionJob:
+    """
+    Asynchronously returns the status of a background upload of information pieces.
+
+    Parameters
+    ----------
+    job_id : str
+        The ID of the job.
+
+    Returns
+    -------
+    IngestionJob
+        The job with its status.
     """
-    return await BaseRagApi.subclasses[0]().upload_information_piece(information_piece)
+    return await BaseRagApi.subclasses[0]().get_upload_job(job_id)
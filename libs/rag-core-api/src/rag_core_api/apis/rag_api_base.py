@@ -5,10 +5,14 @@
 
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
 from rag_core_api.models.chat_request import ChatRequest
 from rag_core_api.models.chat_response import ChatResponse
 from rag_core_api.models.delete_request import DeleteRequest
 from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.ingestion_job import IngestionJob
 
 
 class BaseRagApi:
@@ -52,6 +56,42 @@ class BaseRagApi:
             The chat response if the chat task completes successfully, otherwise None.
         """
 
+    async def batch_chat(
+        self,
+        chat_requests: List[ChatRequest],
+    ) -> StreamingResponse:
+        """
+        Asynchronously answers a batch of chat requests.
+
+        Parameters
+        ----------
+        chat_requests : List[ChatRequest]
+            The chat requests to answer.
+
+        Returns
+        -------
+        StreamingResponse
+            The NDJSON stream with one item per chat request, in the order of the requests.
+        """
+
+    async def get_citation_image(
+        self,
+        image_id: str,
+    ) -> Response:
+        """
+        Asynchronously retrieves the image of a cited image piece.
+
+        Parameters
+        ----------
+        image_id : str
+            The ID of the image, as found in the ``image_id`` metadata of a cited information piece.
+
+        Returns
+        -------
+        Response
+            The image in binary form.
+        """
+
     async def evaluate(
         self,
     ) -> None:
@@ -63,6 +103,27 @@ class BaseRagApi:
         None
         """
 
+    async def get_information_pieces(
+        self,
+        ids: List[str],
+        tenant_id: str | None,
+    ) -> List[InformationPiece]:
+        """
+        Asynchronously fetches complete information pieces, e.g. to expand compact citations.
+
+        Parameters
+        ----------
+        ids : List[str]
+            The IDs of the information pieces.
+        tenant_id : str | None
+            Only return information pieces of this tenant.
+
+        Returns
+        -------
+        List[InformationPiece]
+            The information pieces found, in the order of the IDs.
+        """
+
     async def remove_information_piece(
         self,
         delete_request: DeleteRequest,
@@ -85,7 +146,8 @@ class BaseRagApi:
     async def upload_information_piece(
         self,
         information_piece: List[InformationPiece],
-    ) -> None:
+        background: bool = False,
+    ) -> Response | None:
         """
         Asynchronously uploads information pieces for vectordatabase.
 
@@ -95,8 +157,47 @@ class BaseRagApi:
         ----------
         information_piece : List[InformationPiece]
             A list of information pieces to be uploaded (default None).
+        background : bool
+            Whether to return before the upload finished (default False).
 
         Returns
         -------
-        None
+        Response | None
+            The `IngestionJob` with status 202 for background uploads, otherwise None.
+        """
+
+    async def upload_information_piece_stream(
+        self,
+        request: Request,
+    ) -> StreamingResponse:
+        """
+        Asynchronously uploads information pieces streamed as NDJSON, one information piece per line.
+
+        Parameters
+        ----------
+        request : Request
+            The request, whose body is read incrementally.
+
+        Returns
+        -------
+        StreamingResponse
+            The NDJSON stream of `IngestionProgress`es.
+        """
+
+    async def get_upload_job(
+        self,
+        job_id: str,
+    ) -> IngestionJob:
+        """
+        Asynchronously returns the status of a background upload of information pieces.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+
+        Returns
+        -------
+        IngestionJob
+            The job with its status.
         """
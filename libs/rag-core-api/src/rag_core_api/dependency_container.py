@@ -1,10 +1,14 @@
 """Module containing the dependency injection container for managing application dependencies."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import qdrant_client
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import (  # noqa: WOT001
+    Callable,
     Configuration,
     List,
+    Object,
     Selector,
     Singleton,
 )
@@ -22,10 +26,18 @@ from rag_core_api.impl.answer_generation_chains.rephrasing_chain import Rephrasi
 from rag_core_api.impl.answer_generation_chains.language_detection_chain import (
     LanguageDetectionChain,
 )
+from rag_core_api.impl.api_endpoints.default_batch_chat import DefaultBatchChat
 from rag_core_api.impl.api_endpoints.default_chat import DefaultChat
+from rag_core_api.impl.api_endpoints.default_citation_image_retriever import (
+    DefaultCitationImageRetriever,
+)
+from rag_core_api.impl.api_endpoints.default_information_pieces_fetcher import (
+    DefaultInformationPiecesFetcher,
+)
 from rag_core_api.impl.api_endpoints.default_information_pieces_remover import (
     DefaultInformationPiecesRemover,
 )
+from rag_core_api.impl.api_endpoints.default_ingestion_jobs import DefaultIngestionJobs
 from rag_core_api.impl.api_endpoints.default_information_pieces_uploader import (
     DefaultInformationPiecesUploader,
 )
@@ -36,22 +48,44 @@ from rag_core_api.impl.embeddings.langchain_community_embedder import (
 
 from rag_core_api.impl.embeddings.stackit_embedder import StackitEmbedder
 from rag_core_api.impl.evaluator.langfuse_ragas_evaluator import LangfuseRagasEvaluator
+from rag_core_api.impl.file_services.citation_image_store import CitationImageStore
 from rag_core_api.impl.graph.chat_graph import DefaultChatGraph
 from rag_core_api.impl.reranking.flashrank_reranker import FlashrankReranker
+from rag_core_api.impl.message_classification.rule_based_message_classifier import (
+    RuleBasedMessageClassifier,
+)
 from rag_core_api.impl.retriever.composite_retriever import CompositeRetriever
 from rag_core_api.impl.retriever.retriever_quark import RetrieverQuark
+from rag_core_api.impl.retriever.session_context_retriever import (
+    SessionContextRetriever,
+)
+from rag_core_api.impl.settings.batch_chat_settings import BatchChatSettings
+from rag_core_api.impl.settings.chain_llm_settings import ChainLlmSettings
+from rag_core_api.impl.settings.chat_deadline_settings import ChatDeadlineSettings
+from rag_core_api.impl.settings.coarse_to_fine_settings import CoarseToFineSettings
+from rag_core_api.impl.settings.diversity_settings import DiversitySettings
 from rag_core_api.impl.settings.chat_history_settings import ChatHistorySettings
+from rag_core_api.impl.settings.citation_settings import CitationSettings
+from rag_core_api.impl.settings.degraded_mode_settings import DegradedModeSettings
 from rag_core_api.impl.settings.embedder_class_type_settings import (
     EmbedderClassTypeSettings,
 )
 from rag_core_api.impl.settings.error_messages import ErrorMessages
+from rag_core_api.impl.settings.image_storage_settings import ImageStorageSettings
+from rag_core_api.impl.settings.ingestion_settings import IngestionSettings
 from rag_core_api.impl.settings.ollama_embedder_settings import OllamaEmbedderSettings
 from rag_core_api.impl.settings.ragas_settings import RagasSettings
 from rag_core_api.impl.settings.reranker_settings import RerankerSettings
+from rag_core_api.impl.settings.qdrant_read_pool_settings import QdrantReadPoolSettings
 from rag_core_api.impl.settings.retriever_settings import RetrieverSettings
+from rag_core_api.impl.settings.session_context_settings import (
+    SessionContextSettings,
+)
+from rag_core_api.impl.settings.small_talk_settings import SmallTalkSettings
 from rag_core_api.impl.settings.sparse_embedder_settings import SparseEmbedderSettings
 from rag_core_api.impl.settings.stackit_embedder_settings import StackitEmbedderSettings
 from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
+from rag_core_api.impl.vector_databases.qdrant_client_pool import QdrantClientPool
 from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
 from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
 from rag_core_api.prompt_templates.answer_generation_prompt import (
@@ -64,12 +98,22 @@ from rag_core_api.prompt_templates.language_detection_prompt import (
     LANGUAGE_DETECTION_PROMPT,
 )
 from rag_core_lib.impl.data_types.content_type import ContentType
+from rag_core_lib.impl.embeddings.fastembed_embedder import FastEmbedEmbedder
+from rag_core_lib.impl.embeddings.reduced_embedder import (
+    embedding_reducer_from_settings,
+    reduced_embedding_model,
+    with_embedding_reduction,
+)
+from rag_core_lib.impl.file_services.s3_service import S3Service
 from rag_core_lib.impl.langfuse_manager.langfuse_manager import LangfuseManager
 from rag_core_lib.impl.llms.llm_factory import chat_model_provider
+from rag_core_lib.impl.settings.embedding_reduction_settings import EmbeddingReductionSettings
+from rag_core_lib.impl.settings.fastembed_embedder_settings import FastEmbedEmbedderSettings
 from rag_core_lib.impl.settings.langfuse_settings import LangfuseSettings
 from rag_core_lib.impl.settings.ollama_llm_settings import OllamaSettings
 from rag_core_lib.impl.settings.rag_class_types_settings import RAGClassTypeSettings
 from rag_core_lib.impl.settings.retry_decorator_settings import RetryDecoratorSettings
+from rag_core_lib.impl.settings.s3_settings import S3Settings
 from rag_core_lib.impl.settings.stackit_vllm_settings import StackitVllmSettings
 from rag_core_lib.impl.tracers.langfuse_traced_runnable import LangfuseTracedRunnable
 from rag_core_lib.impl.utils.async_threadsafe_semaphore import AsyncThreadsafeSemaphore
@@ -83,7 +127,10 @@ class DependencyContainer(DeclarativeContainer):
 
     # Settings
     vector_database_settings = VectorDatabaseSettings()
+    qdrant_read_pool_settings = QdrantReadPoolSettings()
     retriever_settings = RetrieverSettings()
+    diversity_settings = DiversitySettings()
+    coarse_to_fine_settings = CoarseToFineSettings()
     ollama_settings = OllamaSettings()
     ollama_embedder_settings = OllamaEmbedderSettings()
     langfuse_settings = LangfuseSettings()
@@ -94,21 +141,46 @@ class DependencyContainer(DeclarativeContainer):
     reranker_settings = RerankerSettings()
     embedder_class_type_settings = EmbedderClassTypeSettings()
     stackit_embedder_settings = StackitEmbedderSettings()
+    fastembed_embedder_settings = FastEmbedEmbedderSettings()
+    embedding_reduction_settings = EmbeddingReductionSettings()
     chat_history_settings = ChatHistorySettings()
     sparse_embedder_settings = SparseEmbedderSettings()
     retry_decorator_settings = RetryDecoratorSettings()
+    session_context_settings = SessionContextSettings()
+    chain_llm_settings = ChainLlmSettings()
+    chat_deadline_settings = ChatDeadlineSettings()
+    degraded_mode_settings = DegradedModeSettings()
+    small_talk_settings = SmallTalkSettings()
+    batch_chat_settings = BatchChatSettings()
+    image_storage_settings = ImageStorageSettings()
+    citation_settings = CitationSettings()
+    ingestion_settings = IngestionSettings()
+    # Instantiate lazily, S3 env vars are only required if images are stored in the object storage.
+    s3_settings = Singleton(S3Settings)
     chat_history_config.from_dict(chat_history_settings.model_dump())
 
     class_selector_config.from_dict(rag_class_type_settings.model_dump() | embedder_class_type_settings.model_dump())
 
-    embedder = Selector(
+    base_embedder = Selector(
         class_selector_config.embedder_type,
         ollama=Singleton(
             LangchainCommunityEmbedder,
             embedder=Singleton(OllamaEmbeddings, **ollama_embedder_settings.model_dump()),
         ),
         stackit=Singleton(StackitEmbedder, stackit_embedder_settings, retry_decorator_settings),
+        fastembed=Singleton(FastEmbedEmbedder, fastembed_embedder_settings),
+    )
+    base_embedding_model = Selector(
+        class_selector_config.embedder_type,
+        ollama=Object(ollama_embedder_settings.model),
+        stackit=Object(stackit_embedder_settings.model),
+        fastembed=Object(fastembed_embedder_settings.model),
+        fake=Object(None),
     )
+    # Documents and queries are embedded by the same embedder, so both are reduced the same way.
+    embedding_reducer = Singleton(embedding_reducer_from_settings, embedding_reduction_settings)
+    embedder = Singleton(with_embedding_reduction, base_embedder, embedding_reducer)
+    embedding_model = Callable(reduced_embedding_model, base_embedding_model, embedding_reducer)
 
     sparse_embedder = Singleton(FastEmbedSparse, **sparse_embedder_settings.model_dump())
 
@@ -127,12 +199,17 @@ class DependencyContainer(DeclarativeContainer):
         retrieval_mode=vector_database_settings.retrieval_mode,
     )
 
+    vectordb_read_pool = Singleton(QdrantClientPool, qdrant_read_pool_settings)
+
     vector_database = Singleton(
         QdrantDatabase,
         settings=vector_database_settings,
         embedder=embedder,
         sparse_embedder=sparse_embedder,
         vectorstore=vectorstore,
+        client_pool=vectordb_read_pool,
+        embedding_model=embedding_model,
+        sparse_embedding_model=sparse_embedder_settings.model_name,
     )
 
     flashrank_reranker = Singleton(
@@ -142,7 +219,24 @@ class DependencyContainer(DeclarativeContainer):
     )
     reranker = Singleton(FlashrankReranker, flashrank_reranker)
 
-    information_pieces_uploader = Singleton(DefaultInformationPiecesUploader, vector_database)
+    file_service = Singleton(S3Service, s3_settings=s3_settings)
+    citation_image_store = (
+        Singleton(CitationImageStore, file_service, image_storage_settings)
+        if image_storage_settings.enabled
+        else Object(None)
+    )
+
+    information_pieces_uploader = Singleton(
+        DefaultInformationPiecesUploader, vector_database, citation_image_store=citation_image_store
+    )
+    ingestion_executor = Singleton(
+        ThreadPoolExecutor, max_workers=ingestion_settings.max_workers, thread_name_prefix="ingestion"
+    )
+    ingestion_jobs = Singleton(
+        DefaultIngestionJobs, information_pieces_uploader, ingestion_executor, ingestion_settings
+    )
+    citation_image_retriever = Singleton(DefaultCitationImageRetriever, citation_image_store)
+    information_pieces_fetcher = Singleton(DefaultInformationPiecesFetcher, vector_database, citation_settings)
 
     information_pieces_remover = Singleton(DefaultInformationPiecesRemover, vector_database)
 
@@ -152,6 +246,8 @@ class DependencyContainer(DeclarativeContainer):
         ContentType.IMAGE,
         retriever_settings.image_k_documents,
         retriever_settings.image_threshold,
+        search_params=retriever_settings.search_params(ContentType.IMAGE.value),
+        payload_projection=retriever_settings.payload_projection(ContentType.IMAGE.value),
     )
     table_retriever = Singleton(
         RetrieverQuark,
@@ -159,6 +255,8 @@ class DependencyContainer(DeclarativeContainer):
         ContentType.TABLE,
         retriever_settings.table_k_documents,
         retriever_settings.table_threshold,
+        search_params=retriever_settings.search_params(ContentType.TABLE.value),
+        payload_projection=retriever_settings.payload_projection(ContentType.TABLE.value),
     )
     text_retriever = Singleton(
         RetrieverQuark,
@@ -166,6 +264,8 @@ class DependencyContainer(DeclarativeContainer):
         ContentType.TEXT,
         retriever_settings.k_documents,
         retriever_settings.threshold,
+        search_params=retriever_settings.search_params(ContentType.TEXT.value),
+        payload_projection=retriever_settings.payload_projection(ContentType.TEXT.value),
     )
     summary_retriever = Singleton(
         RetrieverQuark,
@@ -173,24 +273,71 @@ class DependencyContainer(DeclarativeContainer):
         ContentType.SUMMARY,
         retriever_settings.summary_k_documents,
         retriever_settings.summary_threshold,
+        search_params=retriever_settings.search_params(ContentType.SUMMARY.value),
+        payload_projection=retriever_settings.payload_projection(ContentType.SUMMARY.value),
     )
 
     composed_retriever = Singleton(
         CompositeRetriever,
         List(image_retriever, table_retriever, text_retriever, summary_retriever),
+        vector_database,
         reranker,
         reranker_settings.enabled,
         retriever_settings.total_k_documents,
         reranker_settings.k_documents,
+        deadline_settings=chat_deadline_settings,
+        min_documents_per_type={
+            ContentType.TEXT.value: retriever_settings.text_min_documents,
+            ContentType.TABLE.value: retriever_settings.table_min_documents,
+            ContentType.IMAGE.value: retriever_settings.image_min_documents,
+        },
+        diversity_settings=diversity_settings,
+        coarse_to_fine_settings=coarse_to_fine_settings,
+    )
+
+    session_context_retriever = Singleton(
+        SessionContextRetriever,
+        composed_retriever,
+        embedder,
+        reranker,
+        reranker_settings.enabled,
+        session_context_settings,
     )
 
     information_piece_mapper = Singleton(InformationPieceMapper)
 
+    message_classifier = Singleton(RuleBasedMessageClassifier, small_talk_settings.max_words)
+
     large_language_model = Selector(
         class_selector_config.llm_type,
         ollama=Singleton(chat_model_provider, ollama_settings, "ollama"),
         stackit=Singleton(chat_model_provider, stackit_vllm_settings, "openai"),
     )
+    # The auxiliary chains share the answer generation model unless a dedicated (smaller) model is configured.
+    rephrasing_llm = (
+        Selector(
+            class_selector_config.llm_type,
+            ollama=Singleton(chat_model_provider, ollama_settings, "ollama", chain_llm_settings.rephrasing_model),
+            stackit=Singleton(
+                chat_model_provider, stackit_vllm_settings, "openai", chain_llm_settings.rephrasing_model
+            ),
+        )
+        if chain_llm_settings.rephrasing_model
+        else large_language_model
+    )
+    language_detection_llm = (
+        Selector(
+            class_selector_config.llm_type,
+            ollama=Singleton(
+                chat_model_provider, ollama_settings, "ollama", chain_llm_settings.language_detection_model
+            ),
+            stackit=Singleton(
+                chat_model_provider, stackit_vllm_settings, "openai", chain_llm_settings.language_detection_model
+            ),
+        )
+        if chain_llm_settings.language_detection_model
+        else large_language_model
+    )
 
     prompt = ANSWER_GENERATION_PROMPT
     rephrasing_prompt = QUESTION_REPHRASING_PROMPT
@@ -212,6 +359,10 @@ class DependencyContainer(DeclarativeContainer):
             LanguageDetectionChain.__name__: language_detection_prompt,
         },
         llm=large_language_model,
+        chain_llms={
+            RephrasingChain.__name__: rephrasing_llm,
+            LanguageDetectionChain.__name__: language_detection_llm,
+        },
     )
 
     answer_generation_chain = Singleton(
@@ -231,13 +382,17 @@ class DependencyContainer(DeclarativeContainer):
 
     chat_graph = Singleton(
         DefaultChatGraph,
-        composed_retriever=composed_retriever,
+        composed_retriever=session_context_retriever,
         rephrasing_chain=rephrasing_chain,
         language_detection_chain=language_detection_chain,
         mapper=information_piece_mapper,
         answer_generation_chain=answer_generation_chain,
         error_messages=error_messages,
         chat_history_settings=chat_history_settings,
+        degraded_mode_settings=degraded_mode_settings,
+        message_classifier=message_classifier,
+        small_talk_settings=small_talk_settings,
+        citation_settings=citation_settings,
     )
 
     # wrap graph in tracer
@@ -247,7 +402,10 @@ class DependencyContainer(DeclarativeContainer):
         settings=langfuse_settings,
     )
 
-    chat_endpoint = Singleton(DefaultChat, traced_chat_graph)
+    chat_endpoint = Singleton(DefaultChat, traced_chat_graph, chat_deadline_settings)
+    batch_chat_endpoint = Singleton(
+        DefaultBatchChat, traced_chat_graph, composed_retriever, batch_chat_settings, chat_deadline_settings
+    )
 
     ragas_llm = (
         Singleton(
@@ -0,0 +1,154 @@
+"""Module to define the DefaultBatchChat class."""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
+
+from rag_core_api.api_endpoints.batch_chat import BatchChat
+from rag_core_api.impl.retriever.composite_retriever import CompositeRetriever
+from rag_core_api.impl.settings.batch_chat_settings import BatchChatSettings
+from rag_core_api.impl.settings.chat_deadline_settings import ChatDeadlineSettings
+from rag_core_api.models.batch_chat_response_item import BatchChatResponseItem
+from rag_core_api.models.chat_request import ChatRequest
+from rag_core_lib.impl.utils.deadline import (
+    DEADLINE_METADATA_KEY,
+    deadline_in,
+    deadline_scope,
+)
+from rag_core_lib.tracers.traced_runnable import TracedRunnable
+
+logger = logging.getLogger(__name__)
+
+
+class DefaultBatchChat(BatchChat):
+    """DefaultBatchChat answers a batch of chat requests with one batched search and bounded concurrency.
+
+    The questions without chat history are searched for in one batch (one embedding call, one batched vector
+    database request) before the chat graph runs. The graph then post-processes the prefetched search hits
+    instead of searching again, so reranking and the deadline of every request apply as for a single chat
+    request. Questions with history are rephrased first, and scoped questions or questions of a tenant search a
+    different part of the collection, so they are retrieved by the graph itself.
+    """
+
+    def __init__(
+        self,
+        chat_graph: TracedRunnable,
+        composed_retriever: CompositeRetriever,
+        settings: BatchChatSettings,
+        deadline_settings: Optional[ChatDeadlineSettings] = None,
+    ):
+        """
+        Initialize the DefaultBatchChat instance.
+
+        Parameters
+        ----------
+        chat_graph : TracedRunnable
+            The traced graph answering a single chat request.
+        composed_retriever : CompositeRetriever
+            The retriever used by the chat graph, used here for the batched search.
+        settings : BatchChatSettings
+            The settings of the batch chat endpoint.
+        deadline_settings : Optional[ChatDeadlineSettings]
+            The settings of the latency budget of every chat request of the batch (default None, meaning no
+            deadline). The budget of a request starts when its turn comes, not when the batch is received.
+        """
+        self._chat_graph = chat_graph
+        self._composed_retriever = composed_retriever
+        self._settings = settings
+        self._deadline_settings = deadline_settings
+
+    @classmethod
+    def _is_prefetchable(cls, chat_request: ChatRequest) -> bool:
+        has_history = bool(chat_request.history and chat_request.history.messages)
+        return bool(chat_request.message.strip()) and not has_history and not cls._is_filtered(chat_request)
+
+    @staticmethod
+    def _is_filtered(chat_request: ChatRequest) -> bool:
+        return bool(chat_request.scope or chat_request.tenant_id)
+
+    def abatch_chat(self, chat_requests: list[ChatRequest]) -> AsyncIterator[BatchChatResponseItem]:
+        """
+        Answer several chat requests at once.
+
+        Parameters
+        ----------
+        chat_requests : list[ChatRequest]
+            The chat requests to answer.
+
+        Returns
+        -------
+        AsyncIterator[BatchChatResponseItem]
+            One item per chat request in the order of the requests. Each item is produced as soon as it and all
+            items before it are answered.
+
+        Raises
+        ------
+        ValueError
+            If the batch is empty or larger than the configured maximum.
+        """
+        if not chat_requests:
+            raise ValueError("The batch must contain at least one chat request.")
+        if len(chat_requests) > self._settings.max_batch_size:
+            raise ValueError(
+                "The batch contains %d chat requests, at most %d are allowed."
+                % (len(chat_requests), self._settings.max_batch_size)
+            )
+        return self._astream(chat_requests)
+
+    async def _astream(self, chat_requests: list[ChatRequest]) -> AsyncIterator[BatchChatResponseItem]:
+        prefetched = await self._aprefetch(chat_requests)
+        semaphore = asyncio.Semaphore(self._settings.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._achat(index, chat_request, prefetched, semaphore))
+            for index, chat_request in enumerate(chat_requests)
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _aprefetch(self, chat_requests: list[ChatRequest]) -> dict[str, list[Document]]:
+        questions = list(dict.fromkeys(x.message for x in chat_requests if self._is_prefetchable(x)))
+        if not questions:
+            return {}
+        try:
+            documents = await self._composed_retriever.abatch_search(questions)
+        except Exception:
+            logger.exception("Batched search failed; retrieving per question instead.")
+            return {}
+        return dict(zip(questions, documents))
+
+    async def _achat(
+        self,
+        index: int,
+        chat_request: ChatRequest,
+        prefetched: dict[str, list[Document]],
+        semaphore: asyncio.Semaphore,
+    ) -> BatchChatResponseItem:
+        async with semaphore:
+            deadline = deadline_in(self._deadline_settings.timeout_seconds) if self._deadline_settings else None
+            config = RunnableConfig(
+                tags=[],
+                callbacks=None,
+                recursion_limit=25,
+                metadata={DEADLINE_METADATA_KEY: deadline},
+            )
+            try:
+                # The prefetched documents were searched without scope and tenant.
+                with (
+                    deadline_scope(deadline),
+                    CompositeRetriever.prefetched({} if self._is_filtered(chat_request) else prefetched),
+                ):
+                    response = await self._chat_graph.ainvoke(chat_request, config)
+            except HTTPException as e:
+                return BatchChatResponseItem(index=index, error=str(e.detail))
+            except Exception as e:
+                logger.exception("Error while answering chat request %d of the batch.", index)
+                return BatchChatResponseItem(index=index, error=str(e))
+        return BatchChatResponseItem(index=index, response=response)
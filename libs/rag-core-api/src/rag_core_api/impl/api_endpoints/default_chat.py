@@ -1,17 +1,25 @@
 """Module to define the DefaultChat class."""
 
+from typing import Optional
+
 from langchain_core.runnables import RunnableConfig
 
 from rag_core_api.api_endpoints.chat import Chat
+from rag_core_api.impl.settings.chat_deadline_settings import ChatDeadlineSettings
 from rag_core_api.models.chat_request import ChatRequest
 from rag_core_api.models.chat_response import ChatResponse
+from rag_core_lib.impl.utils.deadline import (
+    DEADLINE_METADATA_KEY,
+    deadline_in,
+    deadline_scope,
+)
 from rag_core_lib.tracers.traced_runnable import TracedRunnable
 
 
 class DefaultChat(Chat):
     """DefaultChat is a class that handles chat interactions using a traced graph."""
 
-    def __init__(self, chat_graph: TracedRunnable):
+    def __init__(self, chat_graph: TracedRunnable, deadline_settings: Optional[ChatDeadlineSettings] = None):
         """
         Initialize the DefaultChat instance.
 
@@ -19,8 +27,11 @@ class DefaultChat(Chat):
         ----------
         chat_graph : TracedGraph
             The traced graph representing the chat structure.
+        deadline_settings : Optional[ChatDeadlineSettings]
+            The settings of the per-request latency budget (default None, meaning no deadline).
         """
         self._chat_graph = chat_graph
+        self._deadline_settings = deadline_settings
 
     async def achat(
         self,
@@ -42,11 +53,13 @@ class DefaultChat(Chat):
         ChatResponse
             The response object containing the chat results.
         """
+        deadline = deadline_in(self._deadline_settings.timeout_seconds) if self._deadline_settings else None
         config = RunnableConfig(
             tags=[],
             callbacks=None,
             recursion_limit=25,
-            metadata={"session_id": session_id},
+            metadata={"session_id": session_id, DEADLINE_METADATA_KEY: deadline},
         )
 
-        return await self._chat_graph.ainvoke(chat_request, config)
+        with deadline_scope(deadline):
+            return await self._chat_graph.ainvoke(chat_request, config)
@@ -0,0 +1,54 @@
+"""Module for the DefaultCitationImageRetriever class."""
+
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+
+from rag_core_api.api_endpoints.citation_image_retriever import CitationImageRetriever
+from rag_core_api.impl.file_services.citation_image_store import CitationImageStore
+
+
+class DefaultCitationImageRetriever(CitationImageRetriever):
+    """Retrieves the images of cited image pieces from the citation image store."""
+
+    # Images are content addressed, so the content of an ID never changes.
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(self, citation_image_store: Optional[CitationImageStore]):
+        """
+        Initialize the DefaultCitationImageRetriever.
+
+        Parameters
+        ----------
+        citation_image_store : Optional[CitationImageStore]
+            The store of the images, None if images are not stored in the object storage.
+        """
+        self._citation_image_store = citation_image_store
+
+    async def aget_citation_image(self, image_id: str) -> Response:
+        """
+        Get the image with the given ID asynchronously.
+
+        Parameters
+        ----------
+        image_id : str
+            The ID of the image, as found in the ``image_id`` metadata of a cited information piece.
+
+        Returns
+        -------
+        Response
+            The image in binary form wrapped in a FastAPI Response object.
+
+        Raises
+        ------
+        HTTPException
+            If the image store is disabled or the image is not found.
+        """
+        if not self._citation_image_store:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image storage is disabled.")
+        try:
+            data, media_type = await asyncio.to_thread(self._citation_image_store.load, image_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        return Response(data, media_type=media_type, headers={"Cache-Control": self.CACHE_CONTROL})
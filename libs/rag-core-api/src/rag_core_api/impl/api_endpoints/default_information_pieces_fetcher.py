@@ -0,0 +1,63 @@
+"""Module for the DefaultInformationPiecesFetcher class."""
+
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from rag_core_api.api_endpoints.information_pieces_fetcher import InformationPiecesFetcher
+from rag_core_api.impl.settings.citation_settings import CitationSettings
+from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.vector_databases.vector_database import VectorDatabase
+
+
+class DefaultInformationPiecesFetcher(InformationPiecesFetcher):
+    """Fetches complete information pieces from the vector database, e.g. to expand a compact citation."""
+
+    def __init__(self, vector_database: VectorDatabase, citation_settings: CitationSettings):
+        """
+        Initialize the DefaultInformationPiecesFetcher.
+
+        Parameters
+        ----------
+        vector_database : VectorDatabase
+            The vector database the information pieces are stored in.
+        citation_settings : CitationSettings
+            The settings limiting the number of IDs per request.
+        """
+        self._vector_database = vector_database
+        self._citation_settings = citation_settings
+
+    async def afetch_information_pieces(
+        self, ids: list[str], tenant_id: Optional[str] = None
+    ) -> list[InformationPiece]:
+        """
+        Fetch the information pieces with the given IDs asynchronously.
+
+        Parameters
+        ----------
+        ids : list[str]
+            The IDs of the information pieces, as found in the ``id`` metadata of the citations.
+        tenant_id : Optional[str]
+            Only return information pieces of this tenant. The tenant is routed like for the search, so with
+            shard-key tenancy a request without tenant only sees the default tenant (default None).
+
+        Returns
+        -------
+        list[InformationPiece]
+            The information pieces found, in the order of the IDs. Unknown IDs are ignored.
+
+        Raises
+        ------
+        HTTPException
+            If more IDs than allowed are requested.
+        """
+        if len(ids) > self._citation_settings.max_fetch_ids:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"At most {self._citation_settings.max_fetch_ids} information pieces can be fetched at once.",
+            )
+        filter_kwargs = {VectorDatabase.TENANT_KEY: tenant_id} if tenant_id else {}
+        documents = await asyncio.to_thread(self._vector_database.get_documents_by_ids, ids, filter_kwargs)
+        return [InformationPieceMapper.langchain_document2information_piece(document) for document in documents]
@@ -1,10 +1,13 @@
 """Module containing the DefaultInformationPiecesUploader class."""
 
+from typing import Optional
+
 from fastapi import HTTPException, status
 
 from rag_core_api.api_endpoints.information_piece_uploader import (
     InformationPiecesUploader,
 )
+from rag_core_api.impl.file_services.citation_image_store import CitationImageStore
 from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
 from rag_core_api.models.information_piece import InformationPiece
 from rag_core_api.vector_databases.vector_database import VectorDatabase
@@ -13,15 +16,18 @@ from rag_core_api.vector_databases.vector_database import VectorDatabase
 class DefaultInformationPiecesUploader(InformationPiecesUploader):
     """DefaultInformationPiecesUploader is responsible for uploading information pieces to a vector database."""
 
-    def __init__(self, vector_database: VectorDatabase):
+    def __init__(self, vector_database: VectorDatabase, citation_image_store: Optional[CitationImageStore] = None):
         """Initialize the DefaultInformationPiecesUploader with a vector database.
 
         Parameters
         ----------
         vector_database : VectorDatabase
             An instance of the VectorDatabase class used to store and manage vectors.
+        citation_image_store : Optional[CitationImageStore]
+            The store images are moved to before the upload (default None, meaning images stay in the payload).
         """
         self._vector_database = vector_database
+        self._citation_image_store = citation_image_store
 
     def upload_information_piece(self, information_piece: list[InformationPiece]) -> None:
         """
@@ -46,6 +52,8 @@ class DefaultInformationPiecesUploader(InformationPiecesUploader):
             InformationPieceMapper.information_piece2langchain_document(document) for document in information_piece
         ]
         try:
+            if self._citation_image_store:
+                langchain_documents = self._citation_image_store.offload(langchain_documents)
             self._vector_database.upload(langchain_documents)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
@@ -0,0 +1,264 @@
+"""Module containing the DefaultIngestionJobs class."""
+
+import asyncio
+import logging
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from rag_core_api.api_endpoints.information_piece_uploader import InformationPiecesUploader
+from rag_core_api.api_endpoints.ingestion_jobs import IngestionJobs
+from rag_core_api.impl.settings.ingestion_settings import IngestionSettings
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.ingestion_job import IngestionJob
+from rag_core_api.models.ingestion_job_status import IngestionJobStatus
+from rag_core_api.models.ingestion_progress import IngestionProgress
+from rag_core_lib.impl.utils import fast_json
+from rag_core_lib.impl.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class DefaultIngestionJobs(IngestionJobs):
+    """Runs uploads of information pieces on a worker pool, so embedding and upserting do not block the event loop.
+
+    The status of background jobs is kept in memory of the worker that accepted the job.
+    """
+
+    def __init__(self, uploader: InformationPiecesUploader, executor: Executor, settings: IngestionSettings):
+        """
+        Initialize the DefaultIngestionJobs.
+
+        Parameters
+        ----------
+        uploader : InformationPiecesUploader
+            The uploader embedding and upserting the information pieces.
+        executor : Executor
+            The worker pool the uploads run on. Its size limits the number of concurrent uploads.
+        settings : IngestionSettings
+            The settings of the ingestion.
+        """
+        self._uploader = uploader
+        self._executor = executor
+        self._settings = settings
+        self._jobs: TTLCache[str, IngestionJob] = TTLCache(settings.max_tracked_jobs, settings.job_ttl_seconds)
+        self._pending_jobs = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_line(line: bytes, line_number: int) -> InformationPiece:
+        try:
+            return InformationPiece.model_validate(fast_json.loads(line))
+        except ValueError as e:
+            raise ValueError(f"Line {line_number} is not a valid information piece: {e}") from e
+
+    @staticmethod
+    async def _adrain(in_flight: deque[tuple[asyncio.Future, int]], max_pending: int) -> AsyncIterator[int]:
+        # Awaits the batches that are done and the oldest ones while more than max_pending are in flight.
+        while in_flight and (len(in_flight) > max_pending or in_flight[0][0].done()):
+            future, count = in_flight.popleft()
+            await future
+            yield count
+
+    @staticmethod
+    async def _adrain_failed(in_flight: deque[tuple[asyncio.Future, int]]) -> int:
+        # Batches uploaded concurrently with the failed one still count.
+        uploaded = 0
+        for future, count in in_flight:
+            try:
+                await future
+                uploaded += count
+            except Exception:
+                logger.debug("Batch of failed streaming upload failed as well.", exc_info=True)
+        return uploaded
+
+    async def aupload(self, information_pieces: list[InformationPiece]) -> None:
+        """
+        Upload information pieces on the worker pool and wait for the upload to finish.
+
+        Parameters
+        ----------
+        information_pieces : list[InformationPiece]
+            The information pieces to upload.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        HTTPException
+            If the upload fails, see `InformationPiecesUploader.upload_information_piece`.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._uploader.upload_information_piece, information_pieces
+        )
+
+    async def aupload_stream(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestionProgress]:
+        """
+        Upload information pieces received as NDJSON, in batches while they arrive.
+
+        Up to ``stream_max_in_flight_batches`` batches are uploaded on the worker pool while the next batch is
+        received, so memory use does not depend on the size of the upload. Batches are acknowledged in order.
+
+        Parameters
+        ----------
+        chunks : AsyncIterator[bytes]
+            The chunks of the NDJSON body, one information piece per line.
+
+        Yields
+        ------
+        IngestionProgress
+            The progress after every uploaded batch, followed by a last line with ``done`` set once the upload
+            ended. If the upload failed, the last line contains the error; the information pieces of the batches
+            before are uploaded.
+        """
+        in_flight: deque[tuple[asyncio.Future, int]] = deque()
+        uploaded = 0
+        error = None
+        try:
+            async for count in self._aupload_batches(chunks, in_flight):
+                uploaded += count
+                yield IngestionProgress(uploaded_piece_count=uploaded, done=False)
+        except HTTPException as e:
+            error = str(e.detail)
+        except ValueError as e:
+            error = str(e)
+        except Exception as e:
+            logger.exception("Streaming upload failed.")
+            error = str(e)
+
+        if not error:
+            yield IngestionProgress(uploaded_piece_count=uploaded, done=True)
+            return
+        uploaded += await self._adrain_failed(in_flight)
+        logger.error("Streaming upload failed after %d information pieces: %s", uploaded, error)
+        yield IngestionProgress(uploaded_piece_count=uploaded, done=True, error=error)
+
+    def submit(self, information_pieces: list[InformationPiece]) -> IngestionJob:
+        """
+        Start the upload of information pieces on the worker pool.
+
+        Parameters
+        ----------
+        information_pieces : list[InformationPiece]
+            The information pieces to upload.
+
+        Returns
+        -------
+        IngestionJob
+            The pending job.
+
+        Raises
+        ------
+        HTTPException
+            If too many jobs are waiting for a worker, raises an HTTP 429 Too Many Requests error.
+        """
+        with self._lock:
+            if self._pending_jobs >= self._settings.max_pending_jobs:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many uploads are waiting to be processed. Retry later.",
+                )
+            self._pending_jobs += 1
+        job = IngestionJob(
+            job_id=uuid.uuid4().hex,
+            status=IngestionJobStatus.PENDING,
+            information_piece_count=len(information_pieces),
+        )
+        self._jobs.put(job.job_id, job)
+        self._executor.submit(self._run, job, information_pieces)
+        return job
+
+    def get_job(self, job_id: str) -> IngestionJob:
+        """
+        Return the status of an upload job.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+
+        Returns
+        -------
+        IngestionJob
+            The job.
+
+        Raises
+        ------
+        HTTPException
+            If the job is unknown or expired, raises an HTTP 404 Not Found error.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with id '{job_id}' not found.")
+        return job
+
+    async def _parse_ndjson(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[InformationPiece]:
+        # The parts of the incomplete last line are joined once the line is complete.
+        parts: list[bytes] = []
+        size = 0
+        line_number = 0
+        async for chunk in chunks:
+            *lines, rest = chunk.split(b"\n")
+            if lines:
+                lines[0] = b"".join(parts) + lines[0]
+                parts, size = [], 0
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield self._parse_line(line, line_number)
+            parts.append(rest)
+            size += len(rest)
+            if size > self._settings.stream_max_line_bytes:
+                raise ValueError(f"Line {line_number + 1} exceeds the maximum size.")
+        line = b"".join(parts)
+        if line.strip():
+            yield self._parse_line(line, line_number + 1)
+
+    async def _aupload_batches(
+        self, chunks: AsyncIterator[bytes], in_flight: deque[tuple[asyncio.Future, int]]
+    ) -> AsyncIterator[int]:
+        # Yields the number of information pieces of every uploaded batch, in order.
+        batch: list[InformationPiece] = []
+        async for information_piece in self._parse_ndjson(chunks):
+            batch.append(information_piece)
+            if len(batch) < self._settings.stream_batch_size:
+                continue
+            self._start_upload(batch, in_flight)
+            batch = []
+            async for count in self._adrain(in_flight, self._settings.stream_max_in_flight_batches - 1):
+                yield count
+        if batch:
+            self._start_upload(batch, in_flight)
+        async for count in self._adrain(in_flight, 0):
+            yield count
+
+    def _start_upload(self, batch: list[InformationPiece], in_flight: deque[tuple[asyncio.Future, int]]) -> None:
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._uploader.upload_information_piece, batch
+        )
+        in_flight.append((future, len(batch)))
+
+    def _run(self, job: IngestionJob, information_pieces: list[InformationPiece]) -> None:
+        with self._lock:
+            self._pending_jobs -= 1
+        self._update(job, IngestionJobStatus.RUNNING)
+        try:
+            self._uploader.upload_information_piece(information_pieces)
+        except HTTPException as e:
+            logger.error("Upload job %s failed: %s", job.job_id, e.detail)
+            self._update(job, IngestionJobStatus.FAILED, str(e.detail))
+        except Exception as e:
+            logger.exception("Upload job %s failed.", job.job_id)
+            self._update(job, IngestionJobStatus.FAILED, str(e))
+        else:
+            self._update(job, IngestionJobStatus.SUCCEEDED)
+
+    def _update(self, job: IngestionJob, job_status: IngestionJobStatus, error: str | None = None) -> None:
+        update = {"status": job_status} | ({"error": error} if error else {})
+        self._jobs.put(job.job_id, job.model_copy(update=update))
@@ -0,0 +1,143 @@
+"""Module containing the CitationImageStore class."""
+
+import base64
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+
+from langchain_core.documents import Document
+
+from rag_core_api.impl.settings.image_storage_settings import ImageStorageSettings
+from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_lib.file_services.file_service import FileService
+from rag_core_lib.impl.data_types.content_type import ContentType
+
+logger = logging.getLogger(__name__)
+
+
+class CitationImageStore:
+    """Keeps the images of image pieces in the object storage instead of the vector database payload.
+
+    Images are stored content addressed, so an image uploaded repeatedly is stored once. The payload only keeps
+    the image ID, which the citation image endpoint resolves.
+    """
+
+    _IMAGE_ID_PATTERN = re.compile(r"^[0-9a-f]{64}\.(png|jpg|gif|webp|bin)$")
+    _SIGNATURES = (
+        (b"\x89PNG\r\n\x1a\n", "png"),
+        (b"\xff\xd8\xff", "jpg"),
+        (b"GIF87a", "gif"),
+        (b"GIF89a", "gif"),
+    )
+    _MEDIA_TYPES = {
+        "png": "image/png",
+        "jpg": "image/jpeg",
+        "gif": "image/gif",
+        "webp": "image/webp",
+        "bin": "application/octet-stream",
+    }
+
+    def __init__(self, file_service: FileService, settings: ImageStorageSettings):
+        """
+        Initialize the CitationImageStore.
+
+        Parameters
+        ----------
+        file_service : FileService
+            The file service of the object storage the images are stored in.
+        settings : ImageStorageSettings
+            The settings of the image storage.
+        """
+        self._file_service = file_service
+        self._settings = settings
+
+    @classmethod
+    def _extension(cls, data: bytes) -> str:
+        for signature, extension in cls._SIGNATURES:
+            if data.startswith(signature):
+                return extension
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return "webp"
+        return "bin"
+
+    def offload(self, documents: list[Document]) -> list[Document]:
+        """
+        Move the base64 encoded images of image documents into the object storage.
+
+        The ``base64_image`` metadata of every image document is replaced by the ``image_id`` of the stored image.
+        Other documents are returned unchanged.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents to upload into the vector database.
+
+        Returns
+        -------
+        list[Document]
+            The documents with image references instead of image content.
+
+        Raises
+        ------
+        ValueError
+            If the image content is not valid base64.
+        """
+        stored: set[str] = set()
+        for document in documents:
+            encoded = document.metadata.get(InformationPieceMapper.IMAGE_CONTENT_KEY)
+            if document.metadata.get("type") != ContentType.IMAGE.value or not encoded:
+                continue
+            try:
+                data = base64.b64decode(encoded, validate=True)
+            except ValueError as e:
+                raise ValueError("Image of information piece is not valid base64.") from e
+            image_id = f"{hashlib.sha256(data).hexdigest()}.{self._extension(data)}"
+            if image_id not in stored:
+                self._upload(image_id, data)
+                stored.add(image_id)
+            del document.metadata[InformationPieceMapper.IMAGE_CONTENT_KEY]
+            document.metadata[InformationPieceMapper.IMAGE_ID_KEY] = image_id
+        return documents
+
+    def load(self, image_id: str) -> tuple[bytes, str]:
+        """
+        Load a stored image.
+
+        Parameters
+        ----------
+        image_id : str
+            The ID of the image, as stored in the ``image_id`` metadata.
+
+        Returns
+        -------
+        tuple[bytes, str]
+            The image content and its media type.
+
+        Raises
+        ------
+        ValueError
+            If the image ID is malformed or the image is not found.
+        """
+        match = self._IMAGE_ID_PATTERN.match(image_id)
+        if not match:
+            raise ValueError(f"Image with id '{image_id}' not found.")
+        buffer = io.BytesIO()
+        try:
+            self._file_service.download_file(self._settings.prefix + image_id, buffer)
+        except Exception as e:
+            logger.exception("Error retrieving image with id: %s.", image_id)
+            raise ValueError(f"Image with id '{image_id}' not found.") from e
+        return buffer.getvalue(), self._MEDIA_TYPES[match.group(1)]
+
+    def _upload(self, image_id: str, data: bytes) -> None:
+        # The file service uploads from a local path.
+        file_descriptor, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            self._file_service.upload_file(path, self._settings.prefix + image_id)
+        finally:
+            os.remove(path)
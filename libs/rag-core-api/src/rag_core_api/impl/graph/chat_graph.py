@@ -28,12 +28,28 @@ from rag_core_api.impl.retriever.no_or_empty_collection_error import (
     NoOrEmptyCollectionError,
 )
 from rag_core_api.impl.settings.chat_history_settings import ChatHistorySettings
+from rag_core_api.impl.settings.citation_settings import CitationSettings
+from rag_core_api.impl.settings.degraded_mode_settings import DegradedModeSettings
 from rag_core_api.impl.settings.error_messages import ErrorMessages
+from rag_core_api.impl.settings.small_talk_settings import SmallTalkSettings
 from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_api.message_classification.message_classifier import (
+    MessageCategory,
+    MessageClassifier,
+)
 from rag_core_api.models.chat_request import ChatRequest
 from rag_core_api.models.chat_response import ChatResponse
+from rag_core_api.models.citation_detail import CitationDetail
 from rag_core_api.models.content_type import ContentType
+from rag_core_api.models.information_piece import InformationPiece
 from rag_core_api.retriever.retriever import Retriever
+from rag_core_api.vector_databases.vector_database import VectorDatabase
+from rag_core_lib.impl.utils.deadline import (
+    DEADLINE_METADATA_KEY,
+    deadline_from_config,
+    remaining_seconds,
+    wait_for_deadline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +60,10 @@ class GraphNodeNames(StrEnum):
 
     Attributes
     ----------
+    CLASSIFY : str
+        Represents a node that classifies the message as question or small talk.
+    SMALL_TALK : str
+        Represents a node that answers small talk without retrieval.
     DETERMINE_LANGUAGE : str
         Reperesents a node that determiens the language of the question.
     REPHRASE : str
@@ -52,14 +72,19 @@ class GraphNodeNames(StrEnum):
         Represents a node that retrieves the relevant langchain documents from the vectordatabase.
     GENERATE : str
         Represents a node that generates the response.
+    EXTRACTIVE_GENERATE : str
+        Represents a node that answers with the top retrieved passages instead of calling the LLM.
     ERROR_NODE : str
         Represents a node that handles errors.
     """
 
+    CLASSIFY = "classify"
+    SMALL_TALK = "small_talk"
     DETERMINE_LANGUAGE = "determine_language"
     REPHRASE = "rephrase"
     RETRIEVE = "retrieve"
     GENERATE = "generate"
+    EXTRACTIVE_GENERATE = "extractive_generate"
     ERROR_NODE = "error_node"
 
 
@@ -68,8 +93,15 @@ class DefaultChatGraph(GraphBase):
 
     It utilizes various chains and retrievers to process and generate responses based on the input message and chat
     history.
+
+    Attributes
+    ----------
+    SCOPE_FILTER_KEYS : dict[str, str]
+        Maps the fields of the chat request scope to the metadata keys they filter on.
     """
 
+    SCOPE_FILTER_KEYS = {"documents": "document", "sources": "source", "tags": "tags"}
+
     def __init__(
         self,
         answer_generation_chain: AnswerGenerationChain,
@@ -79,6 +111,10 @@ class DefaultChatGraph(GraphBase):
         mapper: InformationPieceMapper,
         error_messages: ErrorMessages,
         chat_history_settings: ChatHistorySettings,
+        degraded_mode_settings: Optional[DegradedModeSettings] = None,
+        message_classifier: Optional[MessageClassifier] = None,
+        small_talk_settings: Optional[SmallTalkSettings] = None,
+        citation_settings: Optional[CitationSettings] = None,
     ):
         """
         Initialize the DefaultChatGraph.
@@ -97,6 +133,14 @@ class DefaultChatGraph(GraphBase):
             The error messages to be used in case of failures.
         chat_history_settings : ChatHistorySettings
             The settings for managing chat history.
+        degraded_mode_settings : Optional[DegradedModeSettings]
+            The settings of the extractive fallback answer under LLM overload (default None, meaning disabled).
+        message_classifier : Optional[MessageClassifier]
+            The classifier routing small talk past retrieval (default None, meaning every message is a question).
+        small_talk_settings : Optional[SmallTalkSettings]
+            The settings including the responses to small talk (default None, meaning disabled).
+        citation_settings : Optional[CitationSettings]
+            The settings of compact citations (default None, meaning the defaults).
         """
         self._state_graph = StateGraph(AnswerGraphState)
         self._answer_generation_chain = answer_generation_chain
@@ -106,10 +150,49 @@ class DefaultChatGraph(GraphBase):
         self._rephrasing_chain = rephrasing_chain
         self._language_detection_chain = language_detection_chain
         self._error_messages = error_messages
+        self._degraded_mode_settings = degraded_mode_settings or DegradedModeSettings(enabled=False)
+        self._active_generations = 0
+        self._small_talk_settings = small_talk_settings or SmallTalkSettings(enabled=False)
+        self._message_classifier = message_classifier if self._small_talk_settings.enabled else None
+        self._citation_settings = citation_settings or CitationSettings()
         self._rephrase_node_builder = partial(self._rephrase_node)
         self._generate_node_builder = partial(self._generate_node)
         self._graph = self._setup_graph()
 
+    @classmethod
+    def request_filter_kwargs(cls, chat_request: ChatRequest) -> dict:
+        """
+        Translate the scope and the tenant of the chat request into metadata filters for the retrieval.
+
+        Parameters
+        ----------
+        chat_request : ChatRequest
+            The chat request, optionally carrying a scope and a tenant.
+
+        Returns
+        -------
+        dict
+            The filters per metadata key. A list value matches any of its elements; empty scope fields are ignored.
+        """
+        filter_kwargs = {}
+        if chat_request.scope:
+            filter_kwargs = {
+                metadata_key: list(values)
+                for field, metadata_key in cls.SCOPE_FILTER_KEYS.items()
+                if (values := getattr(chat_request.scope, field))
+            }
+        if chat_request.tenant_id:
+            filter_kwargs[VectorDatabase.TENANT_KEY] = chat_request.tenant_id
+        return filter_kwargs
+
+    @staticmethod
+    def _snippet(text: str, length: int) -> str:
+        text = " ".join(text.split())
+        if len(text) <= length:
+            return text
+        cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+        return cut + "…"
+
     async def ainvoke(
         self,
         graph_input: ChatRequest,
@@ -160,6 +243,8 @@ class DefaultChatGraph(GraphBase):
             finish_reasons=[],
             information_pieces=[],
             langchain_documents=[],
+            filter_kwargs=self.request_filter_kwargs(graph_input),
+            citation_detail=graph_input.citation_detail,
         )
 
         logger.info(
@@ -206,11 +291,34 @@ class DefaultChatGraph(GraphBase):
     #########
     # nodes #
     #########
+    async def _classify_node(self, state: dict) -> dict:
+        update = {"message_category": self._message_classifier.classify(state["question"])}
+        if language := self._message_classifier.detect_language(state["question"]):
+            update["language"] = language
+        return update
+
+    async def _small_talk_node(self, state: dict) -> dict:
+        responses = {
+            MessageCategory.GREETING: self._small_talk_settings.greeting_response,
+            MessageCategory.THANKS: self._small_talk_settings.thanks_response,
+            MessageCategory.GOODBYE: self._small_talk_settings.goodbye_response,
+            MessageCategory.META: self._small_talk_settings.meta_response,
+        }
+        answer_text = self._small_talk_settings.response(responses[state["message_category"]], state.get("language"))
+        chat_response = ChatResponse(
+            answer=answer_text,
+            citations=[],
+            finish_reason=self._small_talk_settings.finish_reason,
+        )
+        return {"answer_text": answer_text, "response": chat_response}
+
     async def _determine_language_node(self, state: dict, config: Optional[RunnableConfig] = None) -> dict:
         question = state["question"]
         # Prefer the LLM-based language detection; fallback to langdetect if needed inside the chain.
         try:
-            question_language = await self._language_detection_chain.ainvoke(state, config=config)
+            question_language = await wait_for_deadline(
+                self._language_detection_chain.ainvoke(state, config=config), config
+            )
         except Exception:
             try:
                 question_language = langdetect.detect(question)
@@ -222,7 +330,13 @@ class DefaultChatGraph(GraphBase):
     async def _rephrase_node(self, state: dict, config: Optional[RunnableConfig] = None) -> dict:
         if not state.get("history"):
             return {"rephrased_question": state["question"]}
-        rephrased_question = await self._rephrasing_chain.ainvoke(chain_input=state, config=config)
+        try:
+            rephrased_question = await wait_for_deadline(
+                self._rephrasing_chain.ainvoke(chain_input=state, config=config), config
+            )
+        except TimeoutError:
+            logger.warning("Request deadline reached while rephrasing; using the original question.")
+            return {"rephrased_question": state["question"]}
         # Ensure rephrased_question is a string
         rephrased_question = getattr(rephrased_question, "content", rephrased_question)
         rephrased_question = (
@@ -233,22 +347,58 @@ class DefaultChatGraph(GraphBase):
         return {"rephrased_question": rephrased_question}
 
     async def _generate_node(self, state: dict, config: Optional[RunnableConfig] = None) -> dict:
-        answer_text = await self._answer_generation_chain.ainvoke(state, config)
+        self._active_generations += 1
+        try:
+            answer_text = await wait_for_deadline(self._answer_generation_chain.ainvoke(state, config), config)
+        except TimeoutError:
+            logger.warning("Request deadline reached during answer generation.")
+            if self._degraded_mode_settings.enabled:
+                return await self._extractive_generate_node(state)
+            chat_response = ChatResponse(
+                answer=self._error_messages.deadline_exceeded,
+                citations=[],
+                finish_reason="DeadlineExceeded",
+            )
+            return {"answer_text": chat_response.answer, "response": chat_response}
+        finally:
+            self._active_generations -= 1
         if hasattr(answer_text, "content"):
             answer_text = answer_text.content
         elif not isinstance(answer_text, str):
             answer_text = str(answer_text)
         chat_response = ChatResponse(
             answer=answer_text,
-            citations=state["information_pieces"],
+            citations=self._citations(state, state["information_pieces"]),
             finish_reason="",  # TODO: get finish_reason. Might be impossible/difficult depending on used llm
         )
         return {"answer_text": answer_text, "response": chat_response}
 
-    async def _retrieve_node(self, state: dict) -> dict:
+    async def _extractive_generate_node(self, state: dict) -> dict:
+        # The information pieces are in reranked order; images only carry a description, so prefer text.
+        pieces = [x for x in state["information_pieces"] if x.type != ContentType.IMAGE] or state["information_pieces"]
+        citations = pieces[: self._degraded_mode_settings.max_passages]
+        answer_text = "\n\n".join(piece.page_content.strip() for piece in citations)
+        chat_response = ChatResponse(
+            answer=answer_text,
+            citations=self._citations(state, citations),
+            finish_reason=self._degraded_mode_settings.finish_reason,
+        )
+        return {"answer_text": answer_text, "response": chat_response}
+
+    async def _retrieve_node(self, state: dict, config: Optional[RunnableConfig] = None) -> dict:
         try:
             question = state.get("rephrased_question") or state["question"]
-            retrieved_documents = await self._composite_retriever.ainvoke(retriever_input=question)
+            session_id = ((config or {}).get("metadata") or {}).get("session_id")
+            retriever_config = RunnableConfig(
+                metadata={
+                    "session_id": session_id,
+                    "filter_kwargs": dict(state.get("filter_kwargs") or {}),
+                    DEADLINE_METADATA_KEY: deadline_from_config(config),
+                }
+            )
+            retrieved_documents = await self._composite_retriever.ainvoke(
+                retriever_input=question, config=retriever_config
+            )
         except NoOrEmptyCollectionError:
             logger.warning("No or empty collection encountered.")
             return {
@@ -268,8 +418,13 @@ class DefaultChatGraph(GraphBase):
             response[self.FINISH_REASONS] = ["No documents found"]
             return response
 
+        metadata_keys = (
+            self._citation_settings.compact_metadata_keys
+            if state.get("citation_detail") == CitationDetail.COMPACT
+            else None
+        )
         information_pieces = [
-            self._mapper.langchain_document2information_piece(document)
+            self._mapper.langchain_document2information_piece(document, metadata_keys)
             for document in retrieved_documents
             if document.metadata.get("type", ContentType.SUMMARY.value) != ContentType.SUMMARY.value
         ]
@@ -286,6 +441,16 @@ class DefaultChatGraph(GraphBase):
 
         return response
 
+    def _citations(self, state: dict, information_pieces: list[InformationPiece]) -> list[InformationPiece]:
+        # Compact citations carry a snippet; the complete pieces are fetched by ID when needed.
+        if state.get("citation_detail") != CitationDetail.COMPACT:
+            return information_pieces
+        length = self._citation_settings.snippet_length
+        return [
+            piece.model_copy(update={"page_content": self._snippet(piece.page_content, length)})
+            for piece in information_pieces
+        ]
+
     async def _error_node(self, state: dict) -> dict:
         error_message = " ".join(set(state[self.ERROR_MESSAGES_KEY]))
         finish_reson = " ".join(set(state[self.FINISH_REASONS]))
@@ -294,26 +459,58 @@ class DefaultChatGraph(GraphBase):
     #####################
     # conditional edges #
     #####################
-    def _docs_retrieved_edge(self, state: dict) -> str:
-        if state["information_pieces"]:
-            return GraphNodeNames.GENERATE
-        return GraphNodeNames.ERROR_NODE
+    def _small_talk_edge(self, state: dict) -> str:
+        if state["message_category"] == MessageCategory.QUESTION:
+            return GraphNodeNames.DETERMINE_LANGUAGE
+        return GraphNodeNames.SMALL_TALK
+
+    def _docs_retrieved_edge(self, state: dict, config: Optional[RunnableConfig] = None) -> str:
+        if not state["information_pieces"]:
+            return GraphNodeNames.ERROR_NODE
+        if self._degraded_mode_settings.enabled and self._llm_overloaded(config):
+            return GraphNodeNames.EXTRACTIVE_GENERATE
+        return GraphNodeNames.GENERATE
+
+    def _llm_overloaded(self, config: Optional[RunnableConfig]) -> bool:
+        # Soft, per-worker limit: requests beyond it get an extractive answer instead of queueing at the LLM.
+        if self._active_generations >= self._degraded_mode_settings.max_concurrent_generations:
+            logger.warning("LLM concurrency limit reached; answering extractively.")
+            return True
+        remaining = remaining_seconds(config)
+        if remaining is not None and remaining < self._degraded_mode_settings.min_remaining_seconds:
+            logger.warning("%.2fs left for the request; answering extractively.", remaining)
+            return True
+        return False
 
     def _add_nodes(self):
+        if self._message_classifier:
+            self._state_graph.add_node(GraphNodeNames.CLASSIFY, self._classify_node)
+            self._state_graph.add_node(GraphNodeNames.SMALL_TALK, self._small_talk_node)
         self._state_graph.add_node(GraphNodeNames.DETERMINE_LANGUAGE, self._determine_language_node)
         self._state_graph.add_node(GraphNodeNames.REPHRASE, self._rephrase_node_builder)
         self._state_graph.add_node(GraphNodeNames.RETRIEVE, self._retrieve_node)
         self._state_graph.add_node(GraphNodeNames.GENERATE, self._generate_node_builder)
+        self._state_graph.add_node(GraphNodeNames.EXTRACTIVE_GENERATE, self._extractive_generate_node)
         self._state_graph.add_node(GraphNodeNames.ERROR_NODE, self._error_node)
 
     def _wire_graph(self):
-        self._state_graph.add_edge(START, GraphNodeNames.DETERMINE_LANGUAGE)
+        if self._message_classifier:
+            self._state_graph.add_edge(START, GraphNodeNames.CLASSIFY)
+            self._state_graph.add_conditional_edges(
+                GraphNodeNames.CLASSIFY,
+                self._small_talk_edge,
+                [GraphNodeNames.SMALL_TALK, GraphNodeNames.DETERMINE_LANGUAGE],
+            )
+            self._state_graph.add_edge(GraphNodeNames.SMALL_TALK, END)
+        else:
+            self._state_graph.add_edge(START, GraphNodeNames.DETERMINE_LANGUAGE)
         self._state_graph.add_edge(GraphNodeNames.DETERMINE_LANGUAGE, GraphNodeNames.REPHRASE)
         self._state_graph.add_edge(GraphNodeNames.REPHRASE, GraphNodeNames.RETRIEVE)
         self._state_graph.add_conditional_edges(
             GraphNodeNames.RETRIEVE,
             self._docs_retrieved_edge,
-            [GraphNodeNames.GENERATE, GraphNodeNames.ERROR_NODE],
+            [GraphNodeNames.GENERATE, GraphNodeNames.EXTRACTIVE_GENERATE, GraphNodeNames.ERROR_NODE],
         )
         self._state_graph.add_edge(GraphNodeNames.GENERATE, END)
+        self._state_graph.add_edge(GraphNodeNames.EXTRACTIVE_GENERATE, END)
         self._state_graph.add_edge(GraphNodeNames.ERROR_NODE, END)
@@ -7,6 +7,7 @@ from langchain_core.documents import Document
 from typing_extensions import TypedDict
 
 from rag_core_api.models.chat_response import ChatResponse
+from rag_core_api.models.citation_detail import CitationDetail
 from rag_core_api.models.information_piece import InformationPiece
 
 
@@ -37,6 +38,12 @@ class AnswerGraphState(TypedDict):
         A list of error messages encountered.
     finish_reasons : list[str]
         A list of reasons why the process finished.
+    message_category : str | None
+        The category the message has been classified into, if classified (default None).
+    filter_kwargs : dict
+        The metadata filters restricting the retrieval, e.g. to the documents of the chat request scope.
+    citation_detail : str
+        How detailed the citations of the response are, see `CitationDetail`.
     """
 
     question: str
@@ -50,6 +57,9 @@ class AnswerGraphState(TypedDict):
     additional_info: dict | None
     error_messages: Annotated[list[str], operator.add]
     finish_reasons: Annotated[list[str], operator.add]
+    message_category: str | None
+    filter_kwargs: dict
+    citation_detail: str
 
     @classmethod
     def create(
@@ -65,6 +75,9 @@ class AnswerGraphState(TypedDict):
         response=None,
         additional_info=None,
         language="en",
+        message_category=None,
+        filter_kwargs=None,
+        citation_detail=None,
     ) -> "AnswerGraphState":
         """
         Create an instance of AnswerGraphState.
@@ -95,6 +108,12 @@ class AnswerGraphState(TypedDict):
             Any additional information (default None).
         language : str
             The language the question has been asked in (default en).
+        message_category : str
+            The category the message has been classified into (default None).
+        filter_kwargs : dict
+            The metadata filters restricting the retrieval (default None, meaning no filters).
+        citation_detail : str
+            How detailed the citations of the response are (default None, meaning FULL).
 
         Returns
         -------
@@ -113,4 +132,7 @@ class AnswerGraphState(TypedDict):
             error_messages=error_messages,
             finish_reasons=finish_reasons,
             language=language,
+            message_category=message_category,
+            filter_kwargs=filter_kwargs or {},
+            citation_detail=citation_detail or CitationDetail.FULL.value,
         )
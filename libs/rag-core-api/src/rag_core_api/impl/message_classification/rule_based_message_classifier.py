@@ -0,0 +1,124 @@
+"""Module for the RuleBasedMessageClassifier class."""
+
+import re
+from typing import Optional
+
+from rag_core_api.message_classification.message_classifier import (
+    MessageCategory,
+    MessageClassifier,
+)
+
+_SEGMENT_SEPARATORS = re.compile(r"[.,;:!?¡¿\n]+")
+_NON_WORD = re.compile(r"[^\w\s']+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Every pattern has to match a complete segment of the message, so anything beyond small talk is a question.
+# The patterns are kept per language, so small talk can be answered in the language of the user.
+_PATTERNS: dict[MessageCategory, dict[str, re.Pattern]] = {
+    MessageCategory.GREETING: {
+        "en": re.compile(
+            r"(hi|hello|hey|howdy|greetings|yo|good (morning|afternoon|evening|day))( there| everyone| all)?"
+        ),
+        "de": re.compile(r"(hallo|moin|servus|gruss gott|grüß gott|grüezi|guten (morgen|tag|abend))( zusammen)?"),
+    },
+    MessageCategory.THANKS: {
+        "en": re.compile(
+            r"(thanks?( you)?|thx|ty|cheers)( (a lot|very much|so much|again|for (your|the) (help|answer)))?"
+        ),
+        "de": re.compile(
+            r"(danke( schön| sehr)?|vielen dank|dankeschön|merci)( (für (deine|ihre|die) (hilfe|antwort)))?"
+        ),
+    },
+    MessageCategory.GOODBYE: {
+        "en": re.compile(r"(bye|goodbye|good bye|see you|see ya)( later| soon)?"),
+        "de": re.compile(r"(tschüss|tschüs|ciao|auf wiedersehen|bis (bald|später|dann))"),
+    },
+    MessageCategory.META: {
+        "en": re.compile(
+            r"(who are you|what are you|what can you do|how can you help( me)?|what do you do"
+            r"|are you a (bot|robot|human))"
+        ),
+        "de": re.compile(
+            r"(wer bist du|was bist du|was kannst du( alles)?|wie kannst du (mir )?helfen"
+            r"|bist du ein (bot|mensch|roboter))"
+        ),
+    },
+}
+
+
+def _classify_segment(segment: str) -> Optional[tuple[MessageCategory, str]]:
+    for category, patterns in _PATTERNS.items():
+        for language, pattern in patterns.items():
+            if pattern.fullmatch(segment):
+                return category, language
+    return None
+
+
+class RuleBasedMessageClassifier(MessageClassifier):
+    """Classify greetings, thanks, farewells and questions about the assistant with regular expressions.
+
+    The message is split at punctuation and every segment has to be small talk; otherwise the message is
+    treated as a question. This keeps false positives (skipped retrieval for a real question) rare.
+    """
+
+    def __init__(self, max_words: int = 12):
+        """
+        Initialize the RuleBasedMessageClassifier.
+
+        Parameters
+        ----------
+        max_words : int
+            Messages with more words are always classified as questions (default 12).
+        """
+        self._max_words = max_words
+
+    def classify(self, message: str) -> MessageCategory:
+        """
+        Classify the chat message.
+
+        Parameters
+        ----------
+        message : str
+            The chat message of the user.
+
+        Returns
+        -------
+        MessageCategory
+            The category of the message. If the message consists of several small talk segments, the last
+            segment that is not a greeting determines the category.
+        """
+        category, _ = self._classify(message)
+        return category
+
+    def detect_language(self, message: str) -> Optional[str]:
+        """
+        Detect the language of a small talk message.
+
+        Parameters
+        ----------
+        message : str
+            The chat message of the user.
+
+        Returns
+        -------
+        Optional[str]
+            The language of the segment that determines the category, or None for questions.
+        """
+        _, language = self._classify(message)
+        return language
+
+    def _classify(self, message: str) -> tuple[MessageCategory, Optional[str]]:
+        if len(message.split()) > self._max_words:
+            return MessageCategory.QUESTION, None
+
+        category, language = None, None
+        for segment in _SEGMENT_SEPARATORS.split(message.lower()):
+            segment = _WHITESPACE.sub(" ", _NON_WORD.sub(" ", segment)).strip()
+            if not segment:
+                continue
+            match = _classify_segment(segment)
+            if match is None:
+                return MessageCategory.QUESTION, None
+            if category is None or match[0] != MessageCategory.GREETING:
+                category, language = match
+        return (category, language) if category else (MessageCategory.QUESTION, None)
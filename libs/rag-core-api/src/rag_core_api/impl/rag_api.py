@@ -1,17 +1,20 @@
 """Module for the implementation of the RagApi class."""
 
 import logging
-from asyncio import run
+from asyncio import run, to_thread
 from threading import Thread
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 
+from rag_core_api.api_endpoints.batch_chat import BatchChat
 from rag_core_api.api_endpoints.chat import Chat
+from rag_core_api.api_endpoints.citation_image_retriever import CitationImageRetriever
 from rag_core_api.api_endpoints.information_piece_remover import InformationPieceRemover
-from rag_core_api.api_endpoints.information_piece_uploader import (
-    InformationPiecesUploader,
-)
+from rag_core_api.api_endpoints.information_pieces_fetcher import InformationPiecesFetcher
+from rag_core_api.api_endpoints.ingestion_jobs import IngestionJobs
 from rag_core_api.apis.rag_api_base import BaseRagApi
 from rag_core_api.dependency_container import DependencyContainer
 from rag_core_api.evaluator.evaluator import Evaluator
@@ -19,10 +22,24 @@ from rag_core_api.models.chat_request import ChatRequest
 from rag_core_api.models.chat_response import ChatResponse
 from rag_core_api.models.delete_request import DeleteRequest
 from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.ingestion_job import IngestionJob
 
 logger = logging.getLogger(__name__)
 
 
+class _RequestConsumingStreamingResponse(StreamingResponse):
+    """Streaming response whose content reads the request body while it is sent.
+
+    The default implementation listens for the client disconnect on older ASGI servers, which would consume the
+    request body instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
 class RagApi(BaseRagApi):
     """
     RagApi class for handling various endpoints of the RAG API.
@@ -63,6 +80,68 @@ class RagApi(BaseRagApi):
         """
         return await chat_endpoint.achat(session_id, chat_request)
 
+    @inject
+    async def batch_chat(
+        self,
+        chat_requests: list[ChatRequest],
+        batch_chat_endpoint: BatchChat = Depends(Provide[DependencyContainer.batch_chat_endpoint]),
+    ) -> StreamingResponse:
+        """
+        Asynchronously answers a batch of chat requests.
+
+        Parameters
+        ----------
+        chat_requests : list[ChatRequest]
+            The chat requests to answer.
+        batch_chat_endpoint : BatchChat, optional
+            The batch chat endpoint dependency.
+
+        Returns
+        -------
+        StreamingResponse
+            The NDJSON stream with one item per chat request, in the order of the requests.
+
+        Raises
+        ------
+        HTTPException
+            If the batch is invalid.
+        """
+        try:
+            items = batch_chat_endpoint.abatch_chat(chat_requests or [])
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+        async def ndjson_lines():
+            async for item in items:
+                yield item.to_json() + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    @inject
+    async def get_citation_image(
+        self,
+        image_id: str,
+        citation_image_retriever: CitationImageRetriever = Depends(
+            Provide[DependencyContainer.citation_image_retriever]
+        ),
+    ) -> Response:
+        """
+        Asynchronously retrieves the image of a cited image piece.
+
+        Parameters
+        ----------
+        image_id : str
+            The ID of the image, as found in the ``image_id`` metadata of a cited information piece.
+        citation_image_retriever : CitationImageRetriever, optional
+            The citation image retriever dependency.
+
+        Returns
+        -------
+        Response
+            The image in binary form.
+        """
+        return await citation_image_retriever.aget_citation_image(image_id)
+
     @inject
     async def evaluate(
         self,
@@ -90,6 +169,34 @@ class RagApi(BaseRagApi):
         thread.start()
         self._background_threads.append(thread)
 
+    @inject
+    async def get_information_pieces(
+        self,
+        ids: list[str],
+        tenant_id: str | None,
+        information_pieces_fetcher: InformationPiecesFetcher = Depends(
+            Provide[DependencyContainer.information_pieces_fetcher]
+        ),
+    ) -> list[InformationPiece]:
+        """
+        Asynchronously fetches complete information pieces, e.g. to expand compact citations.
+
+        Parameters
+        ----------
+        ids : list[str]
+            The IDs of the information pieces.
+        tenant_id : str | None
+            Only return information pieces of this tenant.
+        information_pieces_fetcher : InformationPiecesFetcher, optional
+            The information pieces fetcher dependency.
+
+        Returns
+        -------
+        list[InformationPiece]
+            The information pieces found, in the order of the IDs.
+        """
+        return await information_pieces_fetcher.afetch_information_pieces(ids, tenant_id)
+
     @inject
     async def remove_information_piece(
         self,
@@ -113,29 +220,88 @@ class RagApi(BaseRagApi):
         -------
         None
         """
-        information_pieces_remover.remove_information_piece(delete_request)
+        # The delete blocks until the vector database applied it; keep it off the event loop serving the chats.
+        await to_thread(information_pieces_remover.remove_information_piece, delete_request)
 
     @inject
     async def upload_information_piece(
         self,
         information_piece: list[InformationPiece],
-        information_pieces_uploader: InformationPiecesUploader = Depends(
-            Provide[DependencyContainer.information_pieces_uploader]
-        ),
-    ) -> None:
+        background: bool = False,
+        ingestion_jobs: IngestionJobs = Depends(Provide[DependencyContainer.ingestion_jobs]),
+    ) -> Response | None:
         """
         Asynchronously uploads a list of information pieces.
 
+        The upload runs on the ingestion worker pool, so embedding and upserting do not block the event loop.
+
         Parameters
         ----------
         information_piece : list[InformationPiece]
             A list of InformationPiece objects to be uploaded.
-        information_pieces_uploader : InformationPiecesUploader, optional
-            An instance of InformationPiecesUploader
-            (default Depends(Provide[DependencyContainer.information_pieces_uploader]))
+        background : bool
+            Whether to return before the upload finished (default False).
+        ingestion_jobs : IngestionJobs, optional
+            The ingestion jobs dependency.
 
         Returns
         -------
-        None
+        Response | None
+            The `IngestionJob` with status 202 for background uploads, otherwise None.
+        """
+        if background:
+            job = ingestion_jobs.submit(information_piece)
+            return Response(job.to_json(), status_code=status.HTTP_202_ACCEPTED, media_type="application/json")
+        await ingestion_jobs.aupload(information_piece)
+        return None
+
+    @inject
+    async def upload_information_piece_stream(
+        self,
+        request: Request,
+        ingestion_jobs: IngestionJobs = Depends(Provide[DependencyContainer.ingestion_jobs]),
+    ) -> StreamingResponse:
+        """
+        Asynchronously uploads information pieces streamed as NDJSON, one information piece per line.
+
+        Parameters
+        ----------
+        request : Request
+            The request, whose body is read incrementally.
+        ingestion_jobs : IngestionJobs, optional
+            The ingestion jobs dependency.
+
+        Returns
+        -------
+        StreamingResponse
+            The NDJSON stream of `IngestionProgress`es.
+        """
+
+        async def ndjson_lines():
+            async for progress in ingestion_jobs.aupload_stream(request.stream()):
+                yield progress.to_json() + "\n"
+
+        return _RequestConsumingStreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    @inject
+    async def get_upload_job(
+        self,
+        job_id: str,
+        ingestion_jobs: IngestionJobs = Depends(Provide[DependencyContainer.ingestion_jobs]),
+    ) -> IngestionJob:
+        """
+        Asynchronously returns the status of a background upload of information pieces.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+        ingestion_jobs : IngestionJobs, optional
+            The ingestion jobs dependency.
+
+        Returns
+        -------
+        IngestionJob
+            The job with its status.
         """
-        information_pieces_uploader.upload_information_piece(information_piece)
+        return ingestion_jobs.get_job(job_id)
@@ -6,25 +6,48 @@ Performance notes / improvements (2025-10):
      slowest individual retriever call instead of the sum of all.
  - Duplicate filtering now uses an O(1) set membership check instead of rebuilding a list
      comprehension for every candidate (previously O(n^2)).
- - Early pruning hook (``_total_k``) is prepared for future enhancement; if provided it
-     allows trimming the merged candidate list before an optional reranker is invoked.
+ - Early pruning (``total_retrieved_k_documents``) merges the candidates of all retrievers by their
+     normalized similarity score with a heap-based top-k selection. Optional per-type minimum quotas
+     keep e.g. tables and images in the candidate set handed to the reranker.
+ - An optional coarse-to-fine mode searches the summaries first and restricts the chunk search to the
+     documents of the best summaries, so the searched space stays small on large corpora.
+ - An optional diversity stage removes near-duplicate chunks (e.g. splitter overlap, repeated headers)
+     and can select the final documents by maximal marginal relevance, using the stored embeddings.
+ - Searches can return a projection of the payload; the complete metadata is only loaded for the
+     final documents after reranking.
 """
 
+import heapq
 import logging
 import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
-from typing import Any, Optional, Iterable
+from typing import Any, Iterator, Optional
 
+import numpy as np
 from langchain_core.documents import Document
 from langchain_core.runnables import RunnableConfig
 
+from rag_core_api.impl.retriever.diversity import select_diverse
 from rag_core_api.impl.retriever.retriever_quark import RetrieverQuark
+from rag_core_api.impl.settings.chat_deadline_settings import ChatDeadlineSettings
+from rag_core_api.impl.settings.coarse_to_fine_settings import CoarseToFineSettings
+from rag_core_api.impl.settings.diversity_settings import DiversitySettings
 from rag_core_api.reranking.reranker import Reranker
 from rag_core_api.retriever.retriever import Retriever
+from rag_core_api.vector_databases.vector_database import VectorDatabase
 from rag_core_lib.impl.data_types.content_type import ContentType
+from rag_core_lib.impl.utils.deadline import remaining_seconds
 
 logger = logging.getLogger(__name__)
 
+DocumentsByInput = dict[str, list[Document]]
+
+_prefetched_documents: ContextVar[Optional[DocumentsByInput]] = ContextVar(
+    "composite_retriever_prefetched_documents", default=None
+)
+
 
 class CompositeRetriever(Retriever):
     """CompositeRetriever class that combines multiple retrievers and optionally reranks the results."""
@@ -32,10 +55,15 @@ class CompositeRetriever(Retriever):
     def __init__(
         self,
         retrievers: list[RetrieverQuark],
+        vector_database: VectorDatabase,
         reranker: Optional[Reranker],
         reranker_enabled: bool,
         total_retrieved_k_documents: int | None = None,
         reranker_k_documents: int | None = None,
+        deadline_settings: ChatDeadlineSettings | None = None,
+        min_documents_per_type: dict[str, int] | None = None,
+        diversity_settings: DiversitySettings | None = None,
+        coarse_to_fine_settings: CoarseToFineSettings | None = None,
         **kwargs,
     ):
         """
@@ -45,6 +73,9 @@ class CompositeRetriever(Retriever):
         ----------
         retrievers : list[RetrieverQuark]
             A list of retriever quarks to be used by the composite retriever.
+        vector_database : VectorDatabase
+            The vector database searched by the retriever quarks, used for batched searches and to load related
+            documents, vectors and complete payloads.
         reranker : Optional[Reranker]
             An optional reranker to rerank the retrieved results.
         reranker_enabled : bool
@@ -53,16 +84,81 @@ class CompositeRetriever(Retriever):
             The total number of documents to retrieve (default None, meaning no limit).
         reranker_k_documents : int | None
             The number of documents to retrieve for the reranker (default None, meaning no limit).
+        deadline_settings : ChatDeadlineSettings | None
+            Thresholds for shrinking the retrieval and skipping the reranker when the request deadline approaches
+            (default None, meaning the deadline is ignored).
+        min_documents_per_type : dict[str, int] | None
+            The minimal number of documents per content type kept by the early pruning, if retrieved
+            (default None, meaning no quotas).
+        diversity_settings : DiversitySettings | None
+            Settings of the near-duplicate removal and MMR selection of the final documents
+            (default None, meaning disabled).
+        coarse_to_fine_settings : CoarseToFineSettings | None
+            Settings of the two-stage retrieval searching the summaries before the chunks
+            (default None, meaning all retrievers search the whole collection at once).
         **kwargs : dict
             Additional keyword arguments to be passed to the superclass initializer.
         """
         super().__init__(**kwargs)
         self._reranker = reranker
         self._retrievers = retrievers
+        self._vector_database = vector_database
         # Optional global cap (before reranking) on merged candidates. If None, no cap applied.
         self._total_retrieved_k_documents = total_retrieved_k_documents
         self._reranker_k_documents = reranker_k_documents
         self._reranker_enabled = reranker_enabled
+        self._deadline_settings = deadline_settings
+        self._min_documents_per_type = {k: v for k, v in (min_documents_per_type or {}).items() if v > 0}
+        self._diversity_settings = diversity_settings
+        self._coarse_to_fine_settings = coarse_to_fine_settings
+
+    @property
+    def _coarse_to_fine_enabled(self) -> bool:
+        if not self._coarse_to_fine_settings or not self._coarse_to_fine_settings.enabled:
+            return False
+        types = [getattr(r, "content_type", None) for r in self._retrievers]
+        return ContentType.SUMMARY in types and any(t != ContentType.SUMMARY for t in types)
+
+    @staticmethod
+    @contextmanager
+    def prefetched(documents_by_input: DocumentsByInput) -> Iterator[None]:
+        """
+        Use the given search hits instead of searching for the corresponding inputs within the block.
+
+        The hits are still post-processed per invocation, so reranking, the request deadline and the diversity
+        stage apply as usual. They are kept in a context variable, so they are visible to all tasks created
+        within the block.
+
+        Parameters
+        ----------
+        documents_by_input : dict[str, list[Document]]
+            The search hits keyed by retriever input, e.g. the result of `abatch_search`.
+        """
+        token = _prefetched_documents.set(documents_by_input)
+        try:
+            yield
+        finally:
+            _prefetched_documents.reset(token)
+
+    @staticmethod
+    def _relevance(documents: list[Document]) -> np.ndarray:
+        # Prefer the reranker score, then the retrieval score; fall back to the rank of the (ordered) documents.
+        for key in ("relevance_score", "score"):
+            if all(d.metadata.get(key) is not None for d in documents):
+                scores = np.asarray([d.metadata[key] for d in documents], dtype=np.float32)
+                spread = scores.max() - scores.min()
+                return (scores - scores.min()) / spread if spread > 0 else np.ones(len(documents), dtype=np.float32)
+        return 1.0 - np.arange(len(documents), dtype=np.float32) / len(documents)
+
+    @staticmethod
+    def _summary_scores(summary_docs: list[Document]) -> dict[str, float]:
+        summary_scores: dict[str, float] = {}
+        for sdoc in summary_docs:
+            if sdoc.metadata.get("score") is None:
+                continue
+            for rid in sdoc.metadata.get("related", []):
+                summary_scores[rid] = max(summary_scores.get(rid, 0.0), sdoc.metadata["score"])
+        return summary_scores
 
     def verify_readiness(self) -> None:
         """
@@ -106,19 +202,148 @@ class CompositeRetriever(Retriever):
         Notes
         -----
         - If no configuration is provided, a default configuration with empty metadata is used.
+        - In coarse-to-fine mode the summaries are searched first and the other retrievers only search
+          the documents of the best summaries.
         - Summaries are removed from the results.
         - Duplicate entries are removed based on their metadata ID.
         - If a reranker is available, the results are further processed by the reranker.
+        - If enabled, near-duplicates are removed from the final documents.
+        - If the request deadline approaches, fewer documents are retrieved and reranking is skipped.
+        - Within `prefetched`, the prefetched search hits of the input are post-processed instead of searching.
         """
-        if config is None:
-            config = RunnableConfig(metadata={"filter_kwargs": {}})
+        config = self._prepare_config(config)
+
+        prefetched = _prefetched_documents.get()
+        if prefetched is not None and retriever_input in prefetched:
+            # Several requests may share an input, and post-processing changes the metadata of the documents.
+            results = deepcopy(prefetched[retriever_input])
+        else:
+            results = await self._asearch(retriever_input, config)
+
+        return await self._apostprocess(results, retriever_input, config)
+
+    async def abatch_invoke(
+        self,
+        retriever_inputs: list[str],
+        config: Optional[RunnableConfig] = None,
+    ) -> list[list[Document]]:
+        """
+        Asynchronously retrieve the documents for several inputs at once.
+
+        The inputs are searched as described for `abatch_search` and every result is post-processed like in
+        `ainvoke`.
+
+        Parameters
+        ----------
+        retriever_inputs : list[str]
+            The input strings to be processed by the retrievers.
+        config : Optional[RunnableConfig]
+            Configuration for the retrievers and reranker (default None).
+
+        Returns
+        -------
+        list[list[Document]]
+            The documents per input, in the order of the inputs.
+        """
+        config = self._prepare_config(config)
+        batch_results = await self._abatch_search(retriever_inputs, config)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._apostprocess(results, retriever_input, config)
+                    for retriever_input, results in zip(retriever_inputs, batch_results)
+                )
+            )
+        )
+
+    async def abatch_search(
+        self,
+        retriever_inputs: list[str],
+        config: Optional[RunnableConfig] = None,
+    ) -> list[list[Document]]:
+        """
+        Asynchronously search for several inputs at once, without post-processing the results.
+
+        If all retrievers are RetrieverQuarks sharing one vector database, the inputs are embedded once and all
+        searches are sent to the vector database as a single batch. Otherwise every input is searched separately.
+        The results can be handed to `prefetched`, so that `ainvoke` post-processes them with the configuration
+        of the request, e.g. its deadline.
+
+        Parameters
+        ----------
+        retriever_inputs : list[str]
+            The input strings to be processed by the retrievers.
+        config : Optional[RunnableConfig]
+            Configuration for the retrievers (default None).
+
+        Returns
+        -------
+        list[list[Document]]
+            The search hits of all retrievers per input, in the order of the inputs.
+        """
+        return await self._abatch_search(retriever_inputs, self._prepare_config(config))
+
+    async def _asearch(self, retriever_input: str, config: RunnableConfig) -> list[Document]:
+        if self._coarse_to_fine_enabled:
+            return await self._acoarse_to_fine(retriever_input, config)
+        return await self._aretrieve(self._retrievers, retriever_input, config)
 
+    async def _abatch_search(self, retriever_inputs: list[str], config: RunnableConfig) -> list[list[Document]]:
+        if not all(isinstance(r, RetrieverQuark) for r in self._retrievers) or self._coarse_to_fine_enabled:
+            return list(await asyncio.gather(*(self._asearch(x, config) for x in retriever_inputs)))
+
+        self.verify_readiness()
+        searches = [r.search_arguments(deepcopy(config)) for r in self._retrievers]
+        batch_results = await self._vector_database.abatch_search(retriever_inputs, searches)
+        return [[doc for group in groups for doc in group] for groups in batch_results]
+
+    async def _aretrieve(self, retrievers: list, retriever_input: str, config: RunnableConfig) -> list[Document]:
         # Run all retrievers concurrently instead of sequentially.
-        tasks = [r.ainvoke(retriever_input, config=deepcopy(config)) for r in self._retrievers]
+        tasks = [r.ainvoke(retriever_input, config=deepcopy(config)) for r in retrievers]
         retriever_outputs = await asyncio.gather(*tasks, return_exceptions=False)
         # Flatten
-        results: list[Document] = [doc for group in retriever_outputs for doc in group]
-
+        return [doc for group in retriever_outputs for doc in group]
+
+    async def _acoarse_to_fine(self, retriever_input: str, config: RunnableConfig) -> list[Document]:
+        settings = self._coarse_to_fine_settings
+        summary_retrievers = [r for r in self._retrievers if r.content_type == ContentType.SUMMARY]
+        chunk_retrievers = [r for r in self._retrievers if r.content_type != ContentType.SUMMARY]
+
+        coarse_results = await self._aretrieve(summary_retrievers, retriever_input, config)
+        summaries = sorted(
+            (d for d in coarse_results if d.metadata.get("type") == ContentType.SUMMARY.value),
+            key=lambda d: d.metadata.get("score", 0.0),
+            reverse=True,
+        )
+        documents = list(
+            dict.fromkeys(d.metadata[settings.document_key] for d in summaries if d.metadata.get(settings.document_key))
+        )[: settings.top_documents]
+        if not documents:
+            logger.debug("No summary matched; searching all documents.")
+            return coarse_results + await self._aretrieve(chunk_retrievers, retriever_input, config)
+
+        metadata = config.get("metadata", {})
+        filter_kwargs = metadata.get("filter_kwargs", {}) | {settings.document_key: documents}
+        fine_config = RunnableConfig(**(config | {"metadata": metadata | {"filter_kwargs": filter_kwargs}}))
+        return coarse_results + await self._aretrieve(chunk_retrievers, retriever_input, fine_config)
+
+    def _prepare_config(self, config: Optional[RunnableConfig]) -> RunnableConfig:
+        if config is None:
+            config = RunnableConfig(metadata={"filter_kwargs": {}})
+        if self._diversity_settings and self._diversity_settings.enabled:
+            metadata = config.get("metadata", {}) | {RetrieverQuark.WITH_VECTORS_KEY: True}
+            config = RunnableConfig(**(config | {"metadata": metadata}))
+
+        remaining = remaining_seconds(config) if self._deadline_settings else None
+        if remaining is None or remaining >= self._deadline_settings.reduced_k_remaining_seconds:
+            return config
+        logger.info("%.2fs left for the request; retrieving fewer documents.", remaining)
+        metadata = config.get("metadata", {}) | {RetrieverQuark.K_FACTOR_KEY: self._deadline_settings.reduced_k_factor}
+        return RunnableConfig(**(config | {"metadata": metadata}))
+
+    async def _apostprocess(
+        self, results: list[Document], retriever_input: str, config: RunnableConfig
+    ) -> list[Document]:
         summary_docs: list[Document] = [d for d in results if d.metadata.get("type") == ContentType.SUMMARY.value]
 
         results = self._use_summaries(summary_docs, results)
@@ -127,7 +352,16 @@ class CompositeRetriever(Retriever):
 
         return_val = self._early_pruning(return_val)
 
-        return await self._arerank_pruning(return_val, retriever_input, config)
+        remaining = remaining_seconds(config) if self._deadline_settings else None
+        if remaining is not None and remaining < self._deadline_settings.skip_reranking_remaining_seconds:
+            logger.info("%.2fs left for the request; skipping reranking.", remaining)
+            return_val = return_val[: self._reranker_k_documents] if self._reranker_k_documents else return_val
+        else:
+            return_val = await self._arerank_pruning(return_val, retriever_input, config)
+
+        return_val = await self._adiversify(return_val)
+
+        return await self._ahydrate(return_val)
 
     def _use_summaries(self, summary_docs: list[Document], results: list[Document]) -> list[Document]:
         """Utilize summary documents to enhance retrieval results.
@@ -145,43 +379,40 @@ class CompositeRetriever(Retriever):
             The enhanced list of documents.
         """
         try:
-            # Collect existing ids for fast membership tests
             existing_ids: set[str] = {d.metadata.get("id") for d in results}
-
-            # Gather related ids not yet present
-
-            missing_related_ids: set[str] = set()
-            for sdoc in summary_docs:
-                related_list: Iterable[str] = sdoc.metadata.get("related", [])
-                [missing_related_ids.add(rid) for rid in related_list if rid and rid not in existing_ids]
-
+            missing_related_ids: set[str] = {
+                rid
+                for sdoc in summary_docs
+                for rid in sdoc.metadata.get("related", [])
+                if rid and rid not in existing_ids
+            }
             if missing_related_ids:
-                # Heuristic: use the first retriever's underlying vector database for lookup.
-                # All quarks share the same vector database instance in current design.
-                vector_db = None
-                if self._retrievers:
-                    # Access protected member as an implementation detail – acceptable within package.
-                    vector_db = getattr(self._retrievers[0], "_vector_database", None)
-                if vector_db and hasattr(vector_db, "get_documents_by_ids"):
-                    try:
-                        expanded_docs: list[Document] = vector_db.get_documents_by_ids(list(missing_related_ids))
-                        # Merge while preserving original order precedence (append new ones)
-                        results.extend(expanded_docs)
-                        existing_ids.update(d.metadata.get("id") for d in expanded_docs)
-                        logger.debug(
-                            "Summary expansion added %d underlying documents (from %d summaries).",
-                            len(expanded_docs),
-                            len(summary_docs),
-                        )
-                    except Exception:
-                        logger.exception("Failed to expand summary related documents.")
-                else:
-                    logger.debug("Vector database does not expose get_documents_by_ids; skipping summary expansion.")
+                # Merge while preserving original order precedence (append new ones)
+                results.extend(self._expand_summaries(summary_docs, missing_related_ids))
         finally:
             # Remove summaries after expansion step
             results = [x for x in results if x.metadata.get("type") != ContentType.SUMMARY.value]
         return results
 
+    def _expand_summaries(self, summary_docs: list[Document], related_ids: set[str]) -> list[Document]:
+        try:
+            expanded_docs: list[Document] = self._vector_database.get_documents_by_ids(list(related_ids))
+        except Exception:
+            logger.exception("Failed to expand summary related documents.")
+            return []
+
+        # Expanded documents are ranked like the best summary that led to them.
+        summary_scores = self._summary_scores(summary_docs)
+        for doc in expanded_docs:
+            if "score" not in doc.metadata and doc.metadata.get("id") in summary_scores:
+                doc.metadata["score"] = summary_scores[doc.metadata["id"]]
+        logger.debug(
+            "Summary expansion added %d underlying documents (from %d summaries).",
+            len(expanded_docs),
+            len(summary_docs),
+        )
+        return expanded_docs
+
     def _remove_duplicates(self, documents: list[Document]) -> list[Document]:
         """Remove duplicate documents from a list based on their IDs.
 
@@ -205,7 +436,10 @@ class CompositeRetriever(Retriever):
         return unique_docs
 
     def _early_pruning(self, documents: list[Document]) -> list[Document]:
-        """Prune documents early based on certain criteria.
+        """Keep the best ``total_retrieved_k_documents`` documents across all retrievers.
+
+        Documents are ranked by ``metadata["score"]``; documents without a score rank last in their original order.
+        The per-type quotas are filled first, the remaining slots go to the best documents of any type.
 
         Parameters
         ----------
@@ -215,15 +449,112 @@ class CompositeRetriever(Retriever):
         Returns
         -------
         list[Document]
-            The pruned list of documents.
+            The pruned list of documents, ordered by score.
         """
-        # Optional early global pruning (only if configured and more than total_k)
-        if self._total_retrieved_k_documents is not None and len(documents) > self._total_retrieved_k_documents:
-            # If score metadata exists, use it to prune; otherwise keep ordering as-is.
-            if all("score" in d.metadata for d in documents):
-                documents.sort(key=lambda d: d.metadata["score"], reverse=True)
-            return documents[: self._total_retrieved_k_documents]
-        return documents
+        total_k = self._total_retrieved_k_documents
+        if total_k is None or len(documents) <= total_k:
+            return documents
+
+        def rank(index: int) -> tuple[float, int]:
+            score = documents[index].metadata.get("score")
+            return (-score if score is not None else float("inf"), index)
+
+        selected: set[int] = set()
+        for doc_type, quota in self._min_documents_per_type.items():
+            candidates = (i for i, d in enumerate(documents) if d.metadata.get("type") == doc_type)
+            selected.update(heapq.nsmallest(min(quota, total_k), candidates, key=rank))
+        remaining = (i for i in range(len(documents)) if i not in selected)
+        selected.update(heapq.nsmallest(max(total_k - len(selected), 0), remaining, key=rank))
+        return [documents[i] for i in sorted(selected, key=rank)[:total_k]]
+
+    async def _adiversify(self, documents: list[Document]) -> list[Document]:
+        """Remove near-duplicates and optionally select the documents by maximal marginal relevance.
+
+        The documents are compared by their stored dense vectors, which are requested with the search. Documents
+        without a stored vector are kept.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents, ordered by relevance.
+
+        Returns
+        -------
+        list[Document]
+            The documents without near-duplicates. In MMR mode in selection order, otherwise in the input order.
+        """
+        # The vectors come with the search hits; they are removed so they do not end up in the response.
+        vectors = {}
+        for document in documents:
+            vector = document.metadata.pop(VectorDatabase.DENSE_VECTOR_KEY, None)
+            if vector is not None:
+                vectors[document.metadata.get("id")] = vector
+
+        settings = self._diversity_settings
+        if not settings or not settings.enabled or len(documents) < 2:
+            return documents
+
+        vectors |= await self._aload_missing_vectors(documents, vectors)
+        indices = [i for i, d in enumerate(documents) if d.metadata.get("id") in vectors]
+        if len(indices) < 2:
+            return documents
+        matrix = np.asarray([vectors[documents[i].metadata["id"]] for i in indices], dtype=np.float32)
+
+        if settings.max_documents is None:
+            # Keep the order: with full weight on a rank-based relevance the selection order is the input order.
+            relevance = -np.arange(len(indices), dtype=np.float32)
+            chosen = select_diverse(relevance, matrix, 1.0, settings.near_duplicate_threshold, len(indices))
+            kept = {indices[i] for i in chosen} | set(range(len(documents))).difference(indices)
+            result = [d for i, d in enumerate(documents) if i in kept]
+        else:
+            chosen = select_diverse(
+                self._relevance([documents[i] for i in indices]),
+                matrix,
+                settings.mmr_lambda,
+                settings.near_duplicate_threshold,
+                settings.max_documents,
+            )
+            with_vector = set(indices)
+            without_vector = [d for i, d in enumerate(documents) if i not in with_vector]
+            result = ([documents[indices[i]] for i in chosen] + without_vector)[: settings.max_documents]
+
+        if len(result) < len(documents):
+            logger.debug("Diversity filtering kept %d of %d documents.", len(result), len(documents))
+        return result
+
+    async def _aload_missing_vectors(
+        self, documents: list[Document], vectors: dict[str, list[float]]
+    ) -> dict[str, list[float]]:
+        # Related documents of the hits are loaded without vectors.
+        missing_ids = [d.metadata.get("id") for d in documents if d.metadata.get("id") not in vectors]
+        if not missing_ids:
+            return {}
+        try:
+            return await asyncio.to_thread(self._vector_database.get_vectors, missing_ids)
+        except Exception:
+            logger.exception("Failed to load the document vectors; keeping the documents without vector.")
+            return {}
+
+    async def _ahydrate(self, documents: list[Document]) -> list[Document]:
+        """Load the complete metadata of the final documents that were retrieved with a projected payload.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The final documents.
+
+        Returns
+        -------
+        list[Document]
+            The documents with their complete metadata.
+        """
+        try:
+            return await asyncio.to_thread(self._vector_database.hydrate, documents)
+        except Exception:
+            logger.exception("Failed to load the complete metadata of the retrieved documents.")
+            for document in documents:
+                document.metadata.pop(VectorDatabase.PARTIAL_PAYLOAD_KEY, None)
+            return documents
 
     async def _arerank_pruning(
         self,
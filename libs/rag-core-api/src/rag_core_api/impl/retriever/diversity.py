@@ -0,0 +1,53 @@
+"""Vectorized maximal marginal relevance (MMR) selection with near-duplicate removal."""
+
+import numpy as np
+
+
+def select_diverse(
+    relevance: np.ndarray,
+    vectors: np.ndarray,
+    mmr_lambda: float,
+    near_duplicate_threshold: float,
+    max_selected: int,
+) -> list[int]:
+    """
+    Select documents by maximal marginal relevance, skipping near-duplicates of already selected documents.
+
+    Parameters
+    ----------
+    relevance : np.ndarray
+        The relevance of each document, shape ``(n,)``. Higher is better.
+    vectors : np.ndarray
+        The embedding of each document, shape ``(n, dim)``.
+    mmr_lambda : float
+        The trade-off between relevance (1.0) and diversity (0.0).
+    near_duplicate_threshold : float
+        Documents whose cosine similarity to a selected document reaches this value are never selected.
+    max_selected : int
+        The maximal number of selected documents.
+
+    Returns
+    -------
+    list[int]
+        The indices of the selected documents in selection order.
+    """
+    count = len(relevance)
+    if count == 0:
+        return []
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_vectors = vectors / np.where(norms == 0, 1.0, norms)
+    similarity = unit_vectors @ unit_vectors.T
+
+    # Highest similarity of every document to the documents selected so far.
+    max_similarity = np.zeros(count)
+    available = np.ones(count, dtype=bool)
+    selected: list[int] = []
+    while len(selected) < max_selected and available.any():
+        scores = mmr_lambda * relevance - (1.0 - mmr_lambda) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        max_similarity = np.maximum(max_similarity, similarity[best])
+        available &= max_similarity < near_duplicate_threshold
+    return selected
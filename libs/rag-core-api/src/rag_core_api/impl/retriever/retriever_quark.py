@@ -24,9 +24,15 @@ class RetrieverQuark(Retriever):
     ----------
     TYPE_KEY : str
         The key used for the type of content in filter_kwargs.
+    K_FACTOR_KEY : str
+        The key of the optional factor in the config metadata the number of retrieved documents is scaled with.
+    WITH_VECTORS_KEY : str
+        The key of the optional flag in the config metadata requesting the stored dense vectors with the hits.
     """
 
     TYPE_KEY = "type"
+    K_FACTOR_KEY = "k_factor"
+    WITH_VECTORS_KEY = "with_vectors"
 
     def __init__(
         self,
@@ -34,6 +40,8 @@ class RetrieverQuark(Retriever):
         retriever_type: ContentType,
         k: int = 10,
         threshold: float = 0.3,
+        search_params: Optional[dict] = None,
+        payload_projection: Optional[dict] = None,
         **kwargs,
     ):
         """
@@ -49,6 +57,11 @@ class RetrieverQuark(Retriever):
             The number of top results to retrieve (default 10).
         threshold : float, optional
             The score threshold for filtering results (default 0.3).
+        search_params : Optional[dict]
+            The ANN search parameters, e.g. ``hnsw_ef`` or ``exact`` (default None, meaning the database defaults).
+        payload_projection : Optional[dict]
+            The metadata fields returned with search hits as ``{"include": [...]}`` or ``{"exclude": [...]}``
+            (default None, meaning the complete metadata).
         **kwargs
             Additional keyword arguments to pass to the superclass initializer.
         """
@@ -58,10 +71,26 @@ class RetrieverQuark(Retriever):
             "k": k,
             "score_threshold": threshold,
         }
+        if search_params:
+            self._search_kwargs["search_params"] = search_params
+        if payload_projection:
+            self._search_kwargs["payload_projection"] = payload_projection
         self._filter_kwargs = {
             self.TYPE_KEY: retriever_type.value,
         }
 
+    @property
+    def content_type(self) -> ContentType:
+        """
+        Return the type of content retrieved by this retriever.
+
+        Returns
+        -------
+        ContentType
+            The type of content retrieved by this retriever.
+        """
+        return ContentType(self._filter_kwargs[self.TYPE_KEY])
+
     def verify_readiness(self) -> None:
         """
         Verify the readiness of the vector database.
@@ -93,12 +122,35 @@ class RetrieverQuark(Retriever):
         list[Document]
             A list of Document objects retrieved based on the input and configuration.
         """
-        config = ensure_config(config)
         self.verify_readiness()
-        if self.TYPE_KEY not in config["metadata"]["filter_kwargs"].keys():
-            config["metadata"]["filter_kwargs"] = config["metadata"]["filter_kwargs"] | self._filter_kwargs
+        search_kwargs, filter_kwargs = self.search_arguments(config)
         return await self._vector_database.asearch(
             query=retriever_input,
-            search_kwargs=self._search_kwargs,
-            filter_kwargs=config["metadata"]["filter_kwargs"],
+            search_kwargs=search_kwargs,
+            filter_kwargs=filter_kwargs,
         )
+
+    def search_arguments(self, config: Optional[RunnableConfig] = None) -> tuple[dict, dict]:
+        """
+        Build the search and filter kwargs of this retriever for the given configuration.
+
+        Parameters
+        ----------
+        config : Optional[RunnableConfig]
+            The configuration for the retrieval process (default None).
+
+        Returns
+        -------
+        tuple[dict, dict]
+            The search kwargs and the filter kwargs passed to the vector database.
+        """
+        config = ensure_config(config)
+        if self.TYPE_KEY not in config["metadata"]["filter_kwargs"].keys():
+            config["metadata"]["filter_kwargs"] = config["metadata"]["filter_kwargs"] | self._filter_kwargs
+        search_kwargs = self._search_kwargs
+        k_factor = config["metadata"].get(self.K_FACTOR_KEY)
+        if k_factor:
+            search_kwargs = search_kwargs | {"k": max(1, int(search_kwargs["k"] * k_factor))}
+        if config["metadata"].get(self.WITH_VECTORS_KEY):
+            search_kwargs = search_kwargs | {"with_vectors": True}
+        return search_kwargs, config["metadata"]["filter_kwargs"]
@@ -0,0 +1,183 @@
+"""Module for the SessionContextRetriever class."""
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
+
+from rag_core_api.embeddings.embedder import Embedder
+from rag_core_api.impl.settings.session_context_settings import SessionContextSettings
+from rag_core_api.reranking.reranker import Reranker
+from rag_core_api.retriever.retriever import Retriever
+from rag_core_lib.impl.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _SessionContext:
+    question: str
+    query_embedding: Optional[list[float]]
+    filter_kwargs: dict
+    documents: list[Document]
+
+
+class SessionContextRetriever(Retriever):
+    """Retriever that reuses the documents of the previous turn of a chat session for follow-up questions.
+
+    The documents retrieved for a session are kept in a bounded cache with a time to live. If the embedding of
+    a follow-up question is close to the one of the previous question, the cached documents are reranked
+    against the new question. Only if they score poorly, the wrapped retriever is invoked.
+
+    Questions are only embedded for this comparison if the session has cached documents; the first question of a
+    session is embedded together with its follow-up.
+
+    Attributes
+    ----------
+    SESSION_ID_KEY : str
+        The key of the session id in the metadata of the config.
+    FILTER_KWARGS_KEY : str
+        The key of the filter kwargs in the metadata of the config.
+    """
+
+    SESSION_ID_KEY = "session_id"
+    FILTER_KWARGS_KEY = "filter_kwargs"
+
+    def __init__(
+        self,
+        retriever: Retriever,
+        embedder: Embedder,
+        reranker: Optional[Reranker],
+        reranker_enabled: bool,
+        settings: SessionContextSettings,
+        **kwargs,
+    ):
+        """
+        Initialize the SessionContextRetriever.
+
+        Parameters
+        ----------
+        retriever : Retriever
+            The retriever used for a full retrieval.
+        embedder : Embedder
+            The embedder used to embed the questions.
+        reranker : Optional[Reranker]
+            The reranker used to score the cached documents against a follow-up question.
+        reranker_enabled : bool
+            A flag indicating whether the reranker is enabled.
+        settings : SessionContextSettings
+            The settings of the session context cache.
+        **kwargs : dict
+            Additional keyword arguments to be passed to the superclass initializer.
+        """
+        super().__init__(**kwargs)
+        self._retriever = retriever
+        self._embedder = embedder
+        self._reranker = reranker
+        self._reranker_enabled = reranker_enabled
+        self._settings = settings
+        self._cache: TTLCache[str, _SessionContext] = TTLCache(
+            max_size=settings.max_sessions,
+            ttl_seconds=settings.ttl_seconds,
+        )
+
+    def verify_readiness(self) -> None:
+        """Verify the readiness of the wrapped retriever."""
+        self._retriever.verify_readiness()
+
+    async def ainvoke(
+        self,
+        retriever_input: str,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        """
+        Asynchronously retrieve the documents for the input, reusing the documents of the previous turn if possible.
+
+        Parameters
+        ----------
+        retriever_input : str
+            The (rephrased) question.
+        config : Optional[RunnableConfig]
+            The configuration of the retrieval. The session id is read from its metadata (default None).
+        **kwargs : Any
+            Additional keyword arguments.
+
+        Returns
+        -------
+        list[Document]
+            The retrieved documents.
+        """
+        # The config is forwarded as is: the composite retriever deep-copies it for every quark.
+        metadata = (config or {}).get("metadata") or {}
+        session_id = metadata.get(self.SESSION_ID_KEY)
+        if not self._settings.enabled or not session_id:
+            return await self._retriever.ainvoke(retriever_input, config=config)
+
+        filter_kwargs = dict(metadata.get(self.FILTER_KWARGS_KEY) or {})
+        query_embedding = None
+
+        cached_context = self._cache.get(session_id)
+        if cached_context is not None and cached_context.filter_kwargs == filter_kwargs:
+            query_embedding, previous_embedding = await self._aembed_questions(retriever_input, cached_context)
+            documents = await self._areuse_context(
+                cached_context, retriever_input, _cosine_similarity(query_embedding, previous_embedding), config
+            )
+            if documents:
+                logger.debug("Reusing %d documents of the previous turn of session %s.", len(documents), session_id)
+                return documents
+
+        documents = await self._retriever.ainvoke(retriever_input, config=config)
+        if documents:
+            self._cache.put(
+                session_id, _SessionContext(retriever_input, query_embedding, filter_kwargs, list(documents))
+            )
+        else:
+            self._cache.pop(session_id)
+        return documents
+
+    async def _aembed_questions(
+        self, retriever_input: str, cached_context: _SessionContext
+    ) -> tuple[list[float], list[float]]:
+        embedder = self._embedder.get_embedder()
+        if cached_context.query_embedding is not None:
+            return await embedder.aembed_query(retriever_input), cached_context.query_embedding
+        query_embedding, previous_embedding = await asyncio.gather(
+            embedder.aembed_query(retriever_input), embedder.aembed_query(cached_context.question)
+        )
+        return query_embedding, previous_embedding
+
+    async def _areuse_context(
+        self,
+        cached_context: _SessionContext,
+        retriever_input: str,
+        similarity: float,
+        config: Optional[RunnableConfig],
+    ) -> list[Document]:
+        if similarity < self._settings.similarity_threshold:
+            return []
+        if not self._reranker or not self._reranker_enabled:
+            return list(cached_context.documents)
+
+        try:
+            reranked = await self._reranker.ainvoke((list(cached_context.documents), retriever_input), config=config)
+        except Exception:
+            logger.exception("Reranking the cached session documents failed; running a full retrieval.")
+            return []
+        best_score = max((d.metadata.get("relevance_score", 0.0) for d in reranked), default=None)
+        if best_score is None or best_score < self._settings.min_relevance_score:
+            return []
+        return reranked
+
+
+def _cosine_similarity(a: list[float], b: list[float]) -> float:
+    if len(a) != len(b):
+        return -1.0
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if not norm:
+        return -1.0
+    return sum(x * y for x, y in zip(a, b)) / norm
@@ -0,0 +1,25 @@
+"""Module that contains settings regarding the batch chat endpoint."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class BatchChatSettings(BaseSettings):
+    """Contains settings regarding the batch chat endpoint.
+
+    Attributes
+    ----------
+    max_batch_size : int
+        The maximum number of chat requests in one batch (default 500).
+    max_concurrency : int
+        The maximum number of chat requests of a batch that are answered concurrently (default 8).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "BATCH_CHAT_"
+        case_sensitive = False
+
+    max_batch_size: int = Field(default=500, gt=0)
+    max_concurrency: int = Field(default=8, gt=0)
@@ -0,0 +1,31 @@
+"""Module that contains settings regarding the LLMs of the auxiliary chains."""
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ChainLlmSettings(BaseSettings):
+    """Contains settings regarding the models used by the auxiliary chains.
+
+    The auxiliary chains use the provider settings of the configured LLM type; only the model is replaced.
+
+    Attributes
+    ----------
+    rephrasing_model : Optional[str]
+        The model used for rephrasing the question. Uses the answer generation model if not set
+        or empty (default None).
+    language_detection_model : Optional[str]
+        The model used for detecting the language of the question. Uses the answer generation model if not set
+        or empty (default None).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "CHAIN_LLM_"
+        case_sensitive = False
+
+    rephrasing_model: Optional[str] = Field(default=None)
+    language_detection_model: Optional[str] = Field(default=None)
@@ -0,0 +1,33 @@
+"""Module that contains settings regarding the latency budget of a chat request."""
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ChatDeadlineSettings(BaseSettings):
+    """Contains settings regarding the end-to-end latency budget of a chat request.
+
+    Attributes
+    ----------
+    timeout_seconds : Optional[float]
+        The time budget of a chat request in seconds. No deadline is applied if not set (default None).
+    reduced_k_remaining_seconds : float
+        If less time than this is left when retrieval starts, every retriever fetches fewer documents (default 6).
+    reduced_k_factor : float
+        The factor the number of documents per retriever is multiplied with when the budget is low (default 0.5).
+    skip_reranking_remaining_seconds : float
+        If less time than this is left after the vector search, reranking is skipped (default 3).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "CHAT_DEADLINE_"
+        case_sensitive = False
+
+    timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    reduced_k_remaining_seconds: float = Field(default=6.0, ge=0)
+    reduced_k_factor: float = Field(default=0.5, gt=0, le=1)
+    skip_reranking_remaining_seconds: float = Field(default=3.0, ge=0)
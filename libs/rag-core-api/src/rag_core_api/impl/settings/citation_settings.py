@@ -0,0 +1,31 @@
+"""Module that contains settings regarding the citations of chat responses."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CitationSettings(BaseSettings):
+    """Contains settings regarding the citations of chat responses.
+
+    Attributes
+    ----------
+    compact_metadata_keys : list[str]
+        The metadata fields of compact citations
+        (default ["id", "type", "document", "title", "page", "document_url", "image_id"]).
+    snippet_length : int
+        The maximal number of characters of the page content of compact citations (default 200).
+    max_fetch_ids : int
+        The maximal number of information pieces fetched by ID in one request (default 100).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "CITATION_"
+        case_sensitive = False
+
+    compact_metadata_keys: list[str] = Field(
+        default_factory=lambda: ["id", "type", "document", "title", "page", "document_url", "image_id"]
+    )
+    snippet_length: int = Field(default=200, gt=0)
+    max_fetch_ids: int = Field(default=100, gt=0)
@@ -0,0 +1,29 @@
+"""Module that contains settings regarding the two-stage coarse-to-fine retrieval."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CoarseToFineSettings(BaseSettings):
+    """Contains settings regarding the two-stage coarse-to-fine retrieval.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the summaries are searched first and the chunk search is restricted to the documents of the best
+        summaries (default False).
+    top_documents : int
+        The number of distinct documents the chunk search is restricted to (default 5).
+    document_key : str
+        The metadata key identifying the document a summary or chunk belongs to (default "document").
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "COARSE_TO_FINE_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    top_documents: int = Field(default=5, gt=0)
+    document_key: str = Field(default="document")
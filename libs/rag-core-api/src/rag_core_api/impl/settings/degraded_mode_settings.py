@@ -0,0 +1,36 @@
+"""Module that contains settings regarding the degraded extractive-answer mode."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class DegradedModeSettings(BaseSettings):
+    """Contains settings regarding the extractive fallback answer used when the LLM is overloaded.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the extractive fallback answer is used (default False).
+    max_concurrent_generations : int
+        The maximum number of concurrent answer generations per worker. Further requests receive an
+        extractive answer (default 16).
+    min_remaining_seconds : float
+        If less time than this is left for the request after retrieval, an extractive answer is returned
+        instead of calling the LLM (default 5).
+    max_passages : int
+        The maximum number of passages the extractive answer consists of (default 3).
+    finish_reason : str
+        The finish reason flagging an extractive answer (default "DegradedExtractiveAnswer").
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "DEGRADED_MODE_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    max_concurrent_generations: int = Field(default=16, gt=0)
+    min_remaining_seconds: float = Field(default=5.0, ge=0)
+    max_passages: int = Field(default=3, gt=0)
+    finish_reason: str = Field(default="DegradedExtractiveAnswer")
@@ -0,0 +1,35 @@
+"""Module that contains settings regarding the diversity filtering of retrieved documents."""
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class DiversitySettings(BaseSettings):
+    """Contains settings regarding the diversity filtering of retrieved documents.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether near-duplicates are removed from the retrieved documents before generation (default False).
+    near_duplicate_threshold : float
+        The cosine similarity from which a document counts as a near-duplicate of a better one (default 0.95).
+    mmr_lambda : float
+        The trade-off between relevance (1.0) and diversity (0.0) of the maximal marginal relevance
+        selection (default 0.7).
+    max_documents : Optional[int]
+        The number of documents selected by maximal marginal relevance (default None, meaning only near-duplicates
+        are removed and the order is kept).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "DIVERSITY_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    near_duplicate_threshold: float = Field(default=0.95, gt=0.0, le=1.0)
+    mmr_lambda: float = Field(default=0.7, ge=0.0, le=1.0)
+    max_documents: Optional[int] = Field(default=None, gt=0)
@@ -20,6 +20,8 @@ class ErrorMessages(BaseSettings):
         Default message when no answer is found with the given context.
     empty_message : str
         Default message when an empty question is provided.
+    deadline_exceeded : str
+        Default message when no answer could be generated within the time budget of the request.
     """
 
     class Config:
@@ -44,3 +46,7 @@ class ErrorMessages(BaseSettings):
     )
 
     empty_message: str = Field(default="Es tut mir leid, ich kann keine leere Frage beantworten.")
+
+    deadline_exceeded: str = Field(
+        default="Es tut mir leid, ich konnte Ihre Frage nicht rechtzeitig beantworten. Bitte versuchen Sie es erneut."
+    )
@@ -0,0 +1,26 @@
+"""Module that contains settings regarding the storage of image payloads in the object storage."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ImageStorageSettings(BaseSettings):
+    """Contains settings regarding the storage of image payloads in the object storage.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the images of uploaded image pieces are stored in the object storage and only referenced in the
+        vector database (default False). Requires the ``S3_`` settings.
+    prefix : str
+        The key prefix of the images in the bucket (default "citation-images/").
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "IMAGE_STORAGE_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    prefix: str = Field(default="citation-images/")
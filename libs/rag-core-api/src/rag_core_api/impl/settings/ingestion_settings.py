@@ -0,0 +1,41 @@
+"""Module that contains settings regarding the ingestion of information pieces."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class IngestionSettings(BaseSettings):
+    """Contains settings regarding the ingestion of information pieces.
+
+    Attributes
+    ----------
+    max_workers : int
+        The number of uploads that are embedded and upserted concurrently, outside of the event loop (default 2).
+    max_pending_jobs : int
+        The number of background upload jobs that may wait for a worker; further jobs are rejected (default 100).
+    max_tracked_jobs : int
+        The number of background upload jobs whose status is kept; the least recently used are dropped first
+        (default 10000).
+    job_ttl_seconds : float
+        How long the status of a background upload job is kept after it was last updated (default 86400).
+    stream_batch_size : int
+        The number of information pieces of a streaming upload that are embedded and upserted together (default 64).
+    stream_max_in_flight_batches : int
+        The number of batches of a streaming upload that are uploaded while the next batch is received (default 2).
+    stream_max_line_bytes : int
+        The maximum size of one information piece of a streaming upload (default 33554432).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "INGESTION_"
+        case_sensitive = False
+
+    max_workers: int = Field(default=2, gt=0)
+    max_pending_jobs: int = Field(default=100, gt=0)
+    max_tracked_jobs: int = Field(default=10000, gt=0)
+    job_ttl_seconds: float = Field(default=86400, gt=0)
+    stream_batch_size: int = Field(default=64, gt=0)
+    stream_max_in_flight_batches: int = Field(default=2, gt=0)
+    stream_max_line_bytes: int = Field(default=32 * 1024 * 1024, gt=0)
@@ -0,0 +1,29 @@
+"""Module that contains settings regarding the Qdrant read replicas."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class QdrantReadPoolSettings(BaseSettings):
+    """Contains settings regarding the Qdrant endpoints searches are spread across.
+
+    Attributes
+    ----------
+    locations : list[str]
+        The locations of the Qdrant read replicas. Searches use the primary (VECTOR_DB_LOCATION) if empty
+        (default []).
+    max_failures : int
+        The number of consecutive failures after which a replica is ejected (default 3).
+    ejection_seconds : float
+        The time an ejected replica is skipped before it is health checked again (default 30).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "VECTOR_DB_READ_"
+        case_sensitive = False
+
+    locations: list[str] = Field(default_factory=list)
+    max_failures: int = Field(default=3, gt=0)
+    ejection_seconds: float = Field(default=30.0, ge=0)
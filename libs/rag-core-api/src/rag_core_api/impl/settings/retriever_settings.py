@@ -8,6 +8,8 @@ For backward compatibility, those legacy names are still accepted if the canonic
 `RETRIEVER_TOTAL_K_DOCUMENTS` is not set.
 """
 
+from typing import Optional
+
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings
 
@@ -33,6 +35,39 @@ class RetrieverSettings(BaseSettings):
         The threshold value for image retrieval (default 0.5).
     image_k_documents : int
         The number of image documents to retrieve (default 10).
+    text_min_documents : int
+        The number of text documents kept by the global cap if retrieved, regardless of other scores (default 0).
+    table_min_documents : int
+        The number of table documents kept by the global cap if retrieved, regardless of other scores (default 0).
+    image_min_documents : int
+        The number of image documents kept by the global cap if retrieved, regardless of other scores (default 0).
+    hnsw_ef : Optional[int]
+        The size of the HNSW candidate list at search time; larger is more accurate and slower
+        (default None, meaning the collection default).
+    exact : bool
+        Whether to search exhaustively instead of using the ANN index (default False).
+    indexed_only : bool
+        Whether to skip segments that are not indexed yet (default False).
+    quantization_rescore : Optional[bool]
+        Whether candidates found on quantized vectors are rescored with the original vectors
+        (default None, meaning the collection default).
+    quantization_oversampling : Optional[float]
+        How many more candidates than requested are fetched from quantized vectors before rescoring
+        (default None, meaning the collection default).
+    search_params_by_type : dict[str, dict]
+        Overrides of the search parameters above per content type, e.g. ``{"TABLE": {"hnsw_ef": 256}}``
+        (default {}).
+    payload_include_fields : list[str]
+        The metadata fields returned with search hits; the fields needed during retrieval are always returned
+        (default [], meaning all fields).
+    payload_exclude_fields : list[str]
+        The metadata fields left out of search hits, e.g. ``["base64_image"]``. Ignored if include fields are set
+        (default []).
+    payload_projection_by_type : dict[str, dict]
+        Projections replacing the ones above per content type, e.g. ``{"IMAGE": {"exclude": ["base64_image"]}}``
+        (default {}).
+
+    The fields left out of the search hits are loaded for the final documents only.
     """
 
     class Config:
@@ -49,6 +84,18 @@ class RetrieverSettings(BaseSettings):
     summary_k_documents: int = Field(default=10)
     image_threshold: float = Field(default=0.5)
     image_k_documents: int = Field(default=10)
+    text_min_documents: int = Field(default=0)
+    table_min_documents: int = Field(default=0)
+    image_min_documents: int = Field(default=0)
+    hnsw_ef: Optional[int] = Field(default=None, gt=0)
+    exact: bool = Field(default=False)
+    indexed_only: bool = Field(default=False)
+    quantization_rescore: Optional[bool] = Field(default=None)
+    quantization_oversampling: Optional[float] = Field(default=None, ge=1.0)
+    search_params_by_type: dict[str, dict] = Field(default_factory=dict)
+    payload_include_fields: list[str] = Field(default_factory=list)
+    payload_exclude_fields: list[str] = Field(default_factory=list)
+    payload_projection_by_type: dict[str, dict] = Field(default_factory=dict)
     # Canonical global cap (previously RETRIEVER_TOTAL_K / RETRIEVER_OVERALL_K_DOCUMENTS).
     # Accept legacy env var names as fallbacks via validation alias choices.
     total_k_documents: int = Field(
@@ -59,3 +106,48 @@ class RetrieverSettings(BaseSettings):
             "OVERALL_K_DOCUMENTS",  # legacy -> RETRIEVER_OVERALL_K_DOCUMENTS
         ),
     )
+
+    def search_params(self, content_type: str) -> dict:
+        """
+        Return the search parameters for a content type.
+
+        Parameters
+        ----------
+        content_type : str
+            The content type, e.g. ``"TEXT"``.
+
+        Returns
+        -------
+        dict
+            The search parameters that are set, with the overrides of the content type applied.
+        """
+        search_params = {
+            "hnsw_ef": self.hnsw_ef,
+            "exact": self.exact or None,
+            "indexed_only": self.indexed_only or None,
+            "quantization_rescore": self.quantization_rescore,
+            "quantization_oversampling": self.quantization_oversampling,
+        } | self.search_params_by_type.get(content_type, {})
+        return {key: value for key, value in search_params.items() if value is not None}
+
+    def payload_projection(self, content_type: str) -> dict:
+        """
+        Return the payload projection for a content type.
+
+        Parameters
+        ----------
+        content_type : str
+            The content type, e.g. ``"TEXT"``.
+
+        Returns
+        -------
+        dict
+            Either ``{"include": [...]}``, ``{"exclude": [...]}`` or ``{}`` for the complete payload.
+        """
+        if content_type in self.payload_projection_by_type:
+            return self.payload_projection_by_type[content_type]
+        if self.payload_include_fields:
+            return {"include": self.payload_include_fields}
+        if self.payload_exclude_fields:
+            return {"exclude": self.payload_exclude_fields}
+        return {}
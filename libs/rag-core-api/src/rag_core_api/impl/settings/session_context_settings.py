@@ -0,0 +1,37 @@
+"""Module that contains settings regarding the session-scoped context reuse."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SessionContextSettings(BaseSettings):
+    """
+    Contains settings regarding the reuse of the previously retrieved documents of a chat session.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the documents of the previous turn are reused for follow-up questions (default False).
+    max_sessions : int
+        The maximum number of sessions whose documents are kept in memory (default 1000).
+    ttl_seconds : float
+        The time in seconds after which the documents of a session are discarded (default 900).
+    similarity_threshold : float
+        The minimal cosine similarity between the current and the previous query embedding for the cached
+        documents to be considered (default 0.85).
+    min_relevance_score : float
+        The minimal reranker score the best cached document has to reach, otherwise a full retrieval is run
+        (default 0.3).
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "SESSION_CONTEXT_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    max_sessions: int = Field(default=1000, gt=0)
+    ttl_seconds: float = Field(default=900.0, gt=0)
+    similarity_threshold: float = Field(default=0.85, ge=-1.0, le=1.0)
+    min_relevance_score: float = Field(default=0.3)
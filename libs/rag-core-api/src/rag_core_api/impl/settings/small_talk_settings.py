@@ -0,0 +1,83 @@
+"""Module that contains settings regarding the handling of small talk."""
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SmallTalkSettings(BaseSettings):
+    """Contains settings regarding messages that are answered without retrieval.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether greetings, thanks, farewells and questions about the assistant skip retrieval (default False).
+    max_words : int
+        Messages with more words are never treated as small talk (default 12).
+    finish_reason : str
+        The finish reason of a small talk response (default "SmallTalk").
+    default_language : str
+        The language of the response if the language of the message has no response of its own (default "en").
+    greeting_response : dict[str, str]
+        The response to a greeting, per ISO 639-1 language code.
+    thanks_response : dict[str, str]
+        The response to an expression of thanks, per language.
+    goodbye_response : dict[str, str]
+        The response to a farewell, per language.
+    meta_response : dict[str, str]
+        The response to a question about the assistant itself, per language.
+    """
+
+    class Config:
+        """Config class for reading Fields from env."""
+
+        env_prefix = "SMALL_TALK_"
+        case_sensitive = False
+
+    enabled: bool = Field(default=False)
+    max_words: int = Field(default=12, gt=0)
+    finish_reason: str = Field(default="SmallTalk")
+    default_language: str = Field(default="en")
+    greeting_response: dict[str, str] = Field(
+        default={"en": "Hello! How can I help you?", "de": "Hallo! Wie kann ich Ihnen helfen?"}
+    )
+    thanks_response: dict[str, str] = Field(
+        default={
+            "en": "You're welcome! Do you have any other questions?",
+            "de": "Gern geschehen! Haben Sie noch weitere Fragen?",
+        }
+    )
+    goodbye_response: dict[str, str] = Field(default={"en": "Goodbye!", "de": "Auf Wiedersehen!"})
+    meta_response: dict[str, str] = Field(
+        default={
+            "en": (
+                "I am an assistant that answers questions based on the provided documents. "
+                "Feel free to ask me a question about these documents."
+            ),
+            "de": (
+                "Ich bin ein Assistent, der Fragen auf Basis der bereitgestellten Dokumente beantwortet. "
+                "Stellen Sie mir gerne eine Frage zu diesen Dokumenten."
+            ),
+        }
+    )
+
+    def response(self, responses: dict[str, str], language: Optional[str]) -> str:
+        """
+        Pick the response in the given language.
+
+        Parameters
+        ----------
+        responses : dict[str, str]
+            The responses per language.
+        language : Optional[str]
+            The language of the message, if known.
+
+        Returns
+        -------
+        str
+            The response in the language of the message, else in the default language, else any response.
+        """
+        if language in responses:
+            return responses[language]
+        return responses.get(self.default_language) or next(iter(responses.values()), "")
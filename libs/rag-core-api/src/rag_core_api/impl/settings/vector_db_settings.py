@@ -5,6 +5,8 @@ from pydantic import Field
 
 from langchain_qdrant import RetrievalMode
 
+from rag_core_api.impl.vector_databases.tenancy_mode import TenancyMode
+
 
 class VectorDatabaseSettings(BaseSettings):
     """
@@ -16,6 +18,13 @@ class VectorDatabaseSettings(BaseSettings):
         The name of the collection.
     url : str
         The URL of the vector database.
+    payload_index_fields : list[str]
+        The metadata fields a keyword payload index is created for, to speed up filtered searches
+        (default ["type", "document", "source", "tags", "tenant_id"]).
+    tenancy : TenancyMode
+        How tenants are separated: by payload filter in one collection or by custom shard keys (default none).
+    default_tenant : str
+        The tenant of uploads and requests that do not name one, used with shard keys (default "default").
     """
 
     class Config:
@@ -30,3 +39,6 @@ class VectorDatabaseSettings(BaseSettings):
         default=False
     )  # if true and collection does not exist, an error will be raised
     retrieval_mode: RetrievalMode = Field(default=RetrievalMode.HYBRID)
+    payload_index_fields: list[str] = Field(default_factory=lambda: ["type", "document", "source", "tags", "tenant_id"])
+    tenancy: TenancyMode = Field(default=TenancyMode.NONE)
+    default_tenant: str = Field(default="default")
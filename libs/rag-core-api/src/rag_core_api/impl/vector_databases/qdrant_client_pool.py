@@ -0,0 +1,139 @@
+"""Module containing the QdrantClientPool class."""
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional, TypeVar
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+from rag_core_api.impl.settings.qdrant_read_pool_settings import QdrantReadPoolSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _is_replica_failure(error: Exception) -> bool:
+    # Transport errors (wrapped by the REST client in ResponseHandlingException) and server errors mean the replica is
+    # unhealthy. Client errors (e.g. a bad filter or a missing collection) would fail on every replica, so they are no
+    # reason to fail over.
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code is None or error.status_code >= 500
+    return isinstance(error, (ResponseHandlingException, ConnectionError, TimeoutError))
+
+
+@dataclass
+class _Endpoint:
+    location: str
+    client: QdrantClient
+    consecutive_failures: int = 0
+    ejected_until: float = field(default=0.0)
+
+
+class QdrantClientPool:
+    """Spreads read requests round-robin across Qdrant replicas.
+
+    A replica that fails ``max_failures`` times in a row is ejected for ``ejection_seconds``. Afterwards it is
+    health checked before it receives requests again. A failed request is retried on the next replica; if no
+    replica is available or all fail, the request goes to the primary client. Only transport errors and server
+    errors count as failures of a replica; any other error is raised immediately.
+    """
+
+    def __init__(
+        self,
+        settings: QdrantReadPoolSettings,
+        client_factory: Optional[Callable[[str], QdrantClient]] = None,
+    ):
+        """
+        Initialize the QdrantClientPool.
+
+        Parameters
+        ----------
+        settings : QdrantReadPoolSettings
+            The settings of the read replicas.
+        client_factory : Callable[[str], QdrantClient], optional
+            Creates the client of a location (default creates a QdrantClient).
+        """
+        client_factory = client_factory or (lambda location: QdrantClient(location=location))
+        self._settings = settings
+        self._endpoints = [_Endpoint(location, client_factory(location)) for location in settings.locations]
+        self._round_robin = itertools.cycle(range(len(self._endpoints))) if self._endpoints else None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of replicas."""
+        return len(self._endpoints)
+
+    def execute(self, operation: Callable[[QdrantClient], T], primary: QdrantClient) -> T:
+        """
+        Run a read operation on a healthy replica, failing over to the other replicas and finally the primary.
+
+        Parameters
+        ----------
+        operation : Callable[[QdrantClient], T]
+            The read operation.
+        primary : QdrantClient
+            The client of the primary, used if no replica can serve the request.
+
+        Returns
+        -------
+        T
+            The result of the operation.
+
+        Raises
+        ------
+        Exception
+            Any error of the operation that is not a transport or server error, without trying another replica.
+        """
+        for endpoint in self._candidates():
+            try:
+                result = operation(endpoint.client)
+            except Exception as e:
+                if not _is_replica_failure(e):
+                    raise
+                logger.warning("Read from Qdrant replica %s failed.", endpoint.location, exc_info=True)
+                self._record_failure(endpoint)
+                continue
+            self._record_success(endpoint)
+            return result
+        return operation(primary)
+
+    def _candidates(self) -> list[_Endpoint]:
+        if not self._endpoints:
+            return []
+        with self._lock:
+            start = next(self._round_robin)
+        ordered = self._endpoints[start:] + self._endpoints[:start]
+        now = time.monotonic()
+        return [endpoint for endpoint in ordered if endpoint.ejected_until <= now and self._healthy(endpoint)]
+
+    def _healthy(self, endpoint: _Endpoint) -> bool:
+        if endpoint.consecutive_failures < self._settings.max_failures:
+            return True
+        # Ejection expired: probe the replica before sending real traffic again.
+        try:
+            endpoint.client.get_collections()
+        except Exception:
+            self._record_failure(endpoint)
+            return False
+        logger.info("Qdrant replica %s is healthy again.", endpoint.location)
+        self._record_success(endpoint)
+        return True
+
+    def _record_success(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.consecutive_failures = 0
+            endpoint.ejected_until = 0.0
+
+    def _record_failure(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self._settings.max_failures:
+                endpoint.ejected_until = time.monotonic() + self._settings.ejection_seconds
+                logger.warning(
+                    "Ejecting Qdrant replica %s for %.0fs.", endpoint.location, self._settings.ejection_seconds
+                )
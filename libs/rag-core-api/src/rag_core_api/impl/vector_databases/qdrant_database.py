@@ -1,32 +1,61 @@
 """Module containing the QdrantDatabase class."""
 
+import asyncio
 import logging
+import threading
+import uuid
+from collections import defaultdict
+from typing import Callable, Optional, TypeVar
 
 from langchain_core.documents import Document
-from langchain_qdrant import QdrantVectorStore, SparseEmbeddings
+from langchain_core.runnables.config import run_in_executor
+from langchain_qdrant import QdrantVectorStore, RetrievalMode, SparseEmbeddings
+from qdrant_client import QdrantClient
 from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.models import FieldCondition, Filter, MatchValue
 
 from rag_core_api.embeddings.embedder import Embedder
 from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
-from rag_core_api.vector_databases.vector_database import VectorDatabase
+from rag_core_api.impl.vector_databases.qdrant_client_pool import QdrantClientPool
+from rag_core_api.impl.vector_databases.tenancy_mode import TenancyMode
+from rag_core_api.vector_databases.vector_database import BatchSearchResult, VectorDatabase
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class QdrantDatabase(VectorDatabase):
     """
     A class representing the interface to the Qdrant database.
 
     Inherits from VectorDatabase.
+
+    Attributes
+    ----------
+    REQUIRED_PAYLOAD_FIELDS : tuple[str, ...]
+        The metadata fields every search hit is returned with, since retrieval relies on them.
+    UPSERT_BATCH_SIZE : int
+        The number of points with precomputed vectors upserted per request.
+    MAX_RRF_SCORE : float
+        The score of a point ranked first by both the dense and the sparse search of a hybrid search. Qdrant
+        fuses the two searches by reciprocal rank with the ranking constant 2, i.e. ``1 / (2 + rank)`` per search.
     """
 
+    REQUIRED_PAYLOAD_FIELDS = ("id", "type", "related", "document")
+    UPSERT_BATCH_SIZE = 64
+    MAX_RRF_SCORE = 1.0
+
     def __init__(
         self,
         settings: VectorDatabaseSettings,
         embedder: Embedder,
         sparse_embedder: SparseEmbeddings,
         vectorstore: QdrantVectorStore,
+        client_pool: Optional[QdrantClientPool] = None,
+        embedding_model: Optional[str] = None,
+        sparse_embedding_model: Optional[str] = None,
     ):
         """
         Initialize the Qdrant database.
@@ -39,6 +68,15 @@ class QdrantDatabase(VectorDatabase):
             The embedder used to convert chunks into vector representations.
         vectorstore : Qdrant
             The Qdrant vector store instance.
+        client_pool : Optional[QdrantClientPool]
+            The read replicas searches are spread across (default None, meaning all requests go to the primary).
+            Writes always go to the primary.
+        embedding_model : Optional[str]
+            The ID of the dense embedding model; precomputed dense vectors must name it (default None, meaning
+            precomputed dense vectors are rejected).
+        sparse_embedding_model : Optional[str]
+            The ID of the sparse embedding model; precomputed sparse vectors must name it (default None, meaning
+            precomputed sparse vectors are rejected).
         """
         super().__init__(
             settings=settings,
@@ -46,6 +84,13 @@ class QdrantDatabase(VectorDatabase):
             vectorstore=vectorstore,
             sparse_embedder=sparse_embedder,
         )
+        self._shard_keys: set[str] = set()
+        self._client_pool = client_pool
+        self._embedding_model = embedding_model
+        self._sparse_embedding_model = sparse_embedding_model
+        self._payload_indexes_created = False
+        # Uploads run concurrently on the ingestion worker pool; only one of them may create the collection.
+        self._collection_lock = threading.Lock()
 
     @property
     def collection_available(self):
@@ -53,34 +98,77 @@ class QdrantDatabase(VectorDatabase):
         Check if the collection is available and has points.
 
         This property checks if the collection specified by the `_vectorstore.collection_name`
-        exists in the list of collections and if it contains any points.
+        exists and if it contains any points. The name may also be an alias of a collection.
+        The first time the collection is found, its payload indexes are created, see `create_payload_indexes`.
 
         Returns
         -------
         bool
             True if the collection exists and has points, False otherwise.
         """
-        if self._vectorstore.collection_name in [c.name for c in self.get_collections()]:
-            collection = self._vectorstore.client.get_collection(self._vectorstore.collection_name)
+        if self._read(lambda client: client.collection_exists(self._vectorstore.collection_name)):
+            if not self._payload_indexes_created:
+                self.create_payload_indexes()
+            collection = self._read(lambda client: client.get_collection(self._vectorstore.collection_name))
             return collection.points_count > 0
         return False
 
     @staticmethod
     def _search_kwargs_builder(search_kwargs: dict, filter_kwargs: dict):
-        """Build search kwargs with proper Qdrant filter format."""
+        """Build search kwargs with proper Qdrant filter and search params format.
+
+        A list value matches any of its elements.
+        """
+        if search_kwargs.get("search_params"):
+            search_kwargs = search_kwargs | {
+                "search_params": QdrantDatabase._build_search_params(search_kwargs["search_params"])
+            }
         if not filter_kwargs:
             return search_kwargs
 
         # Convert dict filter to Qdrant filter format
         qdrant_filter = models.Filter(
             must=[
-                models.FieldCondition(key="metadata." + key, match=models.MatchValue(value=value))
+                models.FieldCondition(
+                    key="metadata." + key,
+                    match=(
+                        models.MatchAny(any=list(value))
+                        if isinstance(value, (list, tuple, set))
+                        else models.MatchValue(value=value)
+                    ),
+                )
                 for key, value in filter_kwargs.items()
             ]
         )
 
         return {**search_kwargs, "filter": qdrant_filter}
 
+    @staticmethod
+    def _build_search_params(search_params: dict | models.SearchParams | None) -> models.SearchParams | None:
+        if not search_params or isinstance(search_params, models.SearchParams):
+            return search_params or None
+        quantization = None
+        if "quantization_rescore" in search_params or "quantization_oversampling" in search_params:
+            quantization = models.QuantizationSearchParams(
+                rescore=search_params.get("quantization_rescore"),
+                oversampling=search_params.get("quantization_oversampling"),
+            )
+        return models.SearchParams(
+            hnsw_ef=search_params.get("hnsw_ef"),
+            exact=search_params.get("exact", False),
+            indexed_only=search_params.get("indexed_only", False),
+            quantization=quantization,
+        )
+
+    @staticmethod
+    def _check_model(kind: str, model: Optional[str], expected: Optional[str]) -> None:
+        if expected is None:
+            raise ValueError(f"Precomputed {kind} vectors are not accepted, the {kind} embedding model is unknown.")
+        if model != expected:
+            raise ValueError(
+                f"Precomputed {kind} vectors were computed with model '{model}', but the collection uses '{expected}'."
+            )
+
     async def asearch(self, query: str, search_kwargs: dict, filter_kwargs: dict | None = None) -> list[Document]:
         """
         Asynchronously search for documents based on a query and optional filters.
@@ -98,23 +186,104 @@ class QdrantDatabase(VectorDatabase):
         -------
         list[Document]
             A list of documents that match the search query and filters, including related documents.
+            The normalized similarity score in [0, 1] is stored in ``metadata["score"]``; related documents inherit
+            the score of the document referencing them. Scores of different searches for the same query are
+            comparable; in hybrid mode they reflect the ranks of the fused searches, not the raw similarities.
         """
+        raw_query = self._settings.tenancy == TenancyMode.SHARD_KEY or self._client_pool
+        if raw_query or search_kwargs.get("payload_projection") or search_kwargs.get("with_vectors"):
+            # LangChain's vector store can neither select a shard or a replica nor project the payload or return the
+            # vectors, so the search goes through the raw query API.
+            return (await self.abatch_search([query], [(search_kwargs, filter_kwargs)]))[0][0]
         try:
             search_params = self._search_kwargs_builder(search_kwargs=search_kwargs, filter_kwargs=filter_kwargs)
 
-            retriever = self._vectorstore.as_retriever(query=query, search_kwargs=search_params)
+            results = await self._vectorstore.asimilarity_search_with_score(query, **search_params)
+            return self._scored_with_related(results)
 
-            results = await retriever.ainvoke(query)
-            related_results = []
+        except Exception:
+            logger.exception("Search failed")
+            raise
 
-            for res in results:
-                related_results += self._get_related(res.metadata["related"])
-            return results + related_results
+    async def abatch_search(self, queries: list[str], searches: list[tuple[dict, dict | None]]) -> BatchSearchResult:
+        """
+        Run every search for every query with one embedding call per vector type and one batched Qdrant request.
+
+        Parameters
+        ----------
+        queries : list[str]
+            The search query strings.
+        searches : list[tuple[dict, dict | None]]
+            The searches as pairs of search kwargs (``k``, ``score_threshold`` and optionally ``search_params``,
+            ``payload_projection`` and ``with_vectors``) and filter kwargs.
 
+        Returns
+        -------
+        BatchSearchResult
+            The documents per query and search including related documents, i.e. ``result[query_index][search_index]``.
+        """
+        if not queries or not searches:
+            return [[[] for _ in searches] for _ in queries]
+        try:
+            dense_vectors, sparse_vectors = await self._aembed_queries(queries)
+            requests = [
+                self._build_query_request(
+                    dense_vectors[i] if dense_vectors else None,
+                    sparse_vectors[i] if sparse_vectors else None,
+                    search_kwargs,
+                    filter_kwargs,
+                )
+                for i in range(len(queries))
+                for search_kwargs, filter_kwargs in searches
+            ]
+            responses = await run_in_executor(
+                None,
+                self._read,
+                lambda client: client.query_batch_points(
+                    collection_name=self._vectorstore.collection_name, requests=requests
+                ),
+            )
+
+            results: BatchSearchResult = []
+            for i in range(len(queries)):
+                per_query = []
+                for j, (search_kwargs, _) in enumerate(searches):
+                    scored_documents = [
+                        (self._hit_document(point, search_kwargs), point.score)
+                        for point in responses[i * len(searches) + j].points
+                    ]
+                    per_query.append(self._scored_with_related(scored_documents))
+                results.append(per_query)
+            return results
         except Exception:
-            logger.exception("Search failed")
+            logger.exception("Batch search failed")
             raise
 
+    def hydrate(self, documents: list[Document]) -> list[Document]:
+        """Load the complete metadata of search hits that were returned with a projected payload.
+
+        Values added during retrieval, like the score, are kept.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents, possibly marked with ``PARTIAL_PAYLOAD_KEY``.
+
+        Returns
+        -------
+        list[Document]
+            The documents in the same order with their complete metadata.
+        """
+        partial = [d for d in documents if d.metadata.pop(self.PARTIAL_PAYLOAD_KEY, False)]
+        if not partial:
+            return documents
+        complete = {d.metadata.get("id"): d for d in self.get_documents_by_ids([d.metadata.get("id") for d in partial])}
+        for document in partial:
+            stored = complete.get(document.metadata.get("id"))
+            if stored is not None:
+                document.metadata = document.metadata | stored.metadata
+        return documents
+
     def get_specific_document(self, document_id: str) -> list[Document]:
         """
         Retrieve a specific document from the vector database using the document ID.
@@ -130,16 +299,18 @@ class QdrantDatabase(VectorDatabase):
             A list containing the requested document as a Document object. If the document is not found,
             an empty list is returned.
         """
-        requested = self._vectorstore.client.scroll(
-            collection_name=self._vectorstore.collection_name,
-            scroll_filter=Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.id",
-                        match=MatchValue(value=document_id),
-                    )
-                ]
-            ),
+        requested = self._read(
+            lambda client: client.scroll(
+                collection_name=self._vectorstore.collection_name,
+                scroll_filter=Filter(
+                    must=[
+                        FieldCondition(
+                            key="metadata.id",
+                            match=MatchValue(value=document_id),
+                        )
+                    ]
+                ),
+            )
         )
         if not requested:
             return []
@@ -154,34 +325,87 @@ class QdrantDatabase(VectorDatabase):
             for search_result in requested[0]
         ]
 
-    def get_documents_by_ids(self, document_ids: list[str]) -> list[Document]:
+    def get_documents_by_ids(self, document_ids: list[str], filter_kwargs: dict | None = None) -> list[Document]:
         """Batch fetch multiple documents by their IDs.
 
         Parameters
         ----------
         document_ids : list[str]
             A list of document IDs to retrieve.
+        filter_kwargs : dict | None
+            Metadata filters the documents must match. Like for the search, the tenant selects the shard with
+            shard-key tenancy, falling back to the default tenant (default None, meaning all shards, no filter).
 
         Returns
         -------
         list[Document]
-            A list of found documents. Missing IDs are ignored.
+            The documents found, in the order of the IDs. Missing IDs are ignored.
         """
         if not document_ids:
             return []
-        # Scroll with OR semantics: build multiple FieldConditions
-        # Qdrant Python client doesn't support direct OR via 'should' in Filter shortcuts,
-        # but we can perform multiple scrolls as a fallback if needed.
-        # For efficiency, attempt a single scroll per id chunk (keep it simple for now).
-        results: list[Document] = []
-        for doc_id in document_ids:
-            results.extend(self.get_specific_document(doc_id))
-        return results
+        document_ids = list(dict.fromkeys(document_ids))
+        shard_key, conditions = None, []
+        if filter_kwargs is not None:
+            shard_key, filter_kwargs = self._route_tenant(filter_kwargs)
+            query_filter = self._search_kwargs_builder(search_kwargs={}, filter_kwargs=filter_kwargs).get("filter")
+            conditions = query_filter.must if query_filter else []
+        points, _ = self._read(
+            lambda client: client.scroll(
+                collection_name=self._vectorstore.collection_name,
+                scroll_filter=Filter(
+                    must=[FieldCondition(key="metadata.id", match=models.MatchAny(any=document_ids)), *conditions]
+                ),
+                limit=len(document_ids),
+                shard_key_selector=shard_key,
+            )
+        )
+        # One scroll for all IDs; keep the order of the requested IDs.
+        position = {document_id: i for i, document_id in enumerate(document_ids)}
+        documents = [
+            Document(page_content=point.payload["page_content"], metadata=point.payload["metadata"]) for point in points
+        ]
+        return sorted(documents, key=lambda d: position.get(d.metadata.get("id"), len(position)))
+
+    def get_vectors(self, document_ids: list[str]) -> dict[str, list[float]]:
+        """Return the stored dense vectors of the documents with the given IDs.
+
+        Parameters
+        ----------
+        document_ids : list[str]
+            The IDs (``metadata["id"]``) of the documents.
+
+        Returns
+        -------
+        dict[str, list[float]]
+            The dense vector per document ID. Empty if the collection has no dense vectors (sparse retrieval mode).
+        """
+        if not document_ids or self._settings.retrieval_mode == RetrievalMode.SPARSE:
+            return {}
+        vector_name = self._vectorstore.vector_name
+        points, _ = self._read(
+            lambda client: client.scroll(
+                collection_name=self._vectorstore.collection_name,
+                scroll_filter=Filter(must=[FieldCondition(key="metadata.id", match=models.MatchAny(any=document_ids))]),
+                limit=len(document_ids),
+                with_payload=["metadata.id"],
+                with_vectors=[vector_name],
+            )
+        )
+        vectors = {}
+        for point in points:
+            vector = point.vector.get(vector_name) if isinstance(point.vector, dict) else point.vector
+            if vector is not None:
+                vectors[point.payload["metadata"]["id"]] = vector
+        return vectors
 
     def upload(self, documents: list[Document]) -> None:
         """
         Save the given documents to the Qdrant database.
 
+        With shard-key tenancy every document is stored in the shard of its tenant (``metadata["tenant_id"]``,
+        falling back to the default tenant). Documents carrying precomputed vectors
+        (``metadata["precomputed_vectors"]``) are upserted without embedding them.
+
         Parameters
         ----------
         documents : list[Document]
@@ -190,15 +414,79 @@ class QdrantDatabase(VectorDatabase):
         Returns
         -------
         None
+
+        Raises
+        ------
+        ValueError
+            If precomputed vectors do not fit the retrieval mode, the embedding models or the collection.
         """
-        self._vectorstore = self._vectorstore.from_documents(
-            documents,
-            embedding=self._embedder.get_embedder(),
-            sparse_embedding=self._sparse_embedder,
-            location=self._settings.location,
-            collection_name=self._settings.collection_name,
-            retrieval_mode=self._settings.retrieval_mode,
-        )
+        precomputed = [document for document in documents if self.PRECOMPUTED_VECTORS_KEY in document.metadata]
+        documents = [document for document in documents if self.PRECOMPUTED_VECTORS_KEY not in document.metadata]
+        if precomputed:
+            self.upload_precomputed(precomputed)
+        if documents and self._settings.tenancy == TenancyMode.SHARD_KEY:
+            self._upload_to_shards(documents)
+        elif documents:
+            self._ensure_collection(
+                self._vectorstore.client,
+                lambda: len(self._embedder.get_embedder().embed_documents([documents[0].page_content])[0]),
+            )
+            self._vectorstore.add_documents(documents)
+        self.create_payload_indexes()
+
+    def upload_precomputed(
+        self, documents: list[Document], point_ids: Optional[list[str]] = None, parallel: int = 1
+    ) -> None:
+        """
+        Save documents carrying precomputed vectors (``metadata["precomputed_vectors"]``) without embedding them.
+
+        The points are written with ``upload_points`` in batches of ``UPSERT_BATCH_SIZE``. Payload indexes are not
+        created, see `create_payload_indexes`.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents to save.
+        point_ids : Optional[list[str]]
+            The IDs of the points, in the order of the documents (default None, meaning random IDs). Stable IDs make
+            writing the same documents again overwrite their points instead of duplicating them.
+        parallel : int
+            The number of processes writing the batches (default 1).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the precomputed vectors do not fit the retrieval mode, the embedding models or the collection.
+        """
+        vectors = [self._point_vector(document.metadata.pop(self.PRECOMPUTED_VECTORS_KEY)) for document in documents]
+        self._upload_points(documents, vectors, point_ids, parallel)
+
+    def create_payload_indexes(self) -> None:
+        """
+        Create the keyword indexes of the ``payload_index_fields``, ignoring indexes that can not be created.
+
+        Creating an existing index is a no-op, so this runs on every upload and once for an existing collection.
+
+        Returns
+        -------
+        None
+        """
+        # Indexed payload fields let Qdrant plan filtered searches (e.g. summaries only, or the chunks of a few
+        # documents) on the filtered HNSW graph instead of scanning the whole collection.
+        for field in self._settings.payload_index_fields:
+            try:
+                self._vectorstore.client.create_payload_index(
+                    collection_name=self._settings.collection_name,
+                    field_name="metadata." + field,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
+            except Exception:
+                logger.warning("Could not create the payload index for %s.", field, exc_info=True)
+        self._payload_indexes_created = True
 
     def delete(self, delete_request: dict) -> None:
         """
@@ -208,7 +496,8 @@ class QdrantDatabase(VectorDatabase):
         ----------
         delete_request : dict
             A dictionary containing the conditions to match the points to be deleted. Each key-value pair
-            represents a field and its corresponding value to match.
+            represents a field and its corresponding value to match; a list value matches any of its elements, so
+            the points of many documents are deleted with a single request.
 
         Returns
         -------
@@ -217,10 +506,18 @@ class QdrantDatabase(VectorDatabase):
         filter_conditions = [
             models.FieldCondition(
                 key=key,
-                match=models.MatchValue(value=value),
+                match=(
+                    models.MatchAny(any=list(value))
+                    if isinstance(value, (list, tuple, set))
+                    else models.MatchValue(value=value)
+                ),
             )
             for key, value in delete_request.items()
         ]
+        # With shard keys a delete for one tenant only touches its shard; without a tenant all shards are searched.
+        shard_key = None
+        if self._settings.tenancy == TenancyMode.SHARD_KEY:
+            shard_key = delete_request.get("metadata." + self.TENANT_KEY)
 
         points_selector = models.FilterSelector(
             filter=models.Filter(
@@ -231,6 +528,7 @@ class QdrantDatabase(VectorDatabase):
         self._vectorstore.client.delete(
             collection_name=self._settings.collection_name,
             points_selector=points_selector,
+            shard_key_selector=shard_key,
         )
 
     def get_collections(self) -> list[str]:
@@ -242,7 +540,275 @@ class QdrantDatabase(VectorDatabase):
         list[str]
             A list of collection names from the vector database.
         """
-        return self._vectorstore.client.get_collections().collections
+        return self._read(lambda client: client.get_collections()).collections
+
+    async def _aembed_queries(self, queries: list[str]) -> tuple[list | None, list | None]:
+        # Queries are embedded as queries, not as documents: BM25 weights query tokens differently from document
+        # tokens, and some dense models prefix queries with an instruction.
+        retrieval_mode = self._settings.retrieval_mode
+        dense_vectors = sparse_vectors = None
+        if retrieval_mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID):
+            embedder = self._embedder.get_embedder()
+            dense_vectors = await asyncio.gather(*(embedder.aembed_query(query) for query in queries))
+        if retrieval_mode in (RetrievalMode.SPARSE, RetrievalMode.HYBRID):
+            sparse_vectors = await run_in_executor(
+                None, lambda: [self._sparse_embedder.embed_query(query) for query in queries]
+            )
+        return dense_vectors, sparse_vectors
+
+    def _hit_document(self, point: models.ScoredPoint, search_kwargs: dict) -> Document:
+        document = QdrantVectorStore._document_from_point(
+            point,
+            self._vectorstore.collection_name,
+            self._vectorstore.content_payload_key,
+            self._vectorstore.metadata_payload_key,
+        )
+        if search_kwargs.get("payload_projection"):
+            document.metadata[self.PARTIAL_PAYLOAD_KEY] = True
+        vector = point.vector.get(self._vectorstore.vector_name) if isinstance(point.vector, dict) else point.vector
+        if vector is not None:
+            document.metadata[self.DENSE_VECTOR_KEY] = vector
+        return document
+
+    def _scored_with_related(self, scored_documents: list[tuple[Document, float]]) -> list[Document]:
+        scores = self._normalize_scores([score for _, score in scored_documents])
+        documents = []
+        related_results = []
+        for (document, _), score in zip(scored_documents, scores):
+            document.metadata["score"] = score
+            documents.append(document)
+            for related in self._get_related(document.metadata["related"]):
+                related.metadata["score"] = score
+                related_results.append(related)
+        return documents + related_results
+
+    def _normalize_scores(self, scores: list[float]) -> list[float]:
+        # Every search for a query is mapped to [0, 1] with the same fixed function, so hits of different searches
+        # (e.g. one per content type) stay comparable when they are merged.
+        retrieval_mode = self._settings.retrieval_mode
+        if retrieval_mode == RetrievalMode.DENSE:
+            # Cosine similarities.
+            return [min(max(score, 0.0), 1.0) for score in scores]
+        if retrieval_mode == RetrievalMode.HYBRID:
+            # Reciprocal rank fusion only depends on the ranks in the dense and the sparse search, so the order of
+            # hybrid hits across searches is rank-based.
+            return [min(max(score / self.MAX_RRF_SCORE, 0.0), 1.0) for score in scores]
+        # BM25 scores of the same query are comparable, but unbounded.
+        return [score / (1.0 + score) if score > 0 else 0.0 for score in scores]
+
+    def _build_query_request(
+        self,
+        dense_vector: list[float] | None,
+        sparse_vector,
+        search_kwargs: dict,
+        filter_kwargs: dict | None,
+    ) -> models.QueryRequest:
+        # Mirrors QdrantVectorStore.similarity_search_with_score for the configured retrieval mode.
+        shard_key, filter_kwargs = self._route_tenant(filter_kwargs)
+        query_filter = self._search_kwargs_builder(search_kwargs={}, filter_kwargs=filter_kwargs).get("filter")
+        params = self._build_search_params(search_kwargs.get("search_params"))
+        limit = search_kwargs.get("k", 4)
+        # Only the dense vectors are needed, e.g. by the diversity stage of the retriever.
+        with_vector = bool(search_kwargs.get("with_vectors")) and dense_vector is not None
+        options = {
+            "shard_key": shard_key,
+            "params": params,
+            "filter": query_filter,
+            "limit": limit,
+            "score_threshold": search_kwargs.get("score_threshold"),
+            "with_payload": self._payload_selector(search_kwargs.get("payload_projection")),
+            "with_vector": [self._vectorstore.vector_name] if with_vector else False,
+        }
+        sparse_query = (
+            models.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values) if sparse_vector else None
+        )
+        if dense_vector is not None and sparse_query is not None:
+            return models.QueryRequest(
+                prefetch=[
+                    models.Prefetch(
+                        using=self._vectorstore.vector_name,
+                        query=dense_vector,
+                        filter=query_filter,
+                        limit=limit,
+                        params=params,
+                    ),
+                    models.Prefetch(
+                        using=self._vectorstore.sparse_vector_name,
+                        query=sparse_query,
+                        filter=query_filter,
+                        limit=limit,
+                        params=params,
+                    ),
+                ],
+                query=models.FusionQuery(fusion=models.Fusion.RRF),
+                **options,
+            )
+        if dense_vector is not None:
+            return models.QueryRequest(query=dense_vector, using=self._vectorstore.vector_name, **options)
+        return models.QueryRequest(query=sparse_query, using=self._vectorstore.sparse_vector_name, **options)
+
+    def _payload_selector(self, projection: dict | None) -> bool | models.PayloadSelector:
+        if not projection:
+            return True
+        content_key = self._vectorstore.content_payload_key
+        metadata_key = self._vectorstore.metadata_payload_key
+        if projection.get("include"):
+            fields = dict.fromkeys([*self.REQUIRED_PAYLOAD_FIELDS, *projection["include"]])
+            return models.PayloadSelectorInclude(include=[content_key, *(f"{metadata_key}.{f}" for f in fields)])
+        excluded = [f for f in projection.get("exclude", []) if f not in self.REQUIRED_PAYLOAD_FIELDS]
+        if not excluded:
+            return True
+        return models.PayloadSelectorExclude(exclude=[f"{metadata_key}.{f}" for f in excluded])
+
+    def _route_tenant(self, filter_kwargs: dict | None) -> tuple[str | None, dict]:
+        # Returns the shard key of the tenant and the filter kwargs. With shard keys the tenant filter is kept as
+        # well, so a misrouted request can never see points of another tenant.
+        filter_kwargs = dict(filter_kwargs or {})
+        if self._settings.tenancy != TenancyMode.SHARD_KEY:
+            return None, filter_kwargs
+        tenant = filter_kwargs.get(self.TENANT_KEY) or self._settings.default_tenant
+        return tenant, filter_kwargs | {self.TENANT_KEY: tenant}
+
+    def _point_vector(self, precomputed: dict) -> dict:
+        # Vectors of another model live in another vector space; mixing them silently breaks the search.
+        mode = self._settings.retrieval_mode
+        vector = {}
+        if mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID):
+            if not precomputed.get("dense_vector"):
+                raise ValueError(f"Precomputed vectors require a dense vector in {mode.value} retrieval mode.")
+            self._check_model("dense", precomputed.get("embedding_model"), self._embedding_model)
+            vector[self._vectorstore.vector_name] = precomputed["dense_vector"]
+        if mode in (RetrievalMode.SPARSE, RetrievalMode.HYBRID):
+            if not precomputed.get("sparse_vector"):
+                raise ValueError(f"Precomputed vectors require a sparse vector in {mode.value} retrieval mode.")
+            self._check_model("sparse", precomputed.get("sparse_embedding_model"), self._sparse_embedding_model)
+            vector[self._vectorstore.sparse_vector_name] = models.SparseVector(**precomputed["sparse_vector"])
+        return vector
+
+    def _ensure_collection(self, client: QdrantClient, dense_size: Callable[[], Optional[int]]) -> bool:
+        # Creates the collection if it is missing and returns whether it existed. dense_size is only called to
+        # create a collection with dense vectors.
+        collection_name = self._settings.collection_name
+        with self._collection_lock:
+            if client.collection_exists(collection_name):
+                return True
+            try:
+                client.create_collection(collection_name, **self._collection_options(dense_size))
+            except UnexpectedResponse:
+                # Another replica may have created the collection in the meantime.
+                if not client.collection_exists(collection_name):
+                    raise
+                return True
+            return False
+
+    def _collection_options(self, dense_size: Callable[[], Optional[int]]) -> dict:
+        create_options = {}
+        if self._settings.tenancy == TenancyMode.SHARD_KEY:
+            create_options["sharding_method"] = models.ShardingMethod.CUSTOM
+        size = dense_size() if self._settings.retrieval_mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID) else None
+        if size is not None:
+            create_options["vectors_config"] = {
+                self._vectorstore.vector_name: models.VectorParams(size=size, distance=self._vectorstore.distance)
+            }
+        if self._settings.retrieval_mode in (RetrievalMode.SPARSE, RetrievalMode.HYBRID):
+            create_options["sparse_vectors_config"] = {
+                self._vectorstore.sparse_vector_name: models.SparseVectorParams()
+            }
+        return create_options
+
+    def _ensure_collection_for(self, client: QdrantClient, vectors: list[dict]) -> None:
+        vector_name = self._vectorstore.vector_name
+        sizes = {len(vector[vector_name]) for vector in vectors if vector_name in vector}
+        if len(sizes) > 1:
+            raise ValueError("Precomputed dense vectors differ in their dimension.")
+        existed = self._ensure_collection(client, lambda: next(iter(sizes), None))
+        if not existed or not sizes:
+            return
+        vectors_config = client.get_collection(self._settings.collection_name).config.params.vectors
+        if isinstance(vectors_config, dict):
+            vectors_config = vectors_config.get(vector_name)
+        if vectors_config is not None and sizes != {vectors_config.size}:
+            raise ValueError(
+                f"Precomputed dense vectors have dimension {sizes.pop()}, the collection {vectors_config.size}."
+            )
+
+    def _upload_to_shards(self, documents: list[Document]) -> None:
+        # LangChain's vector store can not select a shard, so the documents are embedded here and upserted as points.
+        texts = [document.page_content for document in documents]
+        vectors: list[dict] = [{} for _ in documents]
+        if self._settings.retrieval_mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID):
+            for vector, dense_vector in zip(vectors, self._embedder.get_embedder().embed_documents(texts)):
+                vector[self._vectorstore.vector_name] = dense_vector
+        if self._settings.retrieval_mode in (RetrievalMode.SPARSE, RetrievalMode.HYBRID):
+            for vector, sparse_vector in zip(vectors, self._sparse_embedder.embed_documents(texts)):
+                vector[self._vectorstore.sparse_vector_name] = models.SparseVector(
+                    indices=sparse_vector.indices, values=sparse_vector.values
+                )
+        self._upload_points(documents, vectors)
+
+    def _upload_points(
+        self,
+        documents: list[Document],
+        vectors: list[dict],
+        point_ids: Optional[list[str]] = None,
+        parallel: int = 1,
+    ) -> None:
+        point_ids = point_ids or [uuid.uuid4().hex for _ in documents]
+        client = self._vectorstore.client
+        self._ensure_collection_for(client, vectors)
+
+        points_by_tenant: dict[Optional[str], list[models.PointStruct]] = defaultdict(list)
+        for document, vector, point_id in zip(documents, vectors, point_ids):
+            tenant = None
+            if self._settings.tenancy == TenancyMode.SHARD_KEY:
+                tenant = document.metadata.get(self.TENANT_KEY) or self._settings.default_tenant
+                document.metadata[self.TENANT_KEY] = tenant
+            points_by_tenant[tenant].append(
+                models.PointStruct(
+                    id=point_id,
+                    vector=vector,
+                    payload={
+                        self._vectorstore.content_payload_key: document.page_content,
+                        self._vectorstore.metadata_payload_key: document.metadata,
+                    },
+                )
+            )
+
+        for tenant, points in points_by_tenant.items():
+            if tenant is not None:
+                self._ensure_shard_key(client, tenant)
+            client.upload_points(
+                collection_name=self._settings.collection_name,
+                points=points,
+                batch_size=self.UPSERT_BATCH_SIZE,
+                parallel=parallel,
+                wait=True,
+                shard_key_selector=tenant,
+            )
+
+    def _ensure_shard_key(self, client: QdrantClient, tenant: str) -> None:
+        if tenant in self._shard_keys:
+            return
+        self._shard_keys.update(self._existing_shard_keys(client))
+        if tenant in self._shard_keys:
+            return
+        try:
+            client.create_shard_key(collection_name=self._settings.collection_name, shard_key=tenant)
+        except UnexpectedResponse:
+            # Another replica may have created the shard key in the meantime.
+            if tenant not in self._existing_shard_keys(client):
+                raise
+        self._shard_keys.add(tenant)
+
+    def _existing_shard_keys(self, client: QdrantClient) -> set[str]:
+        cluster_info = client.collection_cluster_info(self._settings.collection_name)
+        shards = [*cluster_info.local_shards, *cluster_info.remote_shards]
+        return {str(shard.shard_key) for shard in shards if shard.shard_key is not None}
+
+    def _read(self, operation: Callable[[QdrantClient], T]) -> T:
+        if self._client_pool is None:
+            return operation(self._vectorstore.client)
+        return self._client_pool.execute(operation, primary=self._vectorstore.client)
 
     def _get_related(self, related_ids: list[str]) -> list[Document]:
         result = []
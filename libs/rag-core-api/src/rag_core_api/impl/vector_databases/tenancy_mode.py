@@ -0,0 +1,15 @@
+"""Module containing the TenancyMode enumeration."""
+
+from enum import StrEnum, unique
+
+
+@unique
+class TenancyMode(StrEnum):
+    """An enumeration of the ways tenants are separated in the vector database.
+
+    NONE keeps all tenants in one collection; a tenant given in a request is applied as payload filter.
+    SHARD_KEY stores every tenant in its own custom shard of the collection and routes requests to it.
+    """
+
+    NONE = "none"
+    SHARD_KEY = "shard_key"
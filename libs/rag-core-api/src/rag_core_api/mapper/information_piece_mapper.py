@@ -1,13 +1,14 @@
 """Module for mapping between LangchainDocument and InformationPiece."""
 
-import json
+from typing import Iterable, Optional
 
 from langchain_core.documents import Document as LangchainDocument
 
 from rag_core_api.models.content_type import ContentType as ExternalContentType
 from rag_core_api.models.information_piece import InformationPiece
-from rag_core_api.models.key_value_pair import KeyValuePair
+from rag_core_api.vector_databases.vector_database import VectorDatabase
 from rag_core_lib.impl.data_types.content_type import ContentType as InternalContentType
+from rag_core_lib.impl.utils import fast_json
 
 
 class InformationPieceMapper:
@@ -23,10 +24,13 @@ class InformationPieceMapper:
         Key for document URL in metadata
     IMAGE_CONTENT_KEY : str
         Key for base64 image content in metadata
+    IMAGE_ID_KEY : str
+        Key for the ID of an image kept in the object storage instead of the metadata
     """
 
     DOCUMENT_URL_KEY = "document_url"
     IMAGE_CONTENT_KEY = "base64_image"
+    IMAGE_ID_KEY = "image_id"
 
     @staticmethod
     def information_piece2langchain_document(
@@ -35,6 +39,9 @@ class InformationPieceMapper:
         """
         Convert an InformationPiece instance to a LangchainDocument instance.
 
+        Precomputed vectors of the information piece are kept in the ``precomputed_vectors`` metadata, see
+        `VectorDatabase.PRECOMPUTED_VECTORS_KEY`.
+
         Parameters
         ----------
         information_piece : InformationPiece
@@ -49,25 +56,34 @@ class InformationPieceMapper:
         ------
         ValueError
             If the required key `DOCUMENT_URL_KEY` is not found in the metadata.
-            If the required key for content-type `IMAGE` is not found in the metadata when the type is `IMAGE`.
+            If neither the image content nor an image ID is found in the metadata when the type is `IMAGE`.
         """
-        metadata = {x.key: json.loads(x.value) for x in information_piece.metadata}
+        metadata = {x.key: fast_json.loads(x.value) for x in information_piece.metadata}
         if InformationPieceMapper.DOCUMENT_URL_KEY not in metadata.keys():
             raise ValueError('Required key "%s" not found in metadata.' % InformationPieceMapper.DOCUMENT_URL_KEY)
         metadata["type"] = InformationPieceMapper.external_content2internal_content(metadata["type"]).value
         if (
             metadata["type"] == InternalContentType.IMAGE
             and InformationPieceMapper.IMAGE_CONTENT_KEY not in metadata.keys()
+            and InformationPieceMapper.IMAGE_ID_KEY not in metadata.keys()
         ):
             raise ValueError(
                 'Required key "%s" for content-type %s not found in metadata.'
                 % (InternalContentType.IMAGE, InformationPieceMapper.IMAGE_CONTENT_KEY)
             )
+        if information_piece.dense_vector is not None or information_piece.sparse_vector is not None:
+            metadata[VectorDatabase.PRECOMPUTED_VECTORS_KEY] = {
+                "dense_vector": information_piece.dense_vector,
+                "sparse_vector": information_piece.sparse_vector and information_piece.sparse_vector.to_dict(),
+                "embedding_model": information_piece.embedding_model,
+                "sparse_embedding_model": information_piece.sparse_embedding_model,
+            }
         return LangchainDocument(page_content=information_piece.page_content, metadata=metadata)
 
     @staticmethod
     def langchain_document2information_piece(
         langchain_document: LangchainDocument,
+        metadata_keys: Optional[Iterable[str]] = None,
     ) -> InformationPiece:
         """
         Convert a LangchainDocument to an InformationPiece.
@@ -76,18 +92,29 @@ class InformationPieceMapper:
         ----------
         langchain_document : LangchainDocument
             The LangchainDocument instance to be converted.
+        metadata_keys : Optional[Iterable[str]]
+            The metadata fields to convert (default None, meaning all fields).
 
         Returns
         -------
         InformationPiece
             The converted InformationPiece instance, with metadata converted to key-value pairs
             and type set to the value from metadata or ExternalContentType.TEXT.value (default).
+
+        Notes
+        -----
+        The metadata is validated in the same call as the information piece, which is faster than building every
+        key-value pair as a model of its own.
         """
-        metadata = InformationPieceMapper._dict2key_value_pair(langchain_document.metadata)
-        return InformationPiece(
-            page_content=langchain_document.page_content,
-            metadata=metadata,
-            type=langchain_document.metadata.get("type", ExternalContentType.TEXT.value),
+        metadata = langchain_document.metadata
+        if metadata_keys is not None:
+            metadata = {key: metadata[key] for key in metadata_keys if key in metadata}
+        return InformationPiece.model_validate(
+            {
+                "page_content": langchain_document.page_content,
+                "metadata": InformationPieceMapper._dict2key_value_pair(metadata),
+                "type": langchain_document.metadata.get("type", ExternalContentType.TEXT.value),
+            }
         )
 
     @staticmethod
@@ -151,16 +178,12 @@ class InformationPieceMapper:
         return lookup_table[external_content_type]
 
     @staticmethod
-    def _dict2key_value_pair(metadata: dict[str, any]) -> list[KeyValuePair]:
+    def _dict2key_value_pair(metadata: dict[str, any]) -> list[dict[str, str]]:
         mapped_values = []
         for key, value in metadata.items():
-            mapped_item: KeyValuePair | None = None
-
             match value:
                 case dict():
-                    mapped_item = KeyValuePair(key=key, value=json.dumps(value))
+                    mapped_values.append({"key": key, "value": fast_json.dumps(value)})
                 case _:
-                    mapped_item = KeyValuePair(key=key, value=json.dumps(str(value)))
-
-            mapped_values.append(mapped_item)
+                    mapped_values.append({"key": key, "value": fast_json.dumps(str(value))})
         return mapped_values
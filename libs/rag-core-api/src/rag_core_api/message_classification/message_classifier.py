@@ -0,0 +1,69 @@
+"""Module for the message classifier interface."""
+
+from abc import ABC, abstractmethod
+from enum import StrEnum
+from typing import Optional
+
+
+class MessageCategory(StrEnum):
+    """
+    MessageCategory is an enumeration of the categories a chat message can be classified into.
+
+    Attributes
+    ----------
+    QUESTION : str
+        A message that requires retrieval and answer generation.
+    GREETING : str
+        A greeting, e.g. "Hello".
+    THANKS : str
+        An expression of thanks, e.g. "Thank you".
+    GOODBYE : str
+        A farewell, e.g. "Bye".
+    META : str
+        A question about the assistant itself, e.g. "Who are you?".
+    """
+
+    QUESTION = "question"
+    GREETING = "greeting"
+    THANKS = "thanks"
+    GOODBYE = "goodbye"
+    META = "meta"
+
+
+class MessageClassifier(ABC):
+    """Abstract base class for classifiers deciding whether a chat message needs retrieval."""
+
+    @abstractmethod
+    def classify(self, message: str) -> MessageCategory:
+        """
+        Classify the chat message.
+
+        Parameters
+        ----------
+        message : str
+            The chat message of the user.
+
+        Returns
+        -------
+        MessageCategory
+            The category of the message. Everything that is not small talk is a QUESTION.
+        """
+
+    @abstractmethod
+    def detect_language(self, message: str) -> Optional[str]:
+        """
+        Detect the language of a small talk message.
+
+        Small talk skips the language detection of the chat graph, so the classifier has to tell the language
+        of the message if it can, e.g. from the matched phrase.
+
+        Parameters
+        ----------
+        message : str
+            The chat message of the user.
+
+        Returns
+        -------
+        Optional[str]
+            The ISO 639-1 code of the language, or None if it is unknown.
+        """
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+"""
+STACKIT RAG
+
+The perfect rag solution.
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+
+from rag_core_api.models.chat_response import ChatResponse
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+
+class BatchChatResponseItem(BaseModel):
+    """
+    One line of the NDJSON response of the batch chat endpoint.
+    """  # noqa: E501
+
+    index: StrictInt = Field(description="The position of the chat request in the batch.")
+    response: Optional[ChatResponse] = None
+    error: Optional[StrictStr] = Field(default=None, description="The error, if the request could not be answered.")
+    __properties: ClassVar[List[str]] = ["index", "response", "error"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return self.model_dump_json(by_alias=True, exclude_unset=True)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of BatchChatResponseItem from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={},
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of response
+        if self.response:
+            _dict["response"] = self.response.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of BatchChatResponseItem from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "index": obj.get("index"),
+                "response": ChatResponse.from_dict(obj.get("response")) if obj.get("response") is not None else None,
+                "error": obj.get("error"),
+            }
+        )
+        return _obj
@@ -18,9 +18,11 @@ import pprint
 import re  # noqa: F401
 from typing import Any, ClassVar, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 from rag_core_api.models.chat_history import ChatHistory
+from rag_core_api.models.chat_scope import ChatScope
+from rag_core_api.models.citation_detail import CitationDetail
 
 try:
     from typing import Self
@@ -33,7 +35,12 @@ class ChatRequest(BaseModel):
 
     history: Optional[ChatHistory] = None
     message: StrictStr
-    __properties: ClassVar[List[str]] = ["history", "message"]
+    scope: Optional[ChatScope] = None
+    tenant_id: Optional[StrictStr] = Field(
+        default=None, description="The tenant whose information pieces are searched."
+    )
+    citation_detail: Optional[CitationDetail] = None
+    __properties: ClassVar[List[str]] = ["history", "message", "scope", "tenant_id", "citation_detail"]
 
     model_config = {
         "populate_by_name": True,
@@ -72,6 +79,9 @@ class ChatRequest(BaseModel):
         # override the default output from pydantic by calling `to_dict()` of history
         if self.history:
             _dict["history"] = self.history.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of scope
+        if self.scope:
+            _dict["scope"] = self.scope.to_dict()
         return _dict
 
     @classmethod
@@ -87,6 +97,9 @@ class ChatRequest(BaseModel):
             {
                 "history": (ChatHistory.from_dict(obj.get("history")) if obj.get("history") is not None else None),
                 "message": obj.get("message"),
+                "scope": (ChatScope.from_dict(obj.get("scope")) if obj.get("scope") is not None else None),
+                "tenant_id": obj.get("tenant_id"),
+                "citation_detail": obj.get("citation_detail"),
             }
         )
         return _obj
@@ -0,0 +1,42 @@
+# coding: utf-8
+
+"""
+STACKIT RAG
+
+The perfect rag solution.
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from enum import Enum
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+
+class CitationDetail(str, Enum):
+    """
+    How detailed the citations of a chat response are. COMPACT citations only carry a few metadata fields and a short
+    snippet.
+    """  # noqa: E501
+
+    """
+    allowed enum values
+    """
+    FULL = "FULL"
+    COMPACT = "COMPACT"
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of CitationDetail from a JSON string"""
+        return cls(json.loads(json_str))
@@ -16,12 +16,13 @@ from __future__ import annotations
 import json
 import pprint
 import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List
+from typing import Any, ClassVar, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
 
 from rag_core_api.models.content_type import ContentType
 from rag_core_api.models.key_value_pair import KeyValuePair
+from rag_core_api.models.sparse_vector import SparseVector
 
 try:
     from typing import Self
@@ -39,7 +40,25 @@ class InformationPiece(BaseModel):
     )
     page_content: StrictStr = Field(description="The content of the document")
     type: ContentType
-    __properties: ClassVar[List[str]] = ["metadata", "page_content", "type"]
+    dense_vector: Optional[List[StrictFloat | StrictInt]] = Field(
+        default=None, description="The precomputed dense vector of the page content."
+    )
+    sparse_vector: Optional[SparseVector] = None
+    embedding_model: Optional[StrictStr] = Field(
+        default=None, description="The ID of the model the dense vector was computed with."
+    )
+    sparse_embedding_model: Optional[StrictStr] = Field(
+        default=None, description="The ID of the model the sparse vector was computed with."
+    )
+    __properties: ClassVar[List[str]] = [
+        "metadata",
+        "page_content",
+        "type",
+        "dense_vector",
+        "sparse_vector",
+        "embedding_model",
+        "sparse_embedding_model",
+    ]
 
     model_config = {
         "populate_by_name": True,
@@ -82,6 +101,9 @@ class InformationPiece(BaseModel):
                 if _item:
                     _items.append(_item.to_dict())
             _dict["metadata"] = _items
+        # override the default output from pydantic by calling `to_dict()` of sparse_vector
+        if self.sparse_vector:
+            _dict["sparse_vector"] = self.sparse_vector.to_dict()
         return _dict
 
     @classmethod
@@ -102,6 +124,12 @@ class InformationPiece(BaseModel):
                 ),
                 "page_content": obj.get("page_content"),
                 "type": obj.get("type"),
+                "dense_vector": obj.get("dense_vector"),
+                "sparse_vector": (
+                    SparseVector.from_dict(obj.get("sparse_vector")) if obj.get("sparse_vector") is not None else None
+                ),
+                "embedding_model": obj.get("embedding_model"),
+                "sparse_embedding_model": obj.get("sparse_embedding_model"),
             }
         )
         return _obj
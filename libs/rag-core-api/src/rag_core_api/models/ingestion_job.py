@@ -0,0 +1,95 @@
+# coding: utf-8
+
+"""
+STACKIT RAG
+
+The perfect rag solution.
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pydantic import BaseModel, Field, StrictInt, StrictStr
+
+from rag_core_api.models.ingestion_job_status import IngestionJobStatus
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+
+class IngestionJob(BaseModel):
+    """
+    An upload of information pieces running in the background.
+    """  # noqa: E501
+
+    job_id: StrictStr = Field(description="The ID of the job.")
+    status: IngestionJobStatus
+    information_piece_count: StrictInt = Field(description="The number of information pieces of the upload.")
+    error: Optional[StrictStr] = Field(default=None, description="The error, if the upload failed.")
+    __properties: ClassVar[List[str]] = ["job_id", "status", "information_piece_count", "error"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return self.model_dump_json(by_alias=True, exclude_unset=True)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of IngestionJob from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={},
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of IngestionJob from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "job_id": obj.get("job_id"),
+                "status": obj.get("status"),
+                "information_piece_count": obj.get("information_piece_count"),
+                "error": obj.get("error"),
+            }
+        )
+        return _obj
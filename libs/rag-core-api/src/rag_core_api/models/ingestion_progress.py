@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+STACKIT RAG
+
+The perfect rag solution.
+
+The version of the OpenAPI document: 1.0.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pydantic import BaseModel, Field, StrictBool, StrictInt, StrictStr
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+
+class IngestionProgress(BaseModel):
+    """
+    One line of the NDJSON response of the streaming upload, acknowledging the uploaded information pieces.
+    """  # noqa: E501
+
+    uploaded_piece_count: StrictInt = Field(description="The number of information pieces uploaded so far.")
+    done: StrictBool = Field(description="Whether this is the last line, sent once the upload ended.")
+    error: Optional[StrictStr] = Field(default=None, description="The error the upload ended with, if any.")
+    __properties: ClassVar[List[str]] = ["uploaded_piece_count", "done", "error"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return self.model_dump_json(by_alias=True, exclude_unset=True)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of IngestionProgress from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={},
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of IngestionProgress from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "uploaded_piece_count": obj.get("uploaded_piece_count"),
+                "done": obj.get("done"),
+                "error": obj.get("error"),
+            }
+        )
+        return _obj
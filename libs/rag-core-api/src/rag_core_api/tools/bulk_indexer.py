@@ -0,0 +1,408 @@
+"""Offline bulk indexer loading large corpora of information pieces into the vector database without the HTTP API.
+
+The information pieces are read from a JSONL file (one information piece per line, as for the streaming upload) or
+a Parquet file with the columns of an information piece. Every chunk of pieces is embedded with concurrent batched
+requests to the dense embedder while the sparse encoding runs on all cores, and the points are written with
+parallel ``upload_points`` requests. Information pieces that already carry vectors are written as they are.
+
+The number of written pieces is saved to a checkpoint after every chunk, so a crashed run resumes where it stopped.
+Point IDs are derived from the ``id`` metadata of the pieces, so pieces written again overwrite their points::
+
+    python -m rag_core_api.tools.bulk_indexer corpus.jsonl --chunk-size 1024 --embed-workers 8 --upload-parallel 4
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+from langchain_core.documents import Document
+from langchain_qdrant import RetrievalMode, SparseEmbeddings
+
+from rag_core_api.impl.file_services.citation_image_store import CitationImageStore
+from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.vector_databases.vector_database import VectorDatabase
+from rag_core_lib.impl.embeddings.embedder import Embedder
+from rag_core_lib.impl.utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+_POINT_ID_NAMESPACE = uuid.UUID("8f3a7c2e-5b1d-4e6f-9a0b-2c4d6e8f1a3b")
+
+# The documents of a chunk with their point IDs.
+DocumentChunk = tuple[list[Document], list[str]]
+# A chunk with the futures of its dense and sparse embeddings.
+_EmbeddingChunk = tuple[list[Document], list[str], list[Future], Optional[Future]]
+
+
+@dataclass
+class Checkpoint:
+    """The progress of a bulk indexing run."""
+
+    source: str
+    position: int = 0
+
+    @classmethod
+    def load(cls, path: str, source: str) -> "Checkpoint":
+        """
+        Load the checkpoint of a run, or start a new run if there is none.
+
+        Parameters
+        ----------
+        path : str
+            The path of the checkpoint file.
+        source : str
+            The file the information pieces are read from.
+
+        Returns
+        -------
+        Checkpoint
+            The checkpoint.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint belongs to another source file.
+        """
+        if not os.path.exists(path):
+            return cls(source=source)
+        with open(path, encoding="utf-8") as file:
+            checkpoint = cls(**json.load(file))
+        if os.path.abspath(checkpoint.source) != os.path.abspath(source):
+            raise ValueError(f"Checkpoint {path} belongs to {checkpoint.source}, not to {source}.")
+        return checkpoint
+
+    def save(self, path: str) -> None:
+        """
+        Save the checkpoint atomically, so a crash while saving keeps the previous checkpoint.
+
+        Parameters
+        ----------
+        path : str
+            The path of the checkpoint file.
+
+        Returns
+        -------
+        None
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(asdict(self), file)
+        os.replace(temporary_path, path)
+
+
+def read_information_pieces(path: str, chunk_size: int, skip: int = 0) -> Iterator[list[InformationPiece]]:
+    """
+    Read the information pieces of a JSONL or Parquet file in chunks.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file. Files ending with ``.parquet`` are read as Parquet, all others as JSONL.
+    chunk_size : int
+        The number of information pieces per chunk.
+    skip : int
+        The number of information pieces at the start of the file to skip (default 0).
+
+    Yields
+    ------
+    list[InformationPiece]
+        The information pieces of the next chunk.
+
+    Raises
+    ------
+    ValueError
+        If a line or row is not a valid information piece.
+    """
+    chunk = []
+    for position, row in enumerate(_read_rows(path)):
+        if position < skip:
+            continue
+        try:
+            chunk.append(InformationPiece.model_validate(row))
+        except ValueError as e:
+            raise ValueError(f"Information piece {position + 1} of {path} is not valid: {e}") from e
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _read_rows(path: str) -> Iterator[dict]:
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet files requires pyarrow, install it with 'pip install pyarrow'.") from e
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield from ({key: value for key, value in row.items() if value is not None} for row in batch.to_pylist())
+        return
+    with open(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                yield fast_json.loads(line)
+
+
+def point_id(information_piece: InformationPiece, source: str, position: int) -> str:
+    """
+    Derive a stable point ID from the ``id`` metadata of an information piece, or its position in the source.
+
+    Parameters
+    ----------
+    information_piece : InformationPiece
+        The information piece.
+    source : str
+        The file the information piece is read from.
+    position : int
+        The position of the information piece in the file.
+
+    Returns
+    -------
+    str
+        The point ID.
+    """
+    key = next((pair.value for pair in information_piece.metadata if pair.key == "id"), None)
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, key or f"{os.path.basename(source)}:{position}"))
+
+
+class BulkIndexer:
+    """Embeds information pieces in concurrent batches and writes them to Qdrant with parallel uploads."""
+
+    def __init__(
+        self,
+        vector_database: QdrantDatabase,
+        retrieval_mode: RetrievalMode,
+        embedder: Optional[Embedder],
+        sparse_embedder: Optional[SparseEmbeddings] = None,
+        embedding_model: Optional[str] = None,
+        sparse_embedding_model: Optional[str] = None,
+        citation_image_store: Optional[CitationImageStore] = None,
+        embed_batch_size: int = 64,
+        embed_workers: int = 4,
+        upload_parallel: int = 4,
+    ):
+        """
+        Initialize the BulkIndexer.
+
+        Parameters
+        ----------
+        vector_database : QdrantDatabase
+            The vector database the information pieces are written to.
+        retrieval_mode : RetrievalMode
+            The retrieval mode of the collection, deciding which vectors are computed.
+        embedder : Optional[Embedder]
+            The dense embedder; required unless the retrieval mode is sparse.
+        sparse_embedder : Optional[SparseEmbeddings]
+            The sparse embedder; required unless the retrieval mode is dense. Create it with ``parallel=0`` to
+            encode on all cores.
+        embedding_model : Optional[str]
+            The ID of the dense embedding model, see `QdrantDatabase`.
+        sparse_embedding_model : Optional[str]
+            The ID of the sparse embedding model, see `QdrantDatabase`.
+        citation_image_store : Optional[CitationImageStore]
+            The store images are moved to before writing (default None, meaning images stay in the payload).
+        embed_batch_size : int
+            The number of texts per request to the dense embedder (default 64).
+        embed_workers : int
+            The number of concurrent requests to the dense embedder (default 4).
+        upload_parallel : int
+            The number of processes writing points to Qdrant (default 4).
+        """
+        self._vector_database = vector_database
+        self._embedder = embedder
+        self._sparse_embedder = sparse_embedder
+        self._embedding_model = embedding_model
+        self._sparse_embedding_model = sparse_embedding_model
+        self._citation_image_store = citation_image_store
+        self._embed_batch_size = embed_batch_size
+        self._embed_workers = embed_workers
+        self._upload_parallel = upload_parallel
+        self._dense = retrieval_mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID)
+        self._sparse = retrieval_mode in (RetrievalMode.SPARSE, RetrievalMode.HYBRID)
+
+    def run(self, source: str, checkpoint_path: str, chunk_size: int = 1024) -> int:
+        """
+        Index the information pieces of a file, resuming from the checkpoint.
+
+        The checkpoint is only advanced after a chunk is written, so a failed run can be started again with the same
+        arguments.
+
+        Parameters
+        ----------
+        source : str
+            The JSONL or Parquet file the information pieces are read from.
+        checkpoint_path : str
+            The path of the checkpoint file.
+        chunk_size : int
+            The number of information pieces embedded and written at once (default 1024).
+
+        Returns
+        -------
+        int
+            The number of information pieces indexed by this run.
+        """
+        checkpoint = Checkpoint.load(checkpoint_path, source)
+        if checkpoint.position:
+            logger.info("Resuming %s after %d information pieces.", source, checkpoint.position)
+        started = time.perf_counter()
+        indexed = 0
+
+        def chunks() -> Iterator[DocumentChunk]:
+            position = checkpoint.position
+            for chunk in read_information_pieces(source, chunk_size, skip=checkpoint.position):
+                documents = [InformationPieceMapper.information_piece2langchain_document(piece) for piece in chunk]
+                if self._citation_image_store:
+                    documents = self._citation_image_store.offload(documents)
+                yield documents, [point_id(piece, source, position + offset) for offset, piece in enumerate(chunk)]
+                position += len(chunk)
+
+        def on_written(count: int) -> None:
+            nonlocal indexed
+            indexed += count
+            checkpoint.position += count
+            checkpoint.save(checkpoint_path)
+            logger.info("Indexed %d information pieces (%.0f/s).", indexed, indexed / (time.perf_counter() - started))
+
+        self.index(chunks(), on_written)
+        logger.info("Indexed %d information pieces of %s.", indexed, source)
+        return indexed
+
+    def index(
+        self,
+        chunks: Iterable[DocumentChunk],
+        on_written: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Embed and write chunks of documents, in order.
+
+        While a chunk is written, the next chunk is already being embedded. Vectors the documents already carry in
+        ``metadata["precomputed_vectors"]`` are kept.
+
+        Parameters
+        ----------
+        chunks : Iterable[DocumentChunk]
+            The documents of every chunk with their point IDs.
+        on_written : Optional[Callable[[int], None]]
+            Called with the number of documents after every written chunk (default None).
+
+        Returns
+        -------
+        int
+            The number of written documents.
+        """
+        written = 0
+        # Dense requests are I/O bound and run concurrently; the sparse encoder parallelizes over processes itself.
+        with (
+            ThreadPoolExecutor(self._embed_workers, thread_name_prefix="dense") as dense_executor,
+            ThreadPoolExecutor(1, thread_name_prefix="sparse") as sparse_executor,
+        ):
+            in_flight: deque[_EmbeddingChunk] = deque()
+            for documents, point_ids in chunks:
+                in_flight.append((documents, point_ids, *self._submit(documents, dense_executor, sparse_executor)))
+                if len(in_flight) < 2:
+                    continue
+                written += self._write(*in_flight.popleft(), on_written)
+            while in_flight:
+                written += self._write(*in_flight.popleft(), on_written)
+        self._vector_database.create_payload_indexes()
+        return written
+
+    def _missing(self, documents: list[Document], vector_key: str) -> list[str]:
+        return [
+            document.page_content
+            for document in documents
+            if not document.metadata.get(VectorDatabase.PRECOMPUTED_VECTORS_KEY, {}).get(vector_key)
+        ]
+
+    def _submit(
+        self, documents: list[Document], dense_executor: ThreadPoolExecutor, sparse_executor: ThreadPoolExecutor
+    ) -> tuple[list[Future], Optional[Future]]:
+        dense_futures = []
+        if self._dense:
+            texts = self._missing(documents, "dense_vector")
+            embedder = self._embedder.get_embedder()
+            dense_futures = [
+                dense_executor.submit(embedder.embed_documents, texts[start : start + self._embed_batch_size])
+                for start in range(0, len(texts), self._embed_batch_size)
+            ]
+        sparse_future = None
+        if self._sparse:
+            texts = self._missing(documents, "sparse_vector")
+            if texts:
+                sparse_future = sparse_executor.submit(self._sparse_embedder.embed_documents, texts)
+        return dense_futures, sparse_future
+
+    def _write(
+        self,
+        documents: list[Document],
+        point_ids: list[str],
+        dense_futures: list[Future],
+        sparse_future: Optional[Future],
+        on_written: Optional[Callable[[int], None]],
+    ) -> int:
+        dense_vectors = iter([vector for future in dense_futures for vector in future.result()])
+        sparse_vectors = iter(sparse_future.result() if sparse_future else [])
+        for document in documents:
+            precomputed = document.metadata.setdefault(VectorDatabase.PRECOMPUTED_VECTORS_KEY, {})
+            if self._dense and not precomputed.get("dense_vector"):
+                precomputed |= {"dense_vector": next(dense_vectors), "embedding_model": self._embedding_model}
+            if self._sparse and not precomputed.get("sparse_vector"):
+                vector = next(sparse_vectors)
+                precomputed |= {
+                    "sparse_vector": {"indices": list(vector.indices), "values": list(vector.values)},
+                    "sparse_embedding_model": self._sparse_embedding_model,
+                }
+        self._vector_database.upload_precomputed(documents, point_ids, parallel=self._upload_parallel)
+        if on_written:
+            on_written(len(documents))
+        return len(documents)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the bulk indexer from the command line, with the embedders and vector database of the settings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="JSONL or Parquet file with one information piece per line or row.")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default <source>.checkpoint.json).")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="Information pieces embedded and written at once.")
+    parser.add_argument("--embed-batch-size", type=int, default=64, help="Texts per request to the dense embedder.")
+    parser.add_argument("--embed-workers", type=int, default=4, help="Concurrent requests to the dense embedder.")
+    parser.add_argument("--upload-parallel", type=int, default=4, help="Processes writing points to Qdrant.")
+    parser.add_argument(
+        "--sparse-parallel", type=int, default=0, help="Processes of the sparse encoder (0 uses all cores)."
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from langchain_qdrant import FastEmbedSparse
+
+    from rag_core_api.dependency_container import DependencyContainer
+
+    container = DependencyContainer()
+    indexer = BulkIndexer(
+        vector_database=container.vector_database(),
+        retrieval_mode=DependencyContainer.vector_database_settings.retrieval_mode,
+        embedder=container.embedder(),
+        sparse_embedder=FastEmbedSparse(
+            **DependencyContainer.sparse_embedder_settings.model_dump(), parallel=args.sparse_parallel
+        ),
+        embedding_model=container.embedding_model(),
+        sparse_embedding_model=DependencyContainer.sparse_embedder_settings.model_name,
+        citation_image_store=container.citation_image_store(),
+        embed_batch_size=args.embed_batch_size,
+        embed_workers=args.embed_workers,
+        upload_parallel=args.upload_parallel,
+    )
+    indexer.run(args.source, args.checkpoint or f"{args.source}.checkpoint.json", chunk_size=args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""Re-embedding of a collection with new embedding models, followed by an atomic swap of the collection alias.
+
+``VECTOR_DB_COLLECTION_NAME`` names a Qdrant alias the backend searches. The points of the collection behind the
+alias are scrolled in batches and their stored page content is embedded with the configured embedders into a new
+collection, keeping point IDs and payloads, while chat is still served from the old collection. The new collection
+copies the configuration of the old one (HNSW, quantization, optimizers, on-disk storage, sharding), only the dense
+vector size follows the new embedding model. Afterwards the alias is repointed to the new collection in a single atomic
+request; the old collection is kept for a rollback::
+
+    python -m rag_core_api.tools.reembedding --target rag-v2 --embed-workers 8 --upload-parallel 4
+
+Uploads of information pieces should be paused while the collection is re-embedded: they are written to the old
+collection, and the alias is only swapped if the new collection has at least as many points as the old one.
+"""
+
+import argparse
+import logging
+import time
+from datetime import timedelta
+from typing import Iterator, Optional
+
+from langchain_core.documents import Document
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from rag_core_api.tools.bulk_indexer import BulkIndexer, DocumentChunk
+
+logger = logging.getLogger(__name__)
+
+
+class ReembeddingProgress:
+    """Logs the throughput and the estimated remaining time of a re-embedding."""
+
+    def __init__(self, total: int):
+        """
+        Initialize the ReembeddingProgress.
+
+        Parameters
+        ----------
+        total : int
+            The number of points to re-embed.
+        """
+        self.total = total
+        self.done = 0
+        self._started = time.perf_counter()
+
+    @property
+    def throughput(self) -> float:
+        """The number of points re-embedded per second."""
+        elapsed = time.perf_counter() - self._started
+        return self.done / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self) -> Optional[timedelta]:
+        """The estimated remaining time, None before the first batch."""
+        if not self.throughput:
+            return None
+        return timedelta(seconds=round(max(self.total - self.done, 0) / self.throughput))
+
+    def update(self, count: int) -> None:
+        """
+        Count re-embedded points and log the progress.
+
+        Parameters
+        ----------
+        count : int
+            The number of points re-embedded since the last update.
+
+        Returns
+        -------
+        None
+        """
+        self.done += count
+        logger.info(
+            "Re-embedded %d of %d points (%.0f points/s, ETA %s).", self.done, self.total, self.throughput, self.eta
+        )
+
+
+def resolve_alias(client: QdrantClient, alias: str) -> Optional[str]:
+    """
+    Return the collection an alias points to.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    alias : str
+        The name of the alias.
+
+    Returns
+    -------
+    Optional[str]
+        The name of the collection, None if there is no such alias.
+    """
+    return next(
+        (
+            description.collection_name
+            for description in client.get_aliases().aliases
+            if description.alias_name == alias
+        ),
+        None,
+    )
+
+
+def scroll_documents(
+    client: QdrantClient,
+    collection_name: str,
+    batch_size: int,
+    content_payload_key: str = "page_content",
+    metadata_payload_key: str = "metadata",
+) -> Iterator[DocumentChunk]:
+    """
+    Read all points of a collection in batches, without their vectors.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    collection_name : str
+        The collection to read.
+    batch_size : int
+        The number of points per batch.
+    content_payload_key : str
+        The payload key of the page content (default "page_content").
+    metadata_payload_key : str
+        The payload key of the metadata (default "metadata").
+
+    Yields
+    ------
+    DocumentChunk
+        The documents of a batch with their point IDs.
+    """
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        if points:
+            yield (
+                [
+                    Document(
+                        page_content=point.payload.get(content_payload_key, ""),
+                        metadata=point.payload.get(metadata_payload_key) or {},
+                    )
+                    for point in points
+                ],
+                [point.id for point in points],
+            )
+        if offset is None:
+            return
+
+
+def create_collection_like(client: QdrantClient, source: str, target: str, vector_size: Optional[int]) -> None:
+    """
+    Create a collection with the configuration of another one and dense vectors of another size.
+
+    The HNSW, quantization, optimizer, WAL and on-disk settings, the sparse vectors and the sharding of the source
+    are kept, including the settings of each dense vector.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    source : str
+        The collection to copy the configuration from.
+    target : str
+        The collection to create.
+    vector_size : Optional[int]
+        The size of the dense vectors, None to create the collection without dense vectors.
+
+    Returns
+    -------
+    None
+    """
+    config = client.get_collection(source).config
+    vectors = config.params.vectors
+    if vector_size is None:
+        vectors_config = {}
+    elif isinstance(vectors, models.VectorParams):
+        vectors_config = vectors.model_copy(update={"size": vector_size})
+    else:
+        vectors_config = {name: params.model_copy(update={"size": vector_size}) for name, params in vectors.items()}
+    client.create_collection(
+        target,
+        vectors_config=vectors_config,
+        sparse_vectors_config=config.params.sparse_vectors,
+        shard_number=config.params.shard_number,
+        sharding_method=config.params.sharding_method,
+        replication_factor=config.params.replication_factor,
+        write_consistency_factor=config.params.write_consistency_factor,
+        on_disk_payload=config.params.on_disk_payload,
+        hnsw_config=models.HnswConfigDiff(**config.hnsw_config.model_dump()),
+        optimizers_config=models.OptimizersConfigDiff(**config.optimizer_config.model_dump()),
+        wal_config=models.WalConfigDiff(**config.wal_config.model_dump()),
+        quantization_config=config.quantization_config,
+    )
+
+
+def swap_alias(client: QdrantClient, alias: str, target: str, replace_collection: bool = False) -> Optional[str]:
+    """
+    Point an alias to another collection.
+
+    Moving an existing alias is a single atomic request, so searches never see a missing collection. If the alias
+    name is still used by a collection, that collection has to be deleted before the alias can be created, which
+    makes the name unavailable for a moment.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    alias : str
+        The name of the alias.
+    target : str
+        The collection the alias should point to.
+    replace_collection : bool
+        Whether a collection named like the alias may be deleted (default False).
+
+    Returns
+    -------
+    Optional[str]
+        The collection the alias pointed to before, None if it was a collection or did not exist.
+
+    Raises
+    ------
+    ValueError
+        If a collection is named like the alias and ``replace_collection`` is not set.
+    """
+    previous = resolve_alias(client, alias)
+    operations = [
+        models.CreateAliasOperation(create_alias=models.CreateAlias(collection_name=target, alias_name=alias))
+    ]
+    if previous is not None:
+        operations.insert(0, models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=alias)))
+    elif client.collection_exists(alias):
+        if not replace_collection:
+            raise ValueError(f"'{alias}' is a collection, not an alias. Deleting it requires replace_collection.")
+        logger.warning("Deleting collection %s to replace it with an alias to %s.", alias, target)
+        client.delete_collection(alias)
+    client.update_collection_aliases(change_aliases_operations=operations)
+    logger.info("Alias %s now points to %s (before: %s).", alias, target, previous or alias)
+    return previous
+
+
+def reembed(
+    client: QdrantClient,
+    alias: str,
+    target: str,
+    indexer: BulkIndexer,
+    vector_size: Optional[int],
+    batch_size: int = 256,
+    swap: bool = True,
+    replace_collection: bool = False,
+) -> ReembeddingProgress:
+    """
+    Re-embed the collection behind an alias into a new collection and point the alias to it.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    alias : str
+        The alias the backend searches. May also be a collection, see `swap_alias`.
+    target : str
+        The new collection. The indexer has to write to it.
+    indexer : BulkIndexer
+        Embeds the documents with the new embedding models and writes them to the new collection.
+    vector_size : Optional[int]
+        The size of the new dense vectors, None without dense retrieval. Only used if the new collection is created.
+    batch_size : int
+        The number of points read and re-embedded at once (default 256).
+    swap : bool
+        Whether to point the alias to the new collection when done (default True).
+    replace_collection : bool
+        Whether a collection named like the alias may be deleted for the swap (default False).
+
+    Returns
+    -------
+    ReembeddingProgress
+        The number of re-embedded points and the throughput.
+
+    Raises
+    ------
+    ValueError
+        If the source collection is empty, or the new collection has fewer points than the old one.
+    """
+    source = resolve_alias(client, alias) or alias
+    if source == target:
+        raise ValueError(f"The new collection must differ from the current collection {source}.")
+    total = client.count(source, exact=True).count
+    if not total:
+        raise ValueError(f"Collection {source} has no points to re-embed.")
+    if not client.collection_exists(target):
+        create_collection_like(client, source, target, vector_size)
+    logger.info("Re-embedding %d points of %s into %s.", total, source, target)
+
+    progress = ReembeddingProgress(total)
+    indexer.index(scroll_documents(client, source, batch_size), progress.update)
+
+    source_count = client.count(source, exact=True).count
+    target_count = client.count(target, exact=True).count
+    if target_count < source_count:
+        raise ValueError(
+            f"{target} has {target_count} points, {source} {source_count}; were information pieces uploaded meanwhile?"
+        )
+    if swap:
+        swap_alias(client, alias, target, replace_collection=replace_collection)
+    return progress
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the re-embedding from the command line, with the embedders and vector database of the settings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alias", help="Alias the backend searches (default VECTOR_DB_COLLECTION_NAME).")
+    parser.add_argument("--target", help="New collection (default <alias>-<timestamp>).")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points read and re-embedded at once.")
+    parser.add_argument("--embed-batch-size", type=int, default=64, help="Texts per request to the dense embedder.")
+    parser.add_argument("--embed-workers", type=int, default=4, help="Concurrent requests to the dense embedder.")
+    parser.add_argument("--upload-parallel", type=int, default=4, help="Processes writing points to Qdrant.")
+    parser.add_argument(
+        "--sparse-parallel", type=int, default=0, help="Processes of the sparse encoder (0 uses all cores)."
+    )
+    parser.add_argument("--skip-swap", action="store_true", help="Keep the alias pointing to the old collection.")
+    parser.add_argument(
+        "--replace-collection",
+        action="store_true",
+        help="Delete a collection named like the alias to create the alias in its place.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from langchain_qdrant import FastEmbedSparse, QdrantVectorStore, RetrievalMode
+
+    from rag_core_api.dependency_container import DependencyContainer
+    from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+
+    container = DependencyContainer()
+    settings = DependencyContainer.vector_database_settings
+    alias = args.alias or settings.collection_name
+    target = args.target or f"{alias}-{time.strftime('%Y%m%d%H%M%S')}"
+    client = container.vectordb_client()
+    embedder = container.embedder()
+    sparse_embedder = FastEmbedSparse(
+        **DependencyContainer.sparse_embedder_settings.model_dump(), parallel=args.sparse_parallel
+    )
+    vector_database = QdrantDatabase(
+        settings=settings.model_copy(update={"collection_name": target}),
+        embedder=embedder,
+        sparse_embedder=sparse_embedder,
+        vectorstore=QdrantVectorStore(
+            client=client,
+            collection_name=target,
+            embedding=embedder.get_embedder(),
+            sparse_embedding=sparse_embedder,
+            retrieval_mode=settings.retrieval_mode,
+            validate_collection_config=False,
+        ),
+        embedding_model=container.embedding_model(),
+        sparse_embedding_model=DependencyContainer.sparse_embedder_settings.model_name,
+    )
+    indexer = BulkIndexer(
+        vector_database=vector_database,
+        retrieval_mode=settings.retrieval_mode,
+        embedder=embedder,
+        sparse_embedder=sparse_embedder,
+        embedding_model=container.embedding_model(),
+        sparse_embedding_model=DependencyContainer.sparse_embedder_settings.model_name,
+        embed_batch_size=args.embed_batch_size,
+        embed_workers=args.embed_workers,
+        upload_parallel=args.upload_parallel,
+    )
+    dense = settings.retrieval_mode in (RetrievalMode.DENSE, RetrievalMode.HYBRID)
+    progress = reembed(
+        client,
+        alias,
+        target,
+        indexer,
+        len(embedder.get_embedder().embed_query("dummy_text")) if dense else None,
+        batch_size=args.batch_size,
+        swap=not args.skip_swap,
+        replace_collection=args.replace_collection,
+    )
+    print(f"Re-embedded {progress.done} points into {target} ({progress.throughput:.0f} points/s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Harness measuring recall and latency of the approximate nearest neighbour search for a grid of search params.
+
+The query set is a JSONL file with one query per line, either as precomputed ``{"vector": [...]}`` or as
+``{"text": "..."}`` which is embedded with the configured embedder. Every query is searched exactly once to
+obtain the ground truth; afterwards the queries are replayed for every combination of search params::
+
+    python -m rag_core_api.tuning.ann_search_tuning queries.jsonl --k 10 --hnsw-ef 64 128 256 --oversampling 1 2
+"""
+
+import argparse
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
+from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+
+
+@dataclass
+class TuningResult:
+    """Recall and latency of the search with one combination of search params."""
+
+    search_params: dict
+    recall: float
+    p50_ms: float
+    p95_ms: float
+
+
+def parameter_grid(
+    hnsw_efs: Iterable[Optional[int]] = (None,),
+    oversamplings: Iterable[Optional[float]] = (None,),
+    rescores: Iterable[Optional[bool]] = (None,),
+) -> list[dict]:
+    """
+    Build every combination of the given search params.
+
+    The combinations use the format of ``RetrieverSettings.search_params``; unset values are left out.
+
+    Parameters
+    ----------
+    hnsw_efs : Iterable[Optional[int]]
+        The ``hnsw_ef`` values to try.
+    oversamplings : Iterable[Optional[float]]
+        The quantization oversampling factors to try.
+    rescores : Iterable[Optional[bool]]
+        Whether to rescore quantized results with the original vectors.
+
+    Returns
+    -------
+    list[dict]
+        The search params per combination.
+    """
+    grid = []
+    for hnsw_ef, oversampling, rescore in itertools.product(hnsw_efs, oversamplings, rescores):
+        params = {
+            "hnsw_ef": hnsw_ef,
+            "quantization_oversampling": oversampling,
+            "quantization_rescore": rescore,
+        }
+        grid.append({key: value for key, value in params.items() if value is not None})
+    return grid
+
+
+def evaluate(
+    client: QdrantClient,
+    collection_name: str,
+    query_vectors: list[list[float]],
+    grid: list[dict],
+    k: int = 10,
+    vector_name: Optional[str] = None,
+    query_filter: Optional[models.Filter] = None,
+) -> list[TuningResult]:
+    """
+    Measure recall@k against exact search and the search latency for every combination of search params.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The client of the Qdrant instance holding the collection.
+    collection_name : str
+        The name of the collection to search.
+    query_vectors : list[list[float]]
+        The dense query vectors.
+    grid : list[dict]
+        The search params to evaluate, see `parameter_grid`.
+    k : int
+        The number of results per query (default 10).
+    vector_name : Optional[str]
+        The name of the dense vector in the collection (default None, the unnamed vector).
+    query_filter : Optional[models.Filter]
+        The filter applied to every search (default None).
+
+    Returns
+    -------
+    list[TuningResult]
+        The result per combination, in the order of the grid.
+    """
+
+    def search(vector: list[float], params: Optional[models.SearchParams]) -> list:
+        return client.query_points(
+            collection_name,
+            query=vector,
+            using=vector_name or None,
+            query_filter=query_filter,
+            search_params=params,
+            limit=k,
+            with_payload=False,
+        ).points
+
+    exact = models.SearchParams(exact=True)
+    ground_truth = [{point.id for point in search(vector, exact)} for vector in query_vectors]
+
+    results = []
+    for search_params in grid:
+        params = QdrantDatabase._build_search_params(search_params)
+        latencies = []
+        hits = 0
+        expected = 0
+        for vector, relevant in zip(query_vectors, ground_truth):
+            start = time.perf_counter()
+            points = search(vector, params)
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += len(relevant & {point.id for point in points})
+            expected += len(relevant)
+        results.append(
+            TuningResult(
+                search_params=search_params,
+                recall=hits / expected if expected else 1.0,
+                p50_ms=float(np.percentile(latencies, 50)) if latencies else 0.0,
+                p95_ms=float(np.percentile(latencies, 95)) if latencies else 0.0,
+            )
+        )
+    return results
+
+
+def format_results(results: list[TuningResult], k: int) -> str:
+    """
+    Format the tuning results as a table.
+
+    Parameters
+    ----------
+    results : list[TuningResult]
+        The results to format.
+    k : int
+        The number of results per query the recall was measured for.
+
+    Returns
+    -------
+    str
+        One line per result, preceded by a header.
+    """
+    lines = [f"{'search params':<60} {'recall@' + str(k):>10} {'p50 ms':>9} {'p95 ms':>9}"]
+    for result in results:
+        params = json.dumps(result.search_params) if result.search_params else "defaults"
+        lines.append(f"{params:<60} {result.recall:>10.4f} {result.p50_ms:>9.2f} {result.p95_ms:>9.2f}")
+    return "\n".join(lines)
+
+
+def load_query_vectors(path: str) -> list[list[float]]:
+    """
+    Load the query vectors from a JSONL file, embedding text queries with the configured embedder.
+
+    Parameters
+    ----------
+    path : str
+        The path of the JSONL file.
+
+    Returns
+    -------
+    list[list[float]]
+        The query vectors in file order.
+    """
+    with open(path, encoding="utf-8") as file:
+        queries = [json.loads(line) for line in file if line.strip()]
+
+    texts = [query["text"] for query in queries if "vector" not in query]
+    embedded = iter([])
+    if texts:
+        from rag_core_api.dependency_container import DependencyContainer
+
+        embedder = DependencyContainer().embedder()
+        embedded = iter([embedder.embed_query(text) for text in texts])
+    return [query["vector"] if "vector" in query else next(embedded) for query in queries]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the tuning harness from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("queries", help="JSONL file with one query per line, as 'vector' or 'text'.")
+    parser.add_argument("--k", type=int, default=10, help="Number of results per query.")
+    parser.add_argument("--collection", help="Collection to search (default VECTOR_DB_COLLECTION_NAME).")
+    parser.add_argument("--location", help="Qdrant location (default VECTOR_DB_LOCATION).")
+    parser.add_argument("--vector-name", default="", help="Name of the dense vector in the collection.")
+    parser.add_argument("--type", help="Only search information pieces of this type, e.g. TEXT.")
+    parser.add_argument("--hnsw-ef", type=int, nargs="*", default=[], help="hnsw_ef values to try.")
+    parser.add_argument("--oversampling", type=float, nargs="*", default=[], help="Oversampling factors to try.")
+    parser.add_argument("--rescore", choices=["true", "false"], nargs="*", default=[], help="Rescore settings to try.")
+    args = parser.parse_args(argv)
+
+    if args.collection and args.location:
+        collection_name, location = args.collection, args.location
+    else:
+        settings = VectorDatabaseSettings()
+        collection_name = args.collection or settings.collection_name
+        location = args.location or settings.location
+
+    query_filter = None
+    if args.type:
+        query_filter = models.Filter(
+            must=[models.FieldCondition(key="metadata.type", match=models.MatchValue(value=args.type))]
+        )
+    grid = parameter_grid(
+        hnsw_efs=args.hnsw_ef or [None],
+        oversamplings=args.oversampling or [None],
+        rescores=[value == "true" for value in args.rescore] or [None],
+    )
+    results = evaluate(
+        QdrantClient(location=location),
+        collection_name,
+        load_query_vectors(args.queries),
+        grid,
+        k=args.k,
+        vector_name=args.vector_name,
+        query_filter=query_filter,
+    )
+    print(format_results(results, args.k))
+
+
+if __name__ == "__main__":
+    main()
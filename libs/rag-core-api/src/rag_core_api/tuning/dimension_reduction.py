@@ -0,0 +1,210 @@
+"""Fitting of PCA projections and measurement of the recall impact of dimension-reduced embeddings.
+
+A sample of the information pieces of the collection is embedded with the configured embedder at full dimension.
+``fit`` fits a PCA projection on the sample and writes it to a ``.npz`` file, to be set as
+``EMBEDDING_REDUCTION_PROJECTION_PATH``; ``recall`` compares the exact top-k neighbours of queries at full
+dimension with those after every given reduction::
+
+    python -m rag_core_api.tuning.dimension_reduction fit --dimensions 256 --sample 20000
+    python -m rag_core_api.tuning.dimension_reduction recall --truncate 256 512 --projection rag.pca-256.npz
+
+Without a query file, ``--query-count`` sampled information pieces are held out and used as queries.
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from qdrant_client import QdrantClient
+
+from rag_core_api.tools.reembedding import scroll_documents
+from rag_core_lib.impl.embeddings.embedder import Embedder
+from rag_core_lib.impl.embeddings.embedding_reducer import EmbeddingReducer
+from rag_core_lib.impl.embeddings.pca_reducer import PcaReducer
+from rag_core_lib.impl.embeddings.truncation_reducer import TruncationReducer
+
+
+@dataclass
+class ReductionResult:
+    """Recall and vector size of one reduction."""
+
+    reduction: str
+    dimensions: int
+    recall: float
+    size_ratio: float
+
+
+def exact_top_k(documents: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    Find the k documents with the highest cosine similarity for every query.
+
+    Parameters
+    ----------
+    documents : np.ndarray
+        The document embeddings, one per row.
+    queries : np.ndarray
+        The query embeddings, one per row.
+    k : int
+        The number of neighbours per query.
+
+    Returns
+    -------
+    np.ndarray
+        The indices of the neighbours, one row per query, in no particular order.
+    """
+
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    k = min(k, len(documents))
+    scores = normalize(queries) @ normalize(documents).T
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def evaluate(
+    document_embeddings: np.ndarray,
+    query_embeddings: np.ndarray,
+    reducers: list[EmbeddingReducer],
+    k: int = 10,
+) -> list[ReductionResult]:
+    """
+    Measure recall@k of every reduction against exact search at full dimension.
+
+    Parameters
+    ----------
+    document_embeddings : np.ndarray
+        The full document embeddings, one per row.
+    query_embeddings : np.ndarray
+        The full query embeddings, one per row.
+    reducers : list[EmbeddingReducer]
+        The reductions to evaluate.
+    k : int
+        The number of neighbours per query (default 10).
+
+    Returns
+    -------
+    list[ReductionResult]
+        The result per reduction, in the order of the reducers.
+    """
+    full_dimensions = document_embeddings.shape[1]
+    ground_truth = exact_top_k(document_embeddings, query_embeddings, k)
+    results = []
+    for reducer in reducers:
+        neighbours = exact_top_k(reducer.reduce(document_embeddings), reducer.reduce(query_embeddings), k)
+        hits = sum(len(set(expected) & set(found)) for expected, found in zip(ground_truth, neighbours))
+        results.append(
+            ReductionResult(
+                reduction=reducer.name,
+                dimensions=reducer.dimensions,
+                recall=hits / ground_truth.size if ground_truth.size else 1.0,
+                size_ratio=reducer.dimensions / full_dimensions,
+            )
+        )
+    return results
+
+
+def format_results(results: list[ReductionResult], k: int) -> str:
+    """
+    Format the evaluation results as a table.
+
+    Parameters
+    ----------
+    results : list[ReductionResult]
+        The results to format.
+    k : int
+        The number of neighbours per query the recall was measured for.
+
+    Returns
+    -------
+    str
+        One line per result, preceded by a header.
+    """
+    lines = [f"{'reduction':<30} {'dims':>6} {'recall@' + str(k):>10} {'size':>7}"]
+    for result in results:
+        lines.append(f"{result.reduction:<30} {result.dimensions:>6} {result.recall:>10.4f} {result.size_ratio:>6.1%}")
+    return "\n".join(lines)
+
+
+def sample_embeddings(
+    client: QdrantClient, collection_name: str, embedder: Embedder, sample: int, batch_size: int = 256
+) -> np.ndarray:
+    """
+    Embed the page content of the first information pieces of a collection at full dimension.
+
+    Parameters
+    ----------
+    client : QdrantClient
+        The Qdrant client.
+    collection_name : str
+        The collection to read.
+    embedder : Embedder
+        The embedder without reduction.
+    sample : int
+        The maximum number of information pieces.
+    batch_size : int
+        The number of information pieces read and embedded at once (default 256).
+
+    Returns
+    -------
+    np.ndarray
+        The embeddings, one per row.
+    """
+    embeddings = []
+    for documents, _ in scroll_documents(client, collection_name, min(batch_size, sample)):
+        texts = [document.page_content for document in documents][: sample - len(embeddings)]
+        embeddings.extend(embedder.get_embedder().embed_documents(texts))
+        if len(embeddings) >= sample:
+            break
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Fit a projection or measure the recall impact from the command line, with the settings of the backend."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collection", help="Collection to sample (default VECTOR_DB_COLLECTION_NAME).")
+    parser.add_argument("--sample", type=int, default=10000, help="Number of information pieces to embed.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Information pieces embedded at once.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    fit = commands.add_parser("fit", help="Fit a PCA projection on the sample.")
+    fit.add_argument("--dimensions", type=int, required=True, help="Number of principal components to keep.")
+    fit.add_argument("--output", help="Path of the projection (default <collection>.pca-<dimensions>.npz).")
+    recall = commands.add_parser("recall", help="Measure recall@k of reductions against the full embeddings.")
+    recall.add_argument("--k", type=int, default=10, help="Number of neighbours per query.")
+    recall.add_argument("--truncate", type=int, nargs="*", default=[], help="Truncated dimensions to try.")
+    recall.add_argument("--projection", nargs="*", default=[], help="PCA projections to try.")
+    recall.add_argument("--queries", help="JSONL file with one query per line as 'text'.")
+    recall.add_argument("--query-count", type=int, default=200, help="Held-out pieces used as queries.")
+    args = parser.parse_args(argv)
+
+    from rag_core_api.dependency_container import DependencyContainer
+
+    container = DependencyContainer()
+    collection_name = args.collection or DependencyContainer.vector_database_settings.collection_name
+    embedder = container.base_embedder()
+    embeddings = sample_embeddings(
+        container.vectordb_client(), collection_name, embedder, args.sample, batch_size=args.batch_size
+    )
+
+    if args.command == "fit":
+        output = args.output or f"{collection_name}.pca-{args.dimensions}.npz"
+        reducer = PcaReducer.fit(embeddings, args.dimensions)
+        reducer.save(output)
+        print(f"Wrote projection {reducer.name} fitted on {len(embeddings)} embeddings to {output}.")
+        return
+
+    if args.queries:
+        with open(args.queries, encoding="utf-8") as file:
+            texts = [json.loads(line)["text"] for line in file if line.strip()]
+        queries = np.asarray([embedder.get_embedder().embed_query(text) for text in texts], dtype=np.float32)
+    else:
+        embeddings, queries = embeddings[: -args.query_count], embeddings[-args.query_count :]
+    reducers = [TruncationReducer(dimensions) for dimensions in args.truncate]
+    reducers += [PcaReducer.load(path) for path in args.projection]
+    print(format_results(evaluate(embeddings, queries, reducers, k=args.k), args.k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Microbenchmark of the serialization of information pieces, comparing the standard library with the fast path.
+
+An upload body with synthetic information pieces is decoded, validated and mapped to documents, and the documents
+are mapped back to information pieces and encoded as a response would be. Every step is measured with the
+standard library ``json`` and one model per metadata entry, and with orjson and the single-call validation used
+by the API::
+
+    python -m rag_core_api.tuning.serialization_benchmark --pieces 10000 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import orjson
+from langchain_core.documents import Document as LangchainDocument
+from pydantic import TypeAdapter
+
+from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.key_value_pair import KeyValuePair
+
+_PIECES_ADAPTER = TypeAdapter(list[InformationPiece])
+
+
+@dataclass
+class BenchmarkResult:
+    """Median duration of one step with the standard library and with the fast path."""
+
+    step: str
+    baseline_ms: float
+    fast_ms: float
+
+    @property
+    def speedup(self) -> float:
+        """The baseline duration divided by the fast path duration."""
+        return self.baseline_ms / self.fast_ms if self.fast_ms else float("inf")
+
+
+def build_upload_body(pieces: int, metadata_keys: int = 8, content_length: int = 1000) -> bytes:
+    """
+    Build the JSON body of an upload request with synthetic information pieces.
+
+    Parameters
+    ----------
+    pieces : int
+        The number of information pieces.
+    metadata_keys : int
+        The number of metadata fields besides the required ones (default 8).
+    content_length : int
+        The length of the page content of every piece (default 1000).
+
+    Returns
+    -------
+    bytes
+        The request body.
+    """
+    body = []
+    for index in range(pieces):
+        metadata = {
+            "id": uuid.uuid4().hex,
+            "type": "TEXT",
+            "related": [],
+            "document": "benchmark.pdf",
+            "document_url": "http://example.com/benchmark.pdf",
+            "page": index // 10,
+        } | {f"field_{key}": f"value {key} of piece {index}" for key in range(metadata_keys)}
+        body.append(
+            {
+                "page_content": ("lorem ipsum dolor sit amet " * (content_length // 27 + 1))[:content_length],
+                "type": "TEXT",
+                "metadata": [{"key": key, "value": json.dumps(value)} for key, value in metadata.items()],
+            }
+        )
+    return json.dumps(body).encode()
+
+
+def _baseline_piece2document(piece: InformationPiece) -> LangchainDocument:
+    metadata = {x.key: json.loads(x.value) for x in piece.metadata}
+    return LangchainDocument(page_content=piece.page_content, metadata=metadata)
+
+
+def _baseline_document2piece(document: LangchainDocument) -> InformationPiece:
+    metadata = [
+        KeyValuePair(key=key, value=json.dumps(value if isinstance(value, dict) else str(value)))
+        for key, value in document.metadata.items()
+    ]
+    return InformationPiece(page_content=document.page_content, metadata=metadata, type=document.metadata["type"])
+
+
+def _median_ms(function: Callable[[], Any], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def run(pieces: int = 10000, repeat: int = 5) -> list[BenchmarkResult]:
+    """
+    Measure every step of the serialization with the standard library and with the fast path.
+
+    Parameters
+    ----------
+    pieces : int
+        The number of information pieces of the upload (default 10000).
+    repeat : int
+        How often every step is measured; the median is reported (default 5).
+
+    Returns
+    -------
+    list[BenchmarkResult]
+        The result per step, followed by the total.
+    """
+    body = build_upload_body(pieces)
+    decoded = orjson.loads(body)
+    information_pieces = _PIECES_ADAPTER.validate_python(decoded)
+    piece2document = InformationPieceMapper.information_piece2langchain_document
+    document2piece = InformationPieceMapper.langchain_document2information_piece
+    documents = [piece2document(piece) for piece in information_pieces]
+    mapped_pieces = [document2piece(document) for document in documents]
+
+    steps = [
+        ("decode upload body", lambda: json.loads(body), lambda: orjson.loads(body)),
+        (
+            "map pieces to documents",
+            lambda: [_baseline_piece2document(piece) for piece in information_pieces],
+            lambda: [piece2document(piece) for piece in information_pieces],
+        ),
+        (
+            "map documents to pieces",
+            lambda: [_baseline_document2piece(document) for document in documents],
+            lambda: [document2piece(document) for document in documents],
+        ),
+        (
+            "encode response",
+            lambda: json.dumps([piece.to_dict() for piece in mapped_pieces]),
+            lambda: _PIECES_ADAPTER.dump_json(mapped_pieces),
+        ),
+    ]
+    results = [
+        BenchmarkResult(step, _median_ms(baseline, repeat), _median_ms(fast, repeat)) for step, baseline, fast in steps
+    ]
+    results.append(
+        BenchmarkResult(
+            "total",
+            sum(result.baseline_ms for result in results),
+            sum(result.fast_ms for result in results),
+        )
+    )
+    return results
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """
+    Format the benchmark results as a table.
+
+    Parameters
+    ----------
+    results : list[BenchmarkResult]
+        The results to format.
+
+    Returns
+    -------
+    str
+        One line per result, preceded by a header.
+    """
+    lines = [f"{'step':<28} {'json ms':>10} {'fast ms':>10} {'speedup':>8}"]
+    for result in results:
+        lines.append(f"{result.step:<28} {result.baseline_ms:>10.1f} {result.fast_ms:>10.1f} {result.speedup:>7.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pieces", type=int, default=10000, help="Number of information pieces of the upload.")
+    parser.add_argument("--repeat", type=int, default=5, help="How often every step is measured.")
+    args = parser.parse_args(argv)
+    print(format_results(run(args.pieces, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
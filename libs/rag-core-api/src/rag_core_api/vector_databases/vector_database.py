@@ -1,5 +1,6 @@
 """Module for the VectorDatabase abstract class."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from langchain_community.vectorstores import VectorStore
@@ -9,9 +10,32 @@ from langchain_qdrant import SparseEmbeddings
 from rag_core_api.embeddings.embedder import Embedder
 from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
 
+# The documents per query and search of a batch search, i.e. ``result[query_index][search_index]``.
+BatchSearchResult = list[list[list[Document]]]
+
 
 class VectorDatabase(ABC):
-    """Abstract base class for a vector database."""
+    """Abstract base class for a vector database.
+
+    Attributes
+    ----------
+    TENANT_KEY : str
+        The metadata key of the tenant an information piece belongs to. As filter kwarg it selects the tenant
+        a search is run for.
+    PARTIAL_PAYLOAD_KEY : str
+        The metadata key marking a search hit whose metadata was projected to a subset of its fields.
+    PRECOMPUTED_VECTORS_KEY : str
+        The metadata key of documents to upload carrying vectors computed by the client, as dict with the
+        ``dense_vector``, ``sparse_vector``, ``embedding_model`` and ``sparse_embedding_model``. It is not stored.
+    DENSE_VECTOR_KEY : str
+        The metadata key of the stored dense vector of a search hit. Only set if the search kwarg ``with_vectors``
+        is true and the implementation can return the vectors with the hits.
+    """
+
+    TENANT_KEY = "tenant_id"
+    PARTIAL_PAYLOAD_KEY = "partial_payload"
+    PRECOMPUTED_VECTORS_KEY = "precomputed_vectors"
+    DENSE_VECTOR_KEY = "dense_vector"
 
     def __init__(
         self,
@@ -79,6 +103,86 @@ class VectorDatabase(ABC):
         """
         raise NotImplementedError()
 
+    async def abatch_search(self, queries: list[str], searches: list[tuple[dict, dict | None]]) -> BatchSearchResult:
+        """Run every search for every query.
+
+        Implementations should override this to embed the queries once and send the searches as a single batch.
+
+        Parameters
+        ----------
+        queries : list[str]
+            The search query strings.
+        searches : list[tuple[dict, dict | None]]
+            The searches as pairs of search kwargs and filter kwargs, see `asearch`.
+
+        Returns
+        -------
+        BatchSearchResult
+            The documents per query and search, i.e. ``result[query_index][search_index]``.
+        """
+        results = await asyncio.gather(
+            *(
+                self.asearch(query=query, search_kwargs=search_kwargs, filter_kwargs=filter_kwargs)
+                for query in queries
+                for search_kwargs, filter_kwargs in searches
+            )
+        )
+        return [results[i * len(searches) : (i + 1) * len(searches)] for i in range(len(queries))]
+
+    def get_documents_by_ids(self, document_ids: list[str], filter_kwargs: dict | None = None) -> list[Document]:
+        """Return the documents with the given IDs.
+
+        Implementations that cannot look up documents by ID return an empty list.
+
+        Parameters
+        ----------
+        document_ids : list[str]
+            The IDs (``metadata["id"]``) of the documents.
+        filter_kwargs : dict | None
+            Metadata filters the documents must match, with the tenant routed like in ``asearch``
+            (default None, meaning no filter, e.g. to complete documents that were already retrieved).
+
+        Returns
+        -------
+        list[Document]
+            The documents found, in the order of the IDs. Missing IDs are ignored.
+        """
+        return []
+
+    def get_vectors(self, document_ids: list[str]) -> dict[str, list[float]]:
+        """Return the stored dense vectors of the documents with the given IDs.
+
+        Implementations that cannot return the stored vectors return an empty dict.
+
+        Parameters
+        ----------
+        document_ids : list[str]
+            The IDs (``metadata["id"]``) of the documents.
+
+        Returns
+        -------
+        dict[str, list[float]]
+            The dense vector per document ID. Missing IDs are ignored.
+        """
+        return {}
+
+    def hydrate(self, documents: list[Document]) -> list[Document]:
+        """Load the complete metadata of search hits that were returned with a projected payload.
+
+        Implementations that never project the payload return the documents unchanged.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents, possibly marked with ``PARTIAL_PAYLOAD_KEY``.
+
+        Returns
+        -------
+        list[Document]
+            The documents in the same order with their complete metadata.
+        """
+        return documents
+
     @abstractmethod
     def upload(self, documents: list[Document]):
         """Upload the documents to the vector database.
@@ -103,7 +207,7 @@ class VectorDatabase(ABC):
         Parameters
         ----------
         delete_request : dict
-            Contains the information required for deleting the documents.
+            Contains the information required for deleting the documents. A list value matches any of its elements.
 
         Raises
         ------
@@ -0,0 +1,41 @@
+"""Tests for the search params of the RetrieverSettings and the ANN tuning harness."""
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from rag_core_api.impl.settings.retriever_settings import RetrieverSettings
+from rag_core_api.tuning.ann_search_tuning import evaluate, parameter_grid
+
+
+def test_search_params_apply_overrides_per_content_type():
+    """Use the global search params unless the content type overrides them."""
+    settings = RetrieverSettings(
+        hnsw_ef=128,
+        quantization_rescore=True,
+        search_params_by_type={"IMAGE": {"exact": True, "hnsw_ef": None}},
+    )
+
+    assert settings.search_params("TEXT") == {"hnsw_ef": 128, "quantization_rescore": True}
+    assert settings.search_params("IMAGE") == {"exact": True, "quantization_rescore": True}
+
+
+def test_evaluate_reports_recall_and_latency_per_combination():
+    """Replay the queries for every combination and compare the results with exact search."""
+    client = QdrantClient(location=":memory:")
+    client.create_collection("rag", vectors_config=models.VectorParams(size=8, distance=models.Distance.COSINE))
+    rng = np.random.default_rng(0)
+    client.upsert(
+        "rag",
+        points=[models.PointStruct(id=i, vector=vector.tolist()) for i, vector in enumerate(rng.random((50, 8)))],
+    )
+    grid = parameter_grid(hnsw_efs=[None, 64], rescores=[True])
+
+    results = evaluate(client, "rag", rng.random((5, 8)).tolist(), grid, k=5)
+
+    assert [result.search_params for result in results] == [
+        {"quantization_rescore": True},
+        {"hnsw_ef": 64, "quantization_rescore": True},
+    ]
+    assert all(result.recall == 1.0 for result in results)
+    assert all(0 <= result.p50_ms <= result.p95_ms for result in results)
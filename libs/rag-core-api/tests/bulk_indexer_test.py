@@ -0,0 +1,95 @@
+"""Tests for the offline bulk indexer."""
+
+import json
+
+import pytest
+from langchain_community.embeddings.fake import FakeEmbeddings
+from langchain_core.documents import Document
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
+
+from rag_core_api.impl.embeddings.langchain_community_embedder import LangchainCommunityEmbedder
+from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
+from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+from rag_core_api.tools.bulk_indexer import BulkIndexer, Checkpoint
+
+
+class _FailingEmbeddings(FakeEmbeddings):
+    """Fails after embedding the given number of batches, like a crashed run."""
+
+    calls: int = 0
+    fail_after: int = 1
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        if self.calls > self.fail_after:
+            raise RuntimeError("embedder crashed")
+        return super().embed_documents(texts)
+
+
+def _write_corpus(path, pieces: int) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(pieces):
+            metadata = {"id": f"piece-{index}", "type": "TEXT", "related": [], "document_url": "http://example.com"}
+            piece = {
+                "page_content": f"Information piece {index}",
+                "type": "TEXT",
+                "metadata": [{"key": key, "value": json.dumps(value)} for key, value in metadata.items()],
+            }
+            file.write(json.dumps(piece) + "\n")
+
+
+def _database() -> QdrantDatabase:
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    vectorstore = QdrantVectorStore.from_documents(
+        [Document(page_content="An existing piece", metadata={"id": "piece-x", "type": "TEXT", "related": []})],
+        embedding=embedder.get_embedder(),
+        location=":memory:",
+        collection_name="rag",
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+    return QdrantDatabase(
+        settings=settings, embedder=embedder, sparse_embedder=None, vectorstore=vectorstore, embedding_model="fake-8"
+    )
+
+
+def _indexer(database: QdrantDatabase, embeddings: FakeEmbeddings) -> BulkIndexer:
+    return BulkIndexer(
+        vector_database=database,
+        retrieval_mode=RetrievalMode.DENSE,
+        embedder=LangchainCommunityEmbedder(embedder=embeddings),
+        embedding_model="fake-8",
+        embed_batch_size=2,
+        embed_workers=2,
+        upload_parallel=1,
+    )
+
+
+def test_bulk_indexer_resumes_a_crashed_run_from_the_checkpoint(tmp_path):
+    """Index every information piece exactly once, although the first run crashed."""
+    source = str(tmp_path / "corpus.jsonl")
+    checkpoint_path = str(tmp_path / "corpus.checkpoint.json")
+    _write_corpus(source, pieces=10)
+    database = _database()
+
+    with pytest.raises(RuntimeError):
+        _indexer(database, _FailingEmbeddings(size=8, fail_after=2)).run(source, checkpoint_path, chunk_size=4)
+
+    position = Checkpoint.load(checkpoint_path, source).position
+    assert 0 < position < 10
+
+    indexed = _indexer(database, FakeEmbeddings(size=8)).run(source, checkpoint_path, chunk_size=4)
+
+    assert indexed == 10 - position
+    assert Checkpoint.load(checkpoint_path, source).position == 10
+    # The existing piece and every piece of the corpus, without duplicates.
+    assert database._vectorstore.client.count("rag").count == 11
+
+
+def test_checkpoint_of_another_source_is_rejected(tmp_path):
+    """Refuse to resume from the checkpoint of another source file."""
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    Checkpoint(source="a.jsonl", position=3).save(checkpoint_path)
+
+    with pytest.raises(ValueError, match="belongs to a.jsonl"):
+        Checkpoint.load(checkpoint_path, "b.jsonl")
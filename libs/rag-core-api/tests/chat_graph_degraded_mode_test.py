@@ -0,0 +1,66 @@
+"""Test the extractive fallback answer of ``DefaultChatGraph``."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+
+from rag_core_api.impl.graph.chat_graph import DefaultChatGraph, GraphNodeNames
+from rag_core_api.impl.settings.chat_history_settings import ChatHistorySettings
+from rag_core_api.impl.settings.degraded_mode_settings import DegradedModeSettings
+from rag_core_api.impl.settings.error_messages import ErrorMessages
+from rag_core_api.models.content_type import ContentType
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_lib.impl.utils.deadline import DEADLINE_METADATA_KEY, deadline_in
+
+
+def _mk_graph(**settings) -> DefaultChatGraph:
+    return DefaultChatGraph(
+        answer_generation_chain=MagicMock(),
+        rephrasing_chain=MagicMock(),
+        language_detection_chain=MagicMock(),
+        composed_retriever=MagicMock(),
+        mapper=MagicMock(),
+        error_messages=ErrorMessages(),
+        chat_history_settings=ChatHistorySettings(),
+        degraded_mode_settings=DegradedModeSettings(enabled=True, **settings),
+    )
+
+
+def _mk_piece(content: str, content_type: ContentType = ContentType.TEXT) -> InformationPiece:
+    return InformationPiece(metadata=[], page_content=content, type=content_type)
+
+
+def test_edge_routes_to_extractive_answer_when_concurrency_limit_is_reached():
+    """Answer extractively once all generation slots are taken."""
+    graph = _mk_graph(max_concurrent_generations=1)
+    state = {"information_pieces": [_mk_piece("a")]}
+
+    assert graph._docs_retrieved_edge(state) == GraphNodeNames.GENERATE
+    graph._active_generations = 1
+    assert graph._docs_retrieved_edge(state) == GraphNodeNames.EXTRACTIVE_GENERATE
+
+
+def test_edge_routes_to_extractive_answer_when_deadline_is_near():
+    """Answer extractively if the remaining budget is too small for the LLM."""
+    graph = _mk_graph(min_remaining_seconds=5)
+    state = {"information_pieces": [_mk_piece("a")]}
+
+    near = RunnableConfig(metadata={DEADLINE_METADATA_KEY: deadline_in(1.0)})
+    far = RunnableConfig(metadata={DEADLINE_METADATA_KEY: deadline_in(60.0)})
+    assert graph._docs_retrieved_edge(state, near) == GraphNodeNames.EXTRACTIVE_GENERATE
+    assert graph._docs_retrieved_edge(state, far) == GraphNodeNames.GENERATE
+
+
+@pytest.mark.asyncio
+async def test_extractive_answer_uses_top_text_passages_as_citations():
+    """Build the answer from the top passages and flag it in the finish reason."""
+    graph = _mk_graph(max_passages=2)
+    pieces = [_mk_piece("image", ContentType.IMAGE), _mk_piece("first"), _mk_piece("second"), _mk_piece("third")]
+
+    result = await graph._extractive_generate_node({"information_pieces": pieces})
+
+    response = result["response"]
+    assert response.answer == "first\n\nsecond"
+    assert [c.page_content for c in response.citations] == ["first", "second"]
+    assert response.finish_reason == "DegradedExtractiveAnswer"
@@ -0,0 +1,58 @@
+"""Test the small talk routing of ``DefaultChatGraph``."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rag_core_api.impl.graph.chat_graph import DefaultChatGraph
+from rag_core_api.impl.message_classification.rule_based_message_classifier import (
+    RuleBasedMessageClassifier,
+)
+from rag_core_api.impl.settings.chat_history_settings import ChatHistorySettings
+from rag_core_api.impl.settings.error_messages import ErrorMessages
+from rag_core_api.impl.settings.small_talk_settings import SmallTalkSettings
+from rag_core_api.models.chat_request import ChatRequest
+
+
+def _graph(retriever: MagicMock, language_detection_chain: MagicMock) -> DefaultChatGraph:
+    settings = SmallTalkSettings(enabled=True, greeting_response={"en": "Hello!", "de": "Hallo!"})
+    return DefaultChatGraph(
+        answer_generation_chain=MagicMock(),
+        rephrasing_chain=MagicMock(),
+        language_detection_chain=language_detection_chain,
+        composed_retriever=retriever,
+        mapper=MagicMock(),
+        error_messages=ErrorMessages(),
+        chat_history_settings=ChatHistorySettings(),
+        message_classifier=RuleBasedMessageClassifier(),
+        small_talk_settings=settings,
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_talk_skips_language_detection_and_retrieval():
+    """Answer a greeting with the configured response without touching the retriever or an LLM."""
+    retriever = MagicMock()
+    retriever.ainvoke = AsyncMock()
+    language_detection_chain = MagicMock()
+    language_detection_chain.ainvoke = AsyncMock(return_value="en")
+
+    response = await _graph(retriever, language_detection_chain).ainvoke(ChatRequest(message="Hi there!"))
+
+    assert response.answer == "Hello!"
+    assert response.citations == []
+    assert response.finish_reason == "SmallTalk"
+    retriever.ainvoke.assert_not_called()
+    language_detection_chain.ainvoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_small_talk_is_answered_in_the_language_of_the_message():
+    """Answer a German greeting with the German response although the language detection is skipped."""
+    language_detection_chain = MagicMock()
+    language_detection_chain.ainvoke = AsyncMock(return_value="en")
+
+    response = await _graph(MagicMock(), language_detection_chain).ainvoke(ChatRequest(message="Guten Morgen!"))
+
+    assert response.answer == "Hallo!"
+    language_detection_chain.ainvoke.assert_not_called()
@@ -0,0 +1,63 @@
+"""Tests for storing the images of image pieces in the object storage."""
+
+import base64
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.documents import Document
+
+from mocks.mock_file_service import MockFileService
+from rag_core_api.impl.api_endpoints.default_citation_image_retriever import DefaultCitationImageRetriever
+from rag_core_api.impl.file_services.citation_image_store import CitationImageStore
+from rag_core_api.impl.settings.image_storage_settings import ImageStorageSettings
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+def _image_document() -> Document:
+    return Document(
+        page_content="A diagram",
+        metadata={"type": "IMAGE", "base64_image": base64.b64encode(PNG).decode(), "document_url": "doc.pdf"},
+    )
+
+
+def test_offload_replaces_image_content_with_reference():
+    """Store each distinct image once and keep only its ID in the metadata."""
+    file_service = MockFileService()
+    store = CitationImageStore(file_service, ImageStorageSettings(enabled=True))
+    text = Document(page_content="Some text", metadata={"type": "TEXT", "document_url": "doc.pdf"})
+
+    documents = store.offload([_image_document(), _image_document(), text])
+
+    image_id = documents[0].metadata["image_id"]
+    assert image_id.endswith(".png")
+    assert "base64_image" not in documents[0].metadata
+    assert documents[1].metadata["image_id"] == image_id
+    assert documents[2].metadata == {"type": "TEXT", "document_url": "doc.pdf"}
+    assert file_service.files == {f"citation-images/{image_id}": PNG}
+
+
+def test_offload_rejects_invalid_base64():
+    """Reject image pieces whose content is not base64."""
+    store = CitationImageStore(MockFileService(), ImageStorageSettings(enabled=True))
+    document = Document(page_content="A diagram", metadata={"type": "IMAGE", "base64_image": "not base64!"})
+
+    with pytest.raises(ValueError, match="not valid base64"):
+        store.offload([document])
+
+
+@pytest.mark.asyncio
+async def test_citation_image_retriever_serves_stored_image():
+    """Serve stored images with their media type and reject unknown or malformed IDs."""
+    store = CitationImageStore(MockFileService(), ImageStorageSettings(enabled=True))
+    image_id = store.offload([_image_document()])[0].metadata["image_id"]
+    retriever = DefaultCitationImageRetriever(store)
+
+    response = await retriever.aget_citation_image(image_id)
+
+    assert response.body == PNG
+    assert response.media_type == "image/png"
+    for unknown_id in ["0" * 64 + ".png", "../documents/secret.pdf"]:
+        with pytest.raises(HTTPException) as error:
+            await retriever.aget_citation_image(unknown_id)
+        assert error.value.status_code == 404
@@ -16,8 +16,15 @@ from typing import Iterable
 
 import pytest
 from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
 
 from rag_core_api.impl.retriever.composite_retriever import CompositeRetriever
+from rag_core_api.impl.retriever.retriever_quark import RetrieverQuark
+from rag_core_api.impl.settings.chat_deadline_settings import ChatDeadlineSettings
+from rag_core_api.impl.settings.coarse_to_fine_settings import CoarseToFineSettings
+from rag_core_api.impl.settings.diversity_settings import DiversitySettings
+from rag_core_api.vector_databases.vector_database import VectorDatabase
+from rag_core_lib.impl.utils.deadline import DEADLINE_METADATA_KEY, deadline_in
 from rag_core_lib.impl.data_types.content_type import ContentType
 from mocks.mock_vector_db import MockVectorDB
 from mocks.mock_retriever_quark import MockRetrieverQuark
@@ -48,9 +55,9 @@ async def test_use_summaries_expands_and_removes_summary():
     underlying = _mk_doc("doc1", score=0.9)
     summary = _mk_doc("sum1", doc_type=ContentType.SUMMARY, related=["doc1"])  # type: ignore[arg-type]
     vector_db = MockVectorDB({"doc1": underlying})
-    retriever = MockRetrieverQuark([summary, underlying], vector_database=vector_db)
+    retriever = MockRetrieverQuark([summary, underlying])
 
-    cr = CompositeRetriever(retrievers=[retriever], reranker=None, reranker_enabled=False)
+    cr = CompositeRetriever(retrievers=[retriever], vector_database=vector_db, reranker=None, reranker_enabled=False)
     # Directly call _use_summaries for deterministic control
     results = cr._use_summaries([summary], [summary])
 
@@ -67,7 +74,9 @@ def test_use_summaries_only_summary_no_related():
     """
     summary = _mk_doc("sum1", doc_type=ContentType.SUMMARY, related=[])  # type: ignore[arg-type]
     retriever = MockRetrieverQuark([summary])
-    cr = CompositeRetriever(retrievers=[retriever], reranker=None, reranker_enabled=False)
+    cr = CompositeRetriever(
+        retrievers=[retriever], vector_database=MockVectorDB(), reranker=None, reranker_enabled=False
+    )
     results = cr._use_summaries([summary], [summary])
     # Expect empty list after removal because there are no related expansions.
     assert results == []
@@ -82,7 +91,9 @@ def test_remove_duplicates_preserves_first_occurrence():
     d1b = _mk_doc("a")  # duplicate id
     d2 = _mk_doc("b")
     retriever = MockRetrieverQuark([d1a, d1b, d2])
-    cr = CompositeRetriever(retrievers=[retriever], reranker=None, reranker_enabled=False)
+    cr = CompositeRetriever(
+        retrievers=[retriever], vector_database=MockVectorDB(), reranker=None, reranker_enabled=False
+    )
     unique = cr._remove_duplicates([d1a, d1b, d2])
     assert [d.metadata["id"] for d in unique] == ["a", "b"]
 
@@ -95,7 +106,11 @@ def test_early_pruning_sorts_by_score_when_all_have_score():
     docs = [_mk_doc("a", score=0.7), _mk_doc("b", score=0.9), _mk_doc("c", score=0.8)]
     retriever = MockRetrieverQuark(docs)
     cr = CompositeRetriever(
-        retrievers=[retriever], reranker=None, reranker_enabled=False, total_retrieved_k_documents=2
+        retrievers=[retriever],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        total_retrieved_k_documents=2,
     )
     pruned = cr._early_pruning(docs.copy())
     # Expect top two by score descending: b (0.9), c (0.8)
@@ -110,12 +125,62 @@ def test_early_pruning_preserves_order_without_scores():
     docs = [_mk_doc("a"), _mk_doc("b"), _mk_doc("c")]  # no scores
     retriever = MockRetrieverQuark(docs)
     cr = CompositeRetriever(
-        retrievers=[retriever], reranker=None, reranker_enabled=False, total_retrieved_k_documents=2
+        retrievers=[retriever],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        total_retrieved_k_documents=2,
     )
     pruned = cr._early_pruning(docs.copy())
     assert [d.metadata["id"] for d in pruned] == ["a", "b"]
 
 
+def test_early_pruning_ranks_documents_without_score_last():
+    """Rank scored documents first when only some documents carry a score."""
+    docs = [_mk_doc("a"), _mk_doc("b", score=0.2), _mk_doc("c"), _mk_doc("d", score=0.6)]
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark(docs)],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        total_retrieved_k_documents=3,
+    )
+    pruned = cr._early_pruning(docs.copy())
+    assert [d.metadata["id"] for d in pruned] == ["d", "b", "a"]
+
+
+def test_early_pruning_keeps_per_type_quotas():
+    """Keep the best documents of a type with a quota even if other types score higher."""
+    docs = [
+        _mk_doc("t1", score=0.9),
+        _mk_doc("t2", score=0.8),
+        _mk_doc("t3", score=0.7),
+        _mk_doc("tab1", score=0.3, doc_type=ContentType.TABLE),
+        _mk_doc("tab2", score=0.2, doc_type=ContentType.TABLE),
+    ]
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark(docs)],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        total_retrieved_k_documents=3,
+        min_documents_per_type={ContentType.TABLE.value: 1, ContentType.IMAGE.value: 2},
+    )
+    pruned = cr._early_pruning(docs.copy())
+    assert [d.metadata["id"] for d in pruned] == ["t1", "t2", "tab1"]
+
+
+def test_use_summaries_expanded_documents_inherit_summary_score():
+    """Give documents expanded from a summary the score of the summary."""
+    underlying = _mk_doc("u")
+    summary = _mk_doc("s", score=0.8, doc_type=ContentType.SUMMARY, related=["u"])
+    retriever = MockRetrieverQuark([summary])
+    vector_db = MockVectorDB({"u": underlying})
+    cr = CompositeRetriever(retrievers=[retriever], vector_database=vector_db, reranker=None, reranker_enabled=False)
+    result = cr._use_summaries([summary], [summary])
+    assert [(d.metadata["id"], d.metadata.get("score")) for d in result] == [("u", 0.8)]
+
+
 @pytest.mark.asyncio
 async def test_arerank_pruning_invokes_reranker_when_needed():
     """Invoke the reranker when more than k documents are retrieved.
@@ -127,6 +192,7 @@ async def test_arerank_pruning_invokes_reranker_when_needed():
     reranker = MockReranker()
     cr = CompositeRetriever(
         retrievers=[retriever],
+        vector_database=MockVectorDB(),
         reranker=reranker,
         reranker_enabled=True,
         reranker_k_documents=2,
@@ -149,6 +215,7 @@ async def test_arerank_pruning_skips_when_not_needed():
     reranker = MockReranker()
     cr = CompositeRetriever(
         retrievers=[retriever],
+        vector_database=MockVectorDB(),
         reranker=reranker,
         reranker_enabled=True,
         reranker_k_documents=3,
@@ -159,6 +226,203 @@ async def test_arerank_pruning_skips_when_not_needed():
     assert pruned == docs
 
 
+@pytest.mark.asyncio
+async def test_ainvoke_skips_reranking_when_deadline_is_close():
+    """Skip the reranker and shrink the retrieval if little time is left for the request."""
+    docs = [_mk_doc(doc_id, score=score) for doc_id, score in (("a", 0.1), ("b", 0.5), ("c", 0.9))]
+    retriever = MockRetrieverQuark(docs)
+    reranker = MockReranker()
+    cr = CompositeRetriever(
+        retrievers=[retriever],
+        vector_database=MockVectorDB(),
+        reranker=reranker,
+        reranker_enabled=True,
+        reranker_k_documents=2,
+        deadline_settings=ChatDeadlineSettings(),
+    )
+    config = RunnableConfig(metadata={"filter_kwargs": {}, DEADLINE_METADATA_KEY: deadline_in(1.0)})
+
+    result = await cr.ainvoke("question", config=config)
+
+    assert reranker.invoked is False
+    assert [d.metadata["id"] for d in result] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_reranks_when_enough_time_is_left():
+    """Keep the full pipeline if the deadline is far away."""
+    docs = [_mk_doc(doc_id, score=score) for doc_id, score in (("a", 0.1), ("b", 0.5), ("c", 0.9))]
+    reranker = MockReranker()
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark(docs)],
+        vector_database=MockVectorDB(),
+        reranker=reranker,
+        reranker_enabled=True,
+        reranker_k_documents=2,
+        deadline_settings=ChatDeadlineSettings(),
+    )
+    config = RunnableConfig(metadata={"filter_kwargs": {}, DEADLINE_METADATA_KEY: deadline_in(60.0)})
+
+    result = await cr.ainvoke("question", config=config)
+
+    assert reranker.invoked is True
+    assert [d.metadata["id"] for d in result] == ["c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_serves_prefetched_documents():
+    """Return the prefetched documents of an input instead of invoking the retrievers."""
+    prefetched_doc = _mk_doc("prefetched")
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark([_mk_doc("searched")])],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+    )
+
+    with CompositeRetriever.prefetched({"question": [prefetched_doc]}):
+        prefetched = await cr.ainvoke("question")
+        searched = await cr.ainvoke("other question")
+
+    assert [d.metadata["id"] for d in prefetched] == ["prefetched"]
+    assert [d.metadata["id"] for d in searched] == ["searched"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_postprocesses_prefetched_hits_with_the_request_deadline():
+    """Skip reranking of prefetched search hits if little time is left for the request."""
+    docs = [_mk_doc(doc_id, score=score) for doc_id, score in (("a", 0.1), ("b", 0.5), ("c", 0.9))]
+    reranker = MockReranker()
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark([])],
+        vector_database=MockVectorDB(),
+        reranker=reranker,
+        reranker_enabled=True,
+        reranker_k_documents=2,
+        deadline_settings=ChatDeadlineSettings(),
+    )
+    config = RunnableConfig(metadata={"filter_kwargs": {}, DEADLINE_METADATA_KEY: deadline_in(1.0)})
+
+    with CompositeRetriever.prefetched({"question": docs}):
+        result = await cr.ainvoke("question", config=config)
+
+    assert reranker.invoked is False
+    assert [d.metadata["id"] for d in result] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_abatch_invoke_returns_documents_per_input():
+    """Fall back to one retrieval per input if the retrievers cannot be batched."""
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark([_mk_doc("a")])],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+    )
+
+    result = await cr.abatch_invoke(["first", "second"])
+
+    assert [[d.metadata["id"] for d in docs] for docs in result] == [["a"], ["a"]]
+
+
+def _diverse_retriever(docs: list[Document], max_documents: int | None = None, **settings) -> CompositeRetriever:
+    vectors = {"a": [1.0, 0.0], "a-overlap": [0.99, 0.05], "b": [0.6, 0.8], "c": [0.0, 1.0]}
+    return CompositeRetriever(
+        retrievers=[MockRetrieverQuark(docs)],
+        vector_database=MockVectorDB(vectors_by_id=vectors),
+        reranker=None,
+        reranker_enabled=False,
+        diversity_settings=DiversitySettings(enabled=True, max_documents=max_documents, **settings),
+    )
+
+
+@pytest.mark.asyncio
+async def test_adiversify_removes_near_duplicates_and_keeps_order():
+    """Drop chunks nearly identical to a better one and keep documents without stored vector."""
+    docs = [_mk_doc("a"), _mk_doc("no-vector"), _mk_doc("a-overlap"), _mk_doc("c")]
+
+    result = await _diverse_retriever(docs)._adiversify(docs)
+
+    assert [d.metadata["id"] for d in result] == ["a", "no-vector", "c"]
+
+
+@pytest.mark.asyncio
+async def test_adiversify_selects_by_maximal_marginal_relevance():
+    """Prefer a less relevant but different document over a similar one in MMR mode."""
+    docs = [_mk_doc("a", score=0.9), _mk_doc("b", score=0.85), _mk_doc("c", score=0.8)]
+
+    result = await _diverse_retriever(docs, max_documents=2, mmr_lambda=0.5)._adiversify(docs)
+
+    assert [d.metadata["id"] for d in result] == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_uses_the_vectors_returned_with_the_hits():
+    """Request the vectors with the search, compare the hits by them and remove them from the result."""
+    docs = [_mk_doc("a"), _mk_doc("a-overlap"), _mk_doc("c")]
+    for doc, vector in zip(docs, ([1.0, 0.0], [0.99, 0.05], [0.0, 1.0])):
+        doc.metadata[VectorDatabase.DENSE_VECTOR_KEY] = vector
+    retriever = MockRetrieverQuark(docs)
+    cr = CompositeRetriever(
+        retrievers=[retriever],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        diversity_settings=DiversitySettings(enabled=True),
+    )
+
+    result = await cr.ainvoke("question")
+
+    assert retriever.configs[0]["metadata"][RetrieverQuark.WITH_VECTORS_KEY] is True
+    assert [d.metadata["id"] for d in result] == ["a", "c"]
+    assert all(VectorDatabase.DENSE_VECTOR_KEY not in d.metadata for d in result)
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_coarse_to_fine_restricts_chunk_search_to_best_documents():
+    """Search the summaries first and restrict the chunk retrievers to the documents of the best summaries."""
+    summaries = [
+        _mk_doc("s1", score=0.4, doc_type=ContentType.SUMMARY, related=[]),
+        _mk_doc("s2", score=0.9, doc_type=ContentType.SUMMARY, related=[]),
+        _mk_doc("s3", score=0.6, doc_type=ContentType.SUMMARY, related=[]),
+    ]
+    for summary, document in zip(summaries, ("manual-a", "manual-b", "manual-c")):
+        summary.metadata["document"] = document
+    summary_retriever = MockRetrieverQuark(summaries, content_type=ContentType.SUMMARY)
+    text_retriever = MockRetrieverQuark([_mk_doc("t1")])
+    cr = CompositeRetriever(
+        retrievers=[summary_retriever, text_retriever],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        coarse_to_fine_settings=CoarseToFineSettings(enabled=True, top_documents=2),
+    )
+
+    result = await cr.ainvoke("question")
+
+    assert text_retriever.configs[0]["metadata"]["filter_kwargs"] == {"document": ["manual-b", "manual-c"]}
+    assert "document" not in summary_retriever.configs[0]["metadata"]["filter_kwargs"]
+    assert [d.metadata["id"] for d in result] == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_coarse_to_fine_searches_everything_without_summary_hit():
+    """Fall back to an unrestricted chunk search if no summary matches."""
+    text_retriever = MockRetrieverQuark([_mk_doc("t1")])
+    cr = CompositeRetriever(
+        retrievers=[MockRetrieverQuark([], content_type=ContentType.SUMMARY), text_retriever],
+        vector_database=MockVectorDB(),
+        reranker=None,
+        reranker_enabled=False,
+        coarse_to_fine_settings=CoarseToFineSettings(enabled=True),
+    )
+
+    result = await cr.ainvoke("question")
+
+    assert text_retriever.configs[0]["metadata"]["filter_kwargs"] == {}
+    assert [d.metadata["id"] for d in result] == ["t1"]
+
+
 # Convenience: allow running this test module directly for quick local dev.
 if __name__ == "__main__":  # pragma: no cover
     asyncio.run(pytest.main([__file__]))
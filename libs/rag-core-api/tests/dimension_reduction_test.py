@@ -0,0 +1,24 @@
+"""Tests for the recall measurement of dimension-reduced embeddings."""
+
+import numpy as np
+
+from rag_core_api.tuning.dimension_reduction import evaluate
+from rag_core_lib.impl.embeddings.pca_reducer import PcaReducer
+from rag_core_lib.impl.embeddings.truncation_reducer import TruncationReducer
+
+
+def test_evaluate_reports_recall_of_every_reduction():
+    """A projection keeping all variance finds the same neighbours, truncation away from it does not."""
+    rng = np.random.default_rng(0)
+    # The embeddings only vary in the last four of 16 dimensions.
+    basis = np.zeros((4, 16))
+    basis[:, 12:] = np.eye(4)
+    documents = rng.normal(size=(300, 4)) @ basis
+    queries = rng.normal(size=(20, 4)) @ basis
+    reducers = [PcaReducer.fit(documents, 4), TruncationReducer(8)]
+
+    results = evaluate(documents, queries, reducers, k=5)
+
+    assert [(result.dimensions, result.size_ratio) for result in results] == [(4, 0.25), (8, 0.5)]
+    assert results[0].recall == 1.0
+    assert results[1].recall < 0.5
@@ -0,0 +1,64 @@
+"""Tests for the DefaultIngestionJobs class."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from rag_core_api.impl.api_endpoints.default_ingestion_jobs import DefaultIngestionJobs
+from rag_core_api.impl.settings.ingestion_settings import IngestionSettings
+
+
+def _ndjson_line(i: int) -> str:
+    piece = {"page_content": f"piece {i}", "type": "TEXT", "metadata": [{"key": "id", "value": f'"{i}"'}]}
+    return json.dumps(piece) + "\n"
+
+
+def _ndjson_chunks(count: int, chunk_size: int = 7) -> list[bytes]:
+    body = "".join(_ndjson_line(i) for i in range(count)).encode()
+    return [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+
+async def _collect(ingestion_jobs: DefaultIngestionJobs, chunks: list[bytes]) -> list:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return [progress async for progress in ingestion_jobs.aupload_stream(stream())]
+
+
+@pytest.mark.asyncio
+async def test_streaming_upload_acknowledges_every_batch():
+    """Upload the pieces in batches in order and acknowledge the uploaded count after every batch."""
+    uploader = MagicMock()
+    settings = IngestionSettings(stream_batch_size=2, stream_max_in_flight_batches=2)
+    ingestion_jobs = DefaultIngestionJobs(uploader, ThreadPoolExecutor(max_workers=2), settings)
+
+    progress = await _collect(ingestion_jobs, _ndjson_chunks(5))
+
+    assert [p.uploaded_piece_count for p in progress] == [2, 4, 5, 5]
+    assert [p.done for p in progress] == [False, False, False, True]
+    assert progress[-1].error is None
+    uploaded = [piece.page_content for call in uploader.upload_information_piece.call_args_list for piece in call[0][0]]
+    assert sorted(uploaded) == [f"piece {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_streaming_upload_reports_errors_in_last_line():
+    """End the upload at an invalid line or a failed batch and report the error with the uploaded count."""
+    uploader = MagicMock()
+    settings = IngestionSettings(stream_batch_size=2, stream_max_in_flight_batches=1)
+    ingestion_jobs = DefaultIngestionJobs(uploader, ThreadPoolExecutor(max_workers=1), settings)
+
+    progress = await _collect(ingestion_jobs, _ndjson_chunks(2) + [b"not json\n"])
+    assert progress[-1].done
+    assert progress[-1].uploaded_piece_count == 2
+    assert progress[-1].error.startswith("Line 3 is not a valid information piece")
+
+    uploader.upload_information_piece.side_effect = HTTPException(status_code=422, detail="Invalid metadata.")
+    progress = await _collect(ingestion_jobs, _ndjson_chunks(3))
+    assert len(progress) == 1
+    assert progress[0].uploaded_piece_count == 0
+    assert progress[0].error == "Invalid metadata."
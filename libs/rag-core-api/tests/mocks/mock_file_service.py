@@ -0,0 +1,63 @@
+"""Provide an in-memory file service for tests."""
+
+from pathlib import Path
+from typing import BinaryIO
+
+from rag_core_lib.file_services.file_service import FileService
+
+__all__ = ["MockFileService"]
+
+
+class MockFileService(FileService):
+    """Keep uploaded files in memory."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    def download_folder(self, source: str, target: Path) -> None:  # pragma: no cover - not used in tests
+        """Not supported by the mock."""
+        raise NotImplementedError()
+
+    def download_file(self, source: str, target_file: BinaryIO) -> None:
+        """Write the stored file into the target file.
+
+        Parameters
+        ----------
+        source : str
+            The name of the stored file.
+        target_file : BinaryIO
+            The file-like object to write to.
+        """
+        target_file.write(self.files[source])
+
+    def upload_file(self, file_path: str, file_name: str) -> None:
+        """Store the content of the local file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the local file.
+        file_name : str
+            The name to store the file under.
+        """
+        self.files[file_name] = Path(file_path).read_bytes()
+
+    def get_all_sorted_file_names(self) -> list[str]:
+        """Return the names of the stored files.
+
+        Returns
+        -------
+        list[str]
+            The sorted file names.
+        """
+        return sorted(self.files)
+
+    def delete_file(self, file_name: str) -> None:
+        """Remove a stored file.
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the stored file.
+        """
+        self.files.pop(file_name, None)
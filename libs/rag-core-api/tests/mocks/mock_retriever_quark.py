@@ -2,7 +2,7 @@
 
 from langchain_core.documents import Document
 
-from .mock_vector_db import MockVectorDB
+from rag_core_lib.impl.data_types.content_type import ContentType
 
 __all__ = ["MockRetrieverQuark"]
 
@@ -10,13 +10,17 @@ __all__ = ["MockRetrieverQuark"]
 class MockRetrieverQuark:
     """Provide a minimal stand-in for a RetrieverQuark.
 
-    Exposes an ``ainvoke`` returning pre-seeded documents and a ``_vector_database`` attribute
-    referenced by summary expansion logic.
+    Exposes an ``ainvoke`` returning pre-seeded documents and records the configs it was invoked with.
     """
 
-    def __init__(self, documents: list[Document], vector_database: MockVectorDB | None = None):
+    def __init__(
+        self,
+        documents: list[Document],
+        content_type: ContentType = ContentType.TEXT,
+    ):
         self._documents = documents
-        self._vector_database = vector_database or MockVectorDB()
+        self.content_type = content_type
+        self.configs: list = []
 
     def verify_readiness(self):  # pragma: no cover - trivial
         """Verify that the retriever is ready.
@@ -27,12 +31,13 @@ class MockRetrieverQuark:
             Always returns ``None``.
         """
 
-    async def ainvoke(self, *_args, **_kwargs):
-        """Return the pre-seeded documents.
+    async def ainvoke(self, *_args, config=None, **_kwargs):
+        """Return the pre-seeded documents and record the config.
 
         Returns
         -------
         list[Document]
             The documents passed to the constructor.
         """
+        self.configs.append(config)
         return self._documents
@@ -2,6 +2,8 @@
 
 Provides only the methods required by the CompositeRetriever unit tests:
 - get_documents_by_ids: Used during summary expansion
+- get_vectors: Used during diversity filtering
+- hydrate: Used to complete the payload of the final documents
 - asearch: (async) provided as a defensive stub
 """
 
@@ -13,17 +15,28 @@ __all__ = ["MockVectorDB"]
 class MockVectorDB:
     """Provide a minimal in-memory vector database test double."""
 
-    def __init__(self, docs_by_id: dict[str, Document] | None = None):
+    PARTIAL_PAYLOAD_KEY = "partial_payload"
+
+    def __init__(
+        self,
+        docs_by_id: dict[str, Document] | None = None,
+        vectors_by_id: dict[str, list[float]] | None = None,
+    ):
         self.collection_available = True
         self._docs_by_id = docs_by_id or {}
+        self._vectors_by_id = vectors_by_id or {}
 
-    def get_documents_by_ids(self, ids: list[str]) -> list[Document]:  # pragma: no cover - simple mapping
+    def get_documents_by_ids(
+        self, ids: list[str], filter_kwargs: dict | None = None
+    ) -> list[Document]:  # pragma: no cover - simple mapping
         """Return documents for the provided ids.
 
         Parameters
         ----------
         ids : list[str]
             Document ids to look up.
+        filter_kwargs : dict | None
+            Ignored metadata filters.
 
         Returns
         -------
@@ -32,6 +45,36 @@ class MockVectorDB:
         """
         return [self._docs_by_id[i] for i in ids if i in self._docs_by_id]
 
+    def get_vectors(self, ids: list[str]) -> dict[str, list[float]]:
+        """Return the vectors for the provided ids.
+
+        Parameters
+        ----------
+        ids : list[str]
+            Document ids to look up.
+
+        Returns
+        -------
+        dict[str, list[float]]
+            Vectors that exist in the in-memory mapping.
+        """
+        return {i: self._vectors_by_id[i] for i in ids if i in self._vectors_by_id}
+
+    def hydrate(self, documents: list[Document]) -> list[Document]:
+        """Return the documents unchanged, as their payload is never projected.
+
+        Parameters
+        ----------
+        documents : list[Document]
+            The documents to complete.
+
+        Returns
+        -------
+        list[Document]
+            The same documents.
+        """
+        return documents
+
     async def asearch(self, *_, **__):  # pragma: no cover - defensive stub
         """Return an empty result for async search.
 
@@ -0,0 +1,78 @@
+"""Tests for the QdrantClientPool."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from rag_core_api.impl.settings.qdrant_read_pool_settings import QdrantReadPoolSettings
+from rag_core_api.impl.vector_databases.qdrant_client_pool import QdrantClientPool
+
+
+def _pool(locations: list[str], **settings) -> tuple[QdrantClientPool, dict[str, MagicMock]]:
+    clients = {location: MagicMock(name=location) for location in locations}
+    pool = QdrantClientPool(QdrantReadPoolSettings(locations=locations, **settings), client_factory=clients.get)
+    return pool, clients
+
+
+def test_execute_spreads_reads_across_replicas():
+    """Send consecutive reads to different replicas and never to the primary."""
+    pool, clients = _pool(["replica-a", "replica-b"])
+    primary = MagicMock(name="primary")
+
+    used = [pool.execute(lambda client: client, primary) for _ in range(4)]
+
+    assert used == [clients["replica-a"], clients["replica-b"], clients["replica-a"], clients["replica-b"]]
+
+
+def test_execute_fails_over_and_ejects_failing_replica():
+    """Retry a failed read on the next replica and skip a replica after too many failures."""
+    pool, clients = _pool(["replica-a", "replica-b"], max_failures=1, ejection_seconds=60)
+    clients["replica-a"].search.side_effect = ConnectionError()
+
+    results = [pool.execute(lambda client: client.search(), MagicMock()) for _ in range(3)]
+
+    assert results == [clients["replica-b"].search.return_value] * 3
+    assert clients["replica-a"].search.call_count == 1
+
+
+def test_execute_uses_primary_without_healthy_replica():
+    """Fall back to the primary if every replica fails."""
+    pool, clients = _pool(["replica-a"])
+    clients["replica-a"].search.side_effect = ConnectionError()
+    primary = MagicMock(name="primary")
+
+    assert pool.execute(lambda client: client.search(), primary) == primary.search.return_value
+
+
+def test_execute_readmits_replica_after_successful_health_check():
+    """Probe an ejected replica once the ejection expired and use it again if it is healthy."""
+    pool, clients = _pool(["replica-a"], max_failures=1, ejection_seconds=0)
+    clients["replica-a"].search.side_effect = [ConnectionError(), "result"]
+
+    with pytest.raises(ConnectionError):
+        pool.execute(lambda client: client.search(), MagicMock(search=MagicMock(side_effect=ConnectionError())))
+
+    assert pool.execute(lambda client: client.search(), MagicMock()) == "result"
+    clients["replica-a"].get_collections.assert_called_once()
+
+
+def test_execute_raises_client_errors_without_failing_over():
+    """Raise a client error right away instead of retrying it on the other replicas or counting it as failure."""
+    pool, clients = _pool(["replica-a", "replica-b"], max_failures=1)
+    clients["replica-a"].search.side_effect = UnexpectedResponse(400, "Bad Request", b"", {})
+
+    with pytest.raises(UnexpectedResponse):
+        pool.execute(lambda client: client.search(), MagicMock())
+
+    clients["replica-b"].search.assert_not_called()
+    assert pool.execute(lambda client: client, MagicMock()) == clients["replica-b"]
+    assert pool.execute(lambda client: client, MagicMock()) == clients["replica-a"]
+
+
+def test_execute_fails_over_on_server_errors():
+    """Treat a 5xx response as a failure of the replica."""
+    pool, clients = _pool(["replica-a", "replica-b"])
+    clients["replica-a"].search.side_effect = UnexpectedResponse(503, "Service Unavailable", b"", {})
+
+    assert pool.execute(lambda client: client.search(), MagicMock()) == clients["replica-b"].search.return_value
@@ -0,0 +1,363 @@
+"""Tests for the tenant routing of the QdrantDatabase."""
+
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_community.embeddings.fake import FakeEmbeddings
+from langchain_core.documents import Document
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from rag_core_api.impl.embeddings.langchain_community_embedder import LangchainCommunityEmbedder
+
+from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
+from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+from rag_core_api.impl.vector_databases.tenancy_mode import TenancyMode
+
+
+def _qdrant_database(tenancy: TenancyMode) -> QdrantDatabase:
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", tenancy=tenancy)
+    vectorstore = MagicMock(
+        vector_name="",
+        sparse_vector_name="langchain-sparse",
+        content_payload_key="page_content",
+        metadata_payload_key="metadata",
+    )
+    return QdrantDatabase(settings=settings, embedder=MagicMock(), sparse_embedder=MagicMock(), vectorstore=vectorstore)
+
+
+def _filter_values(request: models.QueryRequest) -> dict:
+    return {condition.key: condition.match for condition in request.filter.must}
+
+
+def test_query_request_without_tenancy_filters_by_payload_only():
+    """Keep the tenant as payload filter and do not select a shard."""
+    database = _qdrant_database(TenancyMode.NONE)
+
+    request = database._build_query_request([0.1, 0.2], None, {"k": 3}, {"type": "TEXT", "tenant_id": "team-a"})
+
+    assert request.shard_key is None
+    assert _filter_values(request)["metadata.tenant_id"] == models.MatchValue(value="team-a")
+
+
+def test_query_request_with_shard_keys_routes_to_tenant_shard():
+    """Select the shard of the tenant and keep the tenant filter."""
+    database = _qdrant_database(TenancyMode.SHARD_KEY)
+
+    request = database._build_query_request([0.1, 0.2], None, {"k": 3}, {"type": "TEXT", "tenant_id": "team-a"})
+
+    assert request.shard_key == "team-a"
+    assert _filter_values(request)["metadata.tenant_id"] == models.MatchValue(value="team-a")
+
+
+def test_query_request_with_shard_keys_falls_back_to_default_tenant():
+    """Route requests without tenant to the shard of the default tenant."""
+    database = _qdrant_database(TenancyMode.SHARD_KEY)
+
+    request = database._build_query_request([0.1, 0.2], None, {"k": 3}, {"type": "TEXT"})
+
+    assert request.shard_key == "default"
+    assert _filter_values(request)["metadata.tenant_id"] == models.MatchValue(value="default")
+
+
+def test_get_documents_by_ids_routes_the_tenant_like_the_search():
+    """Fetch documents by ID from the shard of the default tenant if no tenant is given."""
+    database = _qdrant_database(TenancyMode.SHARD_KEY)
+    client = database._vectorstore.client
+    client.scroll.return_value = ([], None)
+
+    database.get_documents_by_ids(["piece-1"], {})
+
+    scroll = client.scroll.call_args.kwargs
+    conditions = {condition.key: condition.match for condition in scroll["scroll_filter"].must}
+    assert scroll["shard_key_selector"] == "default"
+    assert conditions["metadata.tenant_id"] == models.MatchValue(value="default")
+    assert conditions["metadata.id"] == models.MatchAny(any=["piece-1"])
+
+
+def test_payload_indexes_are_created_once_for_an_existing_collection():
+    """Create the payload indexes on the first availability check, not only on upload."""
+    database = _qdrant_database(TenancyMode.NONE)
+    client = database._vectorstore.client
+    client.collection_exists.return_value = True
+    client.get_collection.return_value.points_count = 1
+
+    assert database.collection_available
+    assert database.collection_available
+
+    indexed_fields = [call.kwargs["field_name"] for call in client.create_payload_index.call_args_list]
+    assert indexed_fields == ["metadata." + field for field in database._settings.payload_index_fields]
+
+
+def test_delete_with_shard_keys_only_touches_tenant_shard():
+    """Delete within the shard of the tenant named in the delete request."""
+    database = _qdrant_database(TenancyMode.SHARD_KEY)
+
+    database.delete({"metadata.document": "manual.pdf", "metadata.tenant_id": "team-a"})
+
+    delete_call = database._vectorstore.client.delete.call_args
+    assert delete_call.kwargs["shard_key_selector"] == "team-a"
+
+
+def test_upload_with_shard_keys_embeds_and_creates_only_missing_shard_keys():
+    """Upsert every document into the shard of its tenant and only create shard keys Qdrant does not know yet."""
+    database = _qdrant_database(TenancyMode.SHARD_KEY)
+    database._settings.retrieval_mode = RetrievalMode.HYBRID
+    database._embedder.get_embedder.return_value.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+    database._sparse_embedder.embed_documents.return_value = [
+        models.SparseVector(indices=[1], values=[1.0]),
+        models.SparseVector(indices=[2], values=[1.0]),
+    ]
+    client = database._vectorstore.client
+    client.collection_exists.return_value = True
+    client.get_collection.return_value.config.params.vectors = {
+        "": models.VectorParams(size=2, distance=models.Distance.COSINE)
+    }
+    client.collection_cluster_info.return_value.local_shards = [MagicMock(shard_key="team-a")]
+    client.collection_cluster_info.return_value.remote_shards = []
+
+    database.upload(
+        [
+            Document(page_content="a", metadata={"id": "1", "tenant_id": "team-a"}),
+            Document(page_content="b", metadata={"id": "2"}),
+        ]
+    )
+
+    client.create_shard_key.assert_called_once_with(collection_name="rag", shard_key="default")
+    uploads = {call.kwargs["shard_key_selector"]: call.kwargs["points"] for call in client.upload_points.call_args_list}
+    assert uploads["team-a"][0].vector[""] == [0.1, 0.2]
+    assert uploads["default"][0].vector["langchain-sparse"] == models.SparseVector(indices=[2], values=[1.0])
+
+
+def test_delete_with_a_list_value_removes_all_documents_at_once():
+    """Delete the points of several documents with a single filtered delete."""
+    database = _qdrant_database(TenancyMode.NONE)
+
+    database.delete({"metadata.document": ["a.pdf", "b.pdf"]})
+
+    database._vectorstore.client.delete.assert_called_once()
+    selector = database._vectorstore.client.delete.call_args.kwargs["points_selector"]
+    assert selector.filter.must[0].match == models.MatchAny(any=["a.pdf", "b.pdf"])
+
+
+def test_query_request_applies_search_params_to_every_stage():
+    """Pass the ANN search params to the query and both prefetches of a hybrid search."""
+    database = _qdrant_database(TenancyMode.NONE)
+    sparse = models.SparseVector(indices=[1], values=[0.5])
+    search_params = {"hnsw_ef": 256, "quantization_oversampling": 2.0}
+
+    request = database._build_query_request([0.1, 0.2], sparse, {"k": 3, "search_params": search_params}, {})
+
+    expected = models.SearchParams(hnsw_ef=256, quantization=models.QuantizationSearchParams(oversampling=2.0))
+    assert request.params == expected
+    assert [prefetch.params for prefetch in request.prefetch] == [expected, expected]
+
+
+def test_query_request_projects_payload_but_keeps_required_fields():
+    """Leave excluded metadata out of the hits, except the fields retrieval relies on."""
+    database = _qdrant_database(TenancyMode.NONE)
+
+    request = database._build_query_request(
+        [0.1, 0.2], None, {"k": 3, "payload_projection": {"exclude": ["base64_image", "related"]}}, {}
+    )
+
+    assert request.with_payload == models.PayloadSelectorExclude(exclude=["metadata.base64_image"])
+
+
+@pytest.mark.asyncio
+async def test_projected_search_hits_are_hydrated_with_complete_metadata():
+    """Return projected hits from the search and load the complete metadata on hydration."""
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    vectorstore = QdrantVectorStore.from_documents(
+        [
+            Document(
+                page_content="An image of a diagram",
+                metadata={"id": "piece-1", "type": "IMAGE", "related": [], "base64_image": "aW1hZ2U="},
+            )
+        ],
+        embedding=embedder.get_embedder(),
+        location=":memory:",
+        collection_name="rag",
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+    database = QdrantDatabase(settings=settings, embedder=embedder, sparse_embedder=None, vectorstore=vectorstore)
+
+    hits = await database.asearch(
+        "diagram", {"k": 1, "payload_projection": {"exclude": ["base64_image"]}}, {"type": "IMAGE"}
+    )
+
+    assert "base64_image" not in hits[0].metadata
+    assert hits[0].metadata[database.PARTIAL_PAYLOAD_KEY] is True
+
+    hydrated = database.hydrate(hits)
+
+    assert hydrated[0].metadata["base64_image"] == "aW1hZ2U="
+    assert "score" in hydrated[0].metadata
+    assert database.PARTIAL_PAYLOAD_KEY not in hydrated[0].metadata
+
+
+@pytest.mark.asyncio
+async def test_batch_search_embeds_queries_as_queries():
+    """Embed batched queries with the query embedding of both models, not the document embedding."""
+    database = _qdrant_database(TenancyMode.NONE)
+    dense_embedder = database._embedder.get_embedder.return_value
+    dense_embedder.aembed_query = AsyncMock(side_effect=lambda query: [0.1, 0.2])
+    database._sparse_embedder.embed_query.return_value = models.SparseVector(indices=[1], values=[1.0])
+    database._vectorstore.client.query_batch_points.return_value = [
+        models.QueryResponse(points=[]),
+        models.QueryResponse(points=[]),
+    ]
+
+    await database.abatch_search(["first", "second"], [({"k": 3}, None)])
+
+    assert [call.args[0] for call in dense_embedder.aembed_query.call_args_list] == ["first", "second"]
+    assert [call.args[0] for call in database._sparse_embedder.embed_query.call_args_list] == ["first", "second"]
+    dense_embedder.embed_documents.assert_not_called()
+    database._sparse_embedder.embed_documents.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("retrieval_mode", "weak_scores", "strong_scores", "expected"),
+    [
+        (RetrievalMode.HYBRID, [0.5, 0.25], [1.0], [0.5, 1.0]),
+        (RetrievalMode.SPARSE, [1.0, 0.5], [4.0], [0.5, 0.8]),
+    ],
+)
+def test_scores_of_different_searches_stay_comparable(
+    retrieval_mode: RetrievalMode, weak_scores: list[float], strong_scores: list[float], expected: list[float]
+):
+    """Do not scale every search to its own best hit, so the best hit of a weak search does not score 1.0."""
+    database = _qdrant_database(TenancyMode.NONE)
+    database._settings.retrieval_mode = retrieval_mode
+
+    weak = database._normalize_scores(weak_scores)
+    strong = database._normalize_scores(strong_scores)
+
+    assert [weak[0], strong[0]] == pytest.approx(expected)
+    assert weak[1] < weak[0]
+
+
+@pytest.mark.asyncio
+async def test_search_returns_the_dense_vectors_with_the_hits_if_requested():
+    """Carry the stored dense vector on the hits instead of loading it separately."""
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    vectorstore = QdrantVectorStore.from_documents(
+        [Document(page_content="A text", metadata={"id": "piece-1", "type": "TEXT", "related": []})],
+        embedding=embedder.get_embedder(),
+        location=":memory:",
+        collection_name="rag",
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+    database = QdrantDatabase(settings=settings, embedder=embedder, sparse_embedder=None, vectorstore=vectorstore)
+
+    with_vectors = await database.asearch("text", {"k": 1, "score_threshold": -1.0, "with_vectors": True}, {})
+    without_vectors = await database.asearch("text", {"k": 1, "score_threshold": -1.0}, {})
+
+    assert len(with_vectors[0].metadata[database.DENSE_VECTOR_KEY]) == 8
+    assert database.DENSE_VECTOR_KEY not in without_vectors[0].metadata
+
+
+def _precomputed_database(embedding_model: str = "fake-8") -> QdrantDatabase:
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    vectorstore = QdrantVectorStore.from_documents(
+        [Document(page_content="An existing piece", metadata={"id": "piece-0", "type": "TEXT", "related": []})],
+        embedding=embedder.get_embedder(),
+        location=":memory:",
+        collection_name="rag",
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+    return QdrantDatabase(
+        settings=settings,
+        embedder=embedder,
+        sparse_embedder=None,
+        vectorstore=vectorstore,
+        embedding_model=embedding_model,
+    )
+
+
+def _precomputed_document(embedding_model: str, size: int = 8) -> Document:
+    return Document(
+        page_content="A precomputed piece",
+        metadata={
+            "id": "piece-1",
+            "type": "TEXT",
+            "related": [],
+            QdrantDatabase.PRECOMPUTED_VECTORS_KEY: {
+                "dense_vector": [1.0] + [0.0] * (size - 1),
+                "embedding_model": embedding_model,
+            },
+        },
+    )
+
+
+def test_upload_stores_precomputed_vectors_without_embedding():
+    """Upsert documents with precomputed vectors as they are."""
+    database = _precomputed_database()
+
+    database.upload([_precomputed_document("fake-8")])
+
+    client = database._vectorstore.client
+    points, _ = client.scroll(
+        "rag",
+        scroll_filter=models.Filter(
+            must=[models.FieldCondition(key="metadata.id", match=models.MatchValue(value="piece-1"))]
+        ),
+        with_vectors=True,
+    )
+    assert len(points) == 1
+    assert points[0].vector == pytest.approx([1.0] + [0.0] * 7)
+    assert points[0].payload["metadata"] == {"id": "piece-1", "type": "TEXT", "related": []}
+
+
+@pytest.mark.parametrize(
+    ("document", "message"),
+    [
+        (_precomputed_document("another-model"), "computed with model 'another-model'"),
+        (_precomputed_document("fake-8", size=4), "have dimension 4"),
+    ],
+    ids=["model mismatch", "dimension mismatch"],
+)
+def test_upload_rejects_precomputed_vectors_of_another_vector_space(document: Document, message: str):
+    """Reject precomputed vectors of another model or dimension."""
+    database = _precomputed_database()
+
+    with pytest.raises(ValueError, match=message):
+        database.upload([document])
+
+
+def test_concurrent_uploads_create_a_missing_collection_once():
+    """Let concurrent uploads into a missing collection create it once and write through the shared store."""
+    settings = VectorDatabaseSettings(collection_name="rag", location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    client = QdrantClient(location=":memory:")
+    vectorstore = QdrantVectorStore(
+        client=client, collection_name="rag", embedding=embedder.get_embedder(), validate_collection_config=False
+    )
+    database = QdrantDatabase(settings=settings, embedder=embedder, sparse_embedder=None, vectorstore=vectorstore)
+    both_checked = threading.Barrier(2, timeout=1)
+    collection_exists = client.collection_exists
+
+    def checked_collection_exists(collection_name: str) -> bool:
+        # Without a lock both uploads see the missing collection before one of them creates it.
+        with contextlib.suppress(threading.BrokenBarrierError):
+            both_checked.wait()
+        return collection_exists(collection_name)
+
+    client.collection_exists = checked_collection_exists
+    batches = [
+        [Document(page_content=f"Text {batch}-{i}", metadata={"id": f"piece-{batch}-{i}"}) for i in range(3)]
+        for batch in range(2)
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(database.upload, batches))
+
+    assert database._vectorstore is vectorstore
+    assert client.count("rag").count == 6
@@ -1,5 +1,6 @@
 """Test module for the RAG core API."""
 
+import asyncio
 import os
 import json
 from typing import AsyncGenerator
@@ -344,6 +345,191 @@ async def test_chat(api_client: AsyncClient):
         assert data["answer"] not in error_messages_list
 
 
+@pytest.mark.asyncio
+async def test_chat_scope_restricts_search(api_client: AsyncClient):
+    """Test that a chat request only finds information pieces within its scope.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    information_pieces = _create_information_pieces()
+    for piece, document in zip(information_pieces, ("geography.pdf", "landmarks.pdf")):
+        piece["metadata"].append(KeyValuePair(key="document", value=json.dumps(document)).model_dump())
+    response = await api_client.post("/information_pieces/upload", json=information_pieces)
+    response.raise_for_status()
+
+    chat_request = {"message": "What is the capital of Germany?", "scope": {"documents": ["geography.pdf"]}}
+    response = await api_client.post("/chat/scoped-session", json=chat_request)
+    assert response.status_code == 200
+    citations = response.json()["citations"]
+    assert citations
+    for citation in citations:
+        metadata = {x["key"]: json.loads(x["value"]) for x in citation["metadata"]}
+        assert metadata["document"] == "geography.pdf"
+
+    chat_request = {"message": "What is the capital of Germany?", "scope": {"documents": ["unknown.pdf"]}}
+    response = await api_client.post("/chat/other-session", json=chat_request)
+    assert response.status_code == 200
+    assert response.json()["answer"] == ErrorMessages().no_documents_message
+
+
+@pytest.mark.asyncio
+async def test_chat_only_searches_pieces_of_tenant(api_client: AsyncClient):
+    """Test that a chat request of a tenant does not see information pieces of other tenants.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    information_pieces = _create_information_pieces()
+    for piece in information_pieces:
+        piece["metadata"].append(KeyValuePair(key="tenant_id", value=json.dumps("team-a")).model_dump())
+    response = await api_client.post("/information_pieces/upload", json=information_pieces)
+    response.raise_for_status()
+
+    chat_request = {"message": "What is the capital of Germany?", "tenant_id": "team-a"}
+    response = await api_client.post("/chat/tenant-session", json=chat_request)
+    assert response.status_code == 200
+    assert response.json()["citations"]
+
+    chat_request = {"message": "What is the capital of Germany?", "tenant_id": "team-b"}
+    response = await api_client.post("/chat/other-tenant-session", json=chat_request)
+    assert response.status_code == 200
+    assert response.json()["answer"] == ErrorMessages().no_documents_message
+
+
+@pytest.mark.asyncio
+async def test_compact_citations_can_be_expanded(api_client: AsyncClient):
+    """Test that compact citations only carry a few metadata fields and can be fetched completely by ID.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    information_pieces = _create_information_pieces()
+    for piece in information_pieces:
+        piece["page_content"] = piece["page_content"] + " Some more words." * 50
+    response = await api_client.post("/information_pieces/upload", json=information_pieces)
+    response.raise_for_status()
+
+    chat_request = {"message": "What is the capital of Germany?", "citation_detail": "COMPACT"}
+    response = await api_client.post("/chat/compact-session", json=chat_request)
+    assert response.status_code == 200
+    citations = response.json()["citations"]
+    assert citations
+    for citation in citations:
+        assert {x["key"] for x in citation["metadata"]} == {"id", "type", "document_url"}
+        assert len(citation["page_content"]) <= 201
+
+    ids = [json.loads(next(x["value"] for x in c["metadata"] if x["key"] == "id")) for c in citations]
+    response = await api_client.get("/information_pieces", params={"ids": ids})
+    assert response.status_code == 200
+    pieces = response.json()
+    assert len(pieces) == len(ids)
+    assert len(pieces[0]["page_content"]) > 201
+    assert "related" in {x["key"] for x in pieces[0]["metadata"]}
+
+
+@pytest.mark.asyncio
+async def test_batch_chat(api_client: AsyncClient):
+    """Test that the batch chat endpoint streams one NDJSON line per request in request order.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    response = await api_client.post("/information_pieces/upload", json=_create_information_pieces())
+    response.raise_for_status()
+
+    chat_requests = [
+        {"message": "What is the capital of Germany?"},
+        {"message": "Where is the Eiffel Tower located?"},
+        {"message": "   "},
+    ]
+    response = await api_client.post("/chat/batch", json=chat_requests)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["index"] for item in items] == [0, 1, 2]
+    assert items[0]["response"]["citations"]
+    assert items[2]["response"]["answer"] == ErrorMessages().empty_message
+
+
+@pytest.mark.asyncio
+async def test_batch_chat_rejects_empty_batch(api_client: AsyncClient):
+    """Test that an empty batch is rejected.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    response = await api_client.post("/chat/batch", json=[])
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_background_upload_reports_job_status(api_client: AsyncClient):
+    """Test that a background upload returns a job whose status can be polled until it finished.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    information_pieces = _create_information_pieces()
+    response = await api_client.post("/information_pieces/upload", params={"background": True}, json=information_pieces)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] in {"PENDING", "RUNNING", "SUCCEEDED"}
+    assert job["information_piece_count"] == len(information_pieces)
+
+    for _ in range(100):
+        response = await api_client.get(f"/information_pieces/upload/{job['job_id']}")
+        assert response.status_code == 200
+        if response.json()["status"] == "SUCCEEDED":
+            break
+        await asyncio.sleep(0.05)
+    assert response.json()["status"] == "SUCCEEDED"
+
+    response = await api_client.get("/information_pieces/upload/unknown")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_streaming_upload(api_client: AsyncClient):
+    """Test that information pieces streamed as NDJSON are uploaded and acknowledged.
+
+    Parameters
+    ----------
+    api_client : AsyncClient
+        The test client for making HTTP requests.
+    """
+    information_pieces = _create_information_pieces()
+
+    async def body():
+        for piece in information_pieces:
+            yield (json.dumps(piece) + "\n").encode()
+
+    response = await api_client.post(
+        "/information_pieces/upload/stream", content=body(), headers={"content-type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    progress = [json.loads(line) for line in response.text.splitlines()]
+    assert progress[-1] == {"uploaded_piece_count": len(information_pieces), "done": True}
+
+    collection_name = os.environ.get("VECTOR_DB_COLLECTION_NAME")
+    app_container = api_client._transport.app.container
+    vectordb_client = app_container.vector_database()._vectorstore.client
+    assert vectordb_client.count(collection_name).count == len(information_pieces)
+
+
 async def _delete_document(api_client: AsyncClient, metadata: list[dict]) -> Response:
     _delete_request = DeleteRequest(metadata=metadata).model_dump()
     return await api_client.post("/information_pieces/remove", json=_delete_request)
@@ -554,6 +740,4 @@ async def test_upload_documents(api_client: AsyncClient):
     app_container = api_client._transport.app.container
     vectordb_client = app_container.vector_database()._vectorstore.client
     number_of_documents = len(vectordb_client.scroll(collection_name=collection_name, limit=maxsize)[0])
-    # NOTE: its not asserted to be of length len(information_pieces)+1 because in case of in memory database,
-    # overwriting the vectorstore leads to overwriting the contents in the collection.
-    assert number_of_documents == len(information_pieces)
+    assert number_of_documents == len(information_pieces) + 1
@@ -0,0 +1,159 @@
+"""Tests for the re-embedding of a collection with an alias swap."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_community.embeddings.fake import FakeEmbeddings
+from langchain_core.documents import Document
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from rag_core_api.impl.embeddings.langchain_community_embedder import LangchainCommunityEmbedder
+from rag_core_api.impl.settings.vector_db_settings import VectorDatabaseSettings
+from rag_core_api.impl.vector_databases.qdrant_database import QdrantDatabase
+from rag_core_api.tools.bulk_indexer import BulkIndexer
+from rag_core_api.tools.reembedding import create_collection_like, reembed, resolve_alias
+
+
+def _source_client():
+    documents = [
+        Document(page_content=f"Information piece {index}", metadata={"id": f"piece-{index}", "type": "TEXT"})
+        for index in range(5)
+    ]
+    vectorstore = QdrantVectorStore.from_documents(
+        documents,
+        embedding=FakeEmbeddings(size=4),
+        location=":memory:",
+        collection_name="rag-v1",
+        retrieval_mode=RetrievalMode.DENSE,
+    )
+    client = vectorstore.client
+    client.update_collection_aliases(
+        change_aliases_operations=[
+            models.CreateAliasOperation(create_alias=models.CreateAlias(collection_name="rag-v1", alias_name="rag"))
+        ]
+    )
+    return client
+
+
+def _indexer(client, target: str) -> BulkIndexer:
+    settings = VectorDatabaseSettings(collection_name=target, location=":memory:", retrieval_mode=RetrievalMode.DENSE)
+    embedder = LangchainCommunityEmbedder(embedder=FakeEmbeddings(size=8))
+    vectorstore = QdrantVectorStore(
+        client=client,
+        collection_name=target,
+        embedding=embedder.get_embedder(),
+        retrieval_mode=RetrievalMode.DENSE,
+        validate_collection_config=False,
+    )
+    database = QdrantDatabase(
+        settings=settings, embedder=embedder, sparse_embedder=None, vectorstore=vectorstore, embedding_model="fake-8"
+    )
+    return BulkIndexer(
+        vector_database=database,
+        retrieval_mode=RetrievalMode.DENSE,
+        embedder=embedder,
+        embedding_model="fake-8",
+        embed_batch_size=2,
+        upload_parallel=1,
+    )
+
+
+def _payloads(client: QdrantClient, collection_name: str) -> dict:
+    points, _ = client.scroll(collection_name, limit=10)
+    return {point.id: point.payload for point in points}
+
+
+def test_reembed_copies_all_points_and_swaps_the_alias():
+    """Re-embed every point with the new model, keeping IDs and payloads, and repoint the alias."""
+    client = _source_client()
+
+    progress = reembed(client, "rag", "rag-v2", _indexer(client, "rag-v2"), vector_size=8, batch_size=2)
+
+    assert progress.done == 5
+    assert resolve_alias(client, "rag") == "rag-v2"
+    vectors_config = client.get_collection("rag").config.params.vectors
+    assert vectors_config[""].size == 8
+    assert _payloads(client, "rag") == _payloads(client, "rag-v1")
+
+    serving_database = _indexer(client, "rag")._vector_database
+    assert serving_database.collection_available
+
+
+def test_reembed_keeps_the_alias_if_points_are_missing():
+    """Do not swap the alias if the old collection gained points during the re-embedding."""
+    client = _source_client()
+    indexer = _indexer(client, "rag-v2")
+    index = indexer.index
+
+    def index_while_uploading(chunks, on_written):
+        try:
+            return index(chunks, on_written)
+        finally:
+            QdrantVectorStore(
+                client=client,
+                collection_name="rag-v1",
+                embedding=FakeEmbeddings(size=4),
+                retrieval_mode=RetrievalMode.DENSE,
+            ).add_documents([Document(page_content="Uploaded meanwhile", metadata={"id": "piece-5", "type": "TEXT"})])
+
+    indexer.index = index_while_uploading
+
+    with pytest.raises(ValueError, match="were information pieces uploaded meanwhile"):
+        reembed(client, "rag", "rag-v2", indexer, vector_size=8, batch_size=2)
+
+    assert resolve_alias(client, "rag") == "rag-v1"
+
+
+def test_new_collection_keeps_the_configuration_of_the_old_one():
+    """Copy HNSW, quantization, optimizer and on-disk settings, and only change the dense vector size."""
+    client = MagicMock()
+    source_config = models.CollectionConfig(
+        params=models.CollectionParams(
+            vectors={"": models.VectorParams(size=4, distance=models.Distance.DOT, on_disk=True)},
+            sparse_vectors={
+                "langchain-sparse": models.SparseVectorParams(index=models.SparseIndexParams(on_disk=True))
+            },
+            shard_number=2,
+            sharding_method=models.ShardingMethod.CUSTOM,
+            replication_factor=2,
+            on_disk_payload=True,
+        ),
+        hnsw_config=models.HnswConfig(m=32, ef_construct=256, full_scan_threshold=5000, on_disk=True, payload_m=16),
+        optimizer_config=models.OptimizersConfig(
+            deleted_threshold=0.1,
+            vacuum_min_vector_number=500,
+            default_segment_number=4,
+            indexing_threshold=50000,
+            flush_interval_sec=10,
+            memmap_threshold=20000,
+        ),
+        wal_config=models.WalConfig(wal_capacity_mb=64, wal_segments_ahead=1),
+        quantization_config=models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, always_ram=True)
+        ),
+    )
+    client.get_collection.return_value = models.CollectionInfo(
+        status=models.CollectionStatus.GREEN,
+        optimizer_status=models.OptimizersStatusOneOf.OK,
+        segments_count=1,
+        config=source_config,
+        payload_schema={},
+    )
+
+    create_collection_like(client, "rag-v1", "rag-v2", vector_size=8)
+
+    client.create_collection.assert_called_once()
+    assert client.create_collection.call_args.args == ("rag-v2",)
+    options = client.create_collection.call_args.kwargs
+    assert options["vectors_config"] == {"": models.VectorParams(size=8, distance=models.Distance.DOT, on_disk=True)}
+    assert options["sparse_vectors_config"] == source_config.params.sparse_vectors
+    assert options["hnsw_config"].model_dump() == source_config.hnsw_config.model_dump()
+    assert options["optimizers_config"].model_dump() == source_config.optimizer_config.model_dump()
+    assert options["wal_config"].model_dump() == source_config.wal_config.model_dump()
+    assert options["quantization_config"] == source_config.quantization_config
+    assert options["on_disk_payload"] is True
+    assert options["shard_number"] == 2
+    assert options["sharding_method"] == models.ShardingMethod.CUSTOM
+    assert options["replication_factor"] == 2
@@ -0,0 +1,49 @@
+"""Test the small talk detection of ``RuleBasedMessageClassifier``."""
+
+import pytest
+
+from rag_core_api.impl.message_classification.rule_based_message_classifier import (
+    RuleBasedMessageClassifier,
+)
+from rag_core_api.message_classification.message_classifier import MessageCategory
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Hi!", MessageCategory.GREETING),
+        ("Guten Morgen zusammen", MessageCategory.GREETING),
+        ("Thanks a lot!", MessageCategory.THANKS),
+        ("Hallo, vielen Dank für die Hilfe.", MessageCategory.THANKS),
+        ("ok bye", MessageCategory.QUESTION),
+        ("Tschüss!", MessageCategory.GOODBYE),
+        ("Who are you?", MessageCategory.META),
+        ("Was kannst du alles?", MessageCategory.META),
+        ("Hi, what is the vacation policy?", MessageCategory.QUESTION),
+        ("Thanks. How many days of leave do I have?", MessageCategory.QUESTION),
+        ("", MessageCategory.QUESTION),
+    ],
+)
+def test_classify(message: str, expected: MessageCategory):
+    """Only messages that consist of small talk alone skip retrieval."""
+    assert RuleBasedMessageClassifier().classify(message) == expected
+
+
+def test_long_messages_are_questions():
+    """Do not classify long messages as small talk."""
+    assert RuleBasedMessageClassifier(max_words=1).classify("hello there") == MessageCategory.QUESTION
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Hi!", "en"),
+        ("Guten Morgen zusammen", "de"),
+        ("Hallo, thanks a lot!", "en"),
+        ("Vielen Dank!", "de"),
+        ("Hi, what is the vacation policy?", None),
+    ],
+)
+def test_detect_language(message: str, expected: str | None):
+    """Tell the language of small talk from the matched phrase."""
+    assert RuleBasedMessageClassifier().detect_language(message) == expected
@@ -0,0 +1,47 @@
+"""Tests for the information piece mapping and the serialization benchmark."""
+
+import json
+
+from langchain_core.documents import Document
+
+from rag_core_api.mapper.information_piece_mapper import InformationPieceMapper
+from rag_core_api.models.content_type import ContentType
+from rag_core_api.models.information_piece import InformationPiece
+from rag_core_api.models.key_value_pair import KeyValuePair
+from rag_core_api.tuning.serialization_benchmark import run
+
+
+def test_information_pieces_survive_the_mapping_round_trip():
+    """Map information pieces to documents and back without changing their content."""
+    metadata = {
+        "id": "piece-1",
+        "type": "TEXT",
+        "document_url": "http://example.com/ünïcode.pdf",
+        "chunk": {"start": 1, "labels": ["a", "ß"]},
+    }
+    piece = InformationPiece(
+        page_content="Der Eiffelturm.",
+        type=ContentType.TEXT,
+        metadata=[KeyValuePair(key=key, value=json.dumps(value)) for key, value in metadata.items()],
+    )
+
+    document = InformationPieceMapper.information_piece2langchain_document(piece)
+    mapped = InformationPieceMapper.langchain_document2information_piece(document)
+
+    assert document == Document(page_content="Der Eiffelturm.", metadata=metadata)
+    assert mapped.type == ContentType.TEXT
+    assert {pair.key: json.loads(pair.value) for pair in mapped.metadata} == metadata
+    assert (
+        mapped.model_dump()
+        == piece.model_copy(
+            update={"metadata": [KeyValuePair(key=pair.key, value=pair.value) for pair in mapped.metadata]}
+        ).model_dump()
+    )
+
+
+def test_benchmark_reports_every_step():
+    """Measure every serialization step and the total."""
+    results = run(pieces=20, repeat=1)
+
+    assert [result.step for result in results][-1] == "total"
+    assert all(result.baseline_ms > 0 and result.fast_ms > 0 for result in results)
@@ -0,0 +1,138 @@
+"""Test the session-scoped document reuse of ``SessionContextRetriever``."""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
+
+from rag_core_api.impl.retriever.session_context_retriever import SessionContextRetriever
+from rag_core_api.impl.settings.session_context_settings import SessionContextSettings
+
+
+class _CountingRetriever:
+    def __init__(self, documents: list[Document]):
+        self.documents = documents
+        self.calls = 0
+
+    async def ainvoke(self, retriever_input, config=None):
+        self.calls += 1
+        return list(self.documents)
+
+
+class _LookupEmbedder:
+    def __init__(self, vectors: dict[str, list[float]]):
+        self._vectors = vectors
+        self.calls = 0
+
+    def get_embedder(self):
+        return self
+
+    async def aembed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return self._vectors[text]
+
+
+class _ScoringReranker:
+    def __init__(self, score: float):
+        self.score = score
+        self.calls = 0
+
+    async def ainvoke(self, payload, config=None):
+        self.calls += 1
+        documents, _query = payload
+        return [
+            Document(page_content=d.page_content, metadata=d.metadata | {"relevance_score": self.score})
+            for d in documents
+        ]
+
+
+_VECTORS = {
+    "what is x?": [1.0, 0.0],
+    "and how does x work?": [0.95, 0.05],
+    "tell me about y": [0.0, 1.0],
+}
+
+
+def _config(session_id: str | None) -> RunnableConfig:
+    return RunnableConfig(metadata={"session_id": session_id, "filter_kwargs": {}})
+
+
+def _mk_retriever(reranker=None, **settings) -> tuple[SessionContextRetriever, _CountingRetriever]:
+    inner = _CountingRetriever([Document(page_content="x", metadata={"id": "1"})])
+    retriever = SessionContextRetriever(
+        inner,
+        _LookupEmbedder(_VECTORS),
+        reranker,
+        reranker is not None,
+        SessionContextSettings(enabled=True, **settings),
+    )
+    return retriever, inner
+
+
+@pytest.mark.asyncio
+async def test_follow_up_question_reuses_documents_of_previous_turn():
+    """Skip the full retrieval for a similar follow-up question whose cached documents score well."""
+    reranker = _ScoringReranker(score=0.9)
+    retriever, inner = _mk_retriever(reranker)
+
+    await retriever.ainvoke("what is x?", config=_config("s1"))
+    docs = await retriever.ainvoke("and how does x work?", config=_config("s1"))
+
+    assert inner.calls == 1
+    assert reranker.calls == 1
+    assert docs[0].metadata["relevance_score"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_low_reranker_score_triggers_full_retrieval():
+    """Fall back to a full retrieval if the cached documents do not fit the follow-up question."""
+    retriever, inner = _mk_retriever(_ScoringReranker(score=0.1))
+
+    await retriever.ainvoke("what is x?", config=_config("s1"))
+    await retriever.ainvoke("and how does x work?", config=_config("s1"))
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_topic_change_and_other_sessions_run_full_retrieval():
+    """Only reuse documents of the same session for a semantically close question."""
+    retriever, inner = _mk_retriever()
+
+    await retriever.ainvoke("what is x?", config=_config("s1"))
+    await retriever.ainvoke("tell me about y", config=_config("s1"))
+    await retriever.ainvoke("what is x?", config=_config("s2"))
+
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_passes_through_without_session_id_or_when_disabled():
+    """Never cache if the request carries no session id or the feature is disabled."""
+    retriever, inner = _mk_retriever()
+    await retriever.ainvoke("what is x?", config=_config(None))
+    await retriever.ainvoke("what is x?", config=_config(None))
+    assert inner.calls == 2
+
+    disabled = SessionContextRetriever(inner, _LookupEmbedder(_VECTORS), None, False, SessionContextSettings())
+    await disabled.ainvoke("what is x?", config=_config("s1"))
+    await disabled.ainvoke("what is x?", config=_config("s1"))
+    assert inner.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_questions_are_only_embedded_when_the_session_has_cached_documents():
+    """Do not embed the first question of a session, and embed every question at most once afterwards."""
+    embedder = _LookupEmbedder(_VECTORS)
+    inner = _CountingRetriever([Document(page_content="x", metadata={"id": "1"})])
+    retriever = SessionContextRetriever(inner, embedder, None, False, SessionContextSettings(enabled=True))
+
+    await retriever.ainvoke("what is x?", config=_config("s1"))
+    assert embedder.calls == 0
+
+    await retriever.ainvoke("tell me about y", config=_config("s1"))
+    assert embedder.calls == 2
+    await retriever.ainvoke("what is x?", config=_config("s1"))
+    assert embedder.calls == 3
+    assert inner.calls == 3
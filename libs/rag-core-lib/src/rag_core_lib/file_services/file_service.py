@@ -75,3 +75,27 @@ class FileService(ABC):
         file_name : str
             The name of the file to be deleted from the file storage.
         """
+
+    def delete_files(self, file_names: list[str]) -> dict[str, str]:
+        """Delete several files from the file storage.
+
+        Implementations should override this if the storage supports deleting files in bulk; by default the files
+        are deleted one by one.
+
+        Parameters
+        ----------
+        file_names : list[str]
+            The names of the files to be deleted from the file storage.
+
+        Returns
+        -------
+        dict[str, str]
+            The error per file name that could not be deleted.
+        """
+        errors = {}
+        for file_name in file_names:
+            try:
+                self.delete_file(file_name)
+            except Exception as e:
+                errors[file_name] = str(e)
+        return errors
@@ -2,14 +2,26 @@
 
 from rag_core_lib.impl.embeddings.embedder import Embedder
 from rag_core_lib.impl.embeddings.embedder_type import EmbedderType
+from rag_core_lib.impl.embeddings.embedding_reducer import EmbeddingReducer
+from rag_core_lib.impl.embeddings.embedding_reduction_type import EmbeddingReductionType
+from rag_core_lib.impl.embeddings.fastembed_embedder import FastEmbedEmbedder
 from rag_core_lib.impl.embeddings.langchain_community_embedder import (
     LangchainCommunityEmbedder,
 )
+from rag_core_lib.impl.embeddings.pca_reducer import PcaReducer
+from rag_core_lib.impl.embeddings.reduced_embedder import ReducedEmbedder
 from rag_core_lib.impl.embeddings.stackit_embedder import StackitEmbedder
+from rag_core_lib.impl.embeddings.truncation_reducer import TruncationReducer
 
 __all__ = [
     "Embedder",
     "EmbedderType",
+    "EmbeddingReducer",
+    "EmbeddingReductionType",
+    "FastEmbedEmbedder",
     "LangchainCommunityEmbedder",
+    "PcaReducer",
+    "ReducedEmbedder",
     "StackitEmbedder",
+    "TruncationReducer",
 ]
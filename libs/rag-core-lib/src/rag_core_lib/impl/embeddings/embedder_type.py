@@ -9,4 +9,5 @@ class EmbedderType(StrEnum):
 
     OLLAMA = "ollama"
     STACKIT = "stackit"
+    FASTEMBED = "fastembed"
     FAKE = "fake"
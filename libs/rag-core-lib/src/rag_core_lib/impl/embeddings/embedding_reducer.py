@@ -0,0 +1,44 @@
+"""Module containing the EmbeddingReducer abstract base class."""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class EmbeddingReducer(ABC):
+    """Abstract base class mapping dense embeddings to fewer dimensions.
+
+    Reduced embeddings are L2-normalized, so cosine and dot product scores stay comparable.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identify the reduction; embeddings reduced differently must not share a collection."""
+
+    @property
+    @abstractmethod
+    def dimensions(self) -> int:
+        """The number of dimensions of the reduced embeddings."""
+
+    def reduce(self, embeddings: list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        Reduce embeddings to fewer dimensions.
+
+        Parameters
+        ----------
+        embeddings : list[list[float]] | np.ndarray
+            The embeddings, one per row.
+
+        Returns
+        -------
+        np.ndarray
+            The reduced, L2-normalized embeddings as float32, one per row.
+        """
+        reduced = self._project(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        return reduced / np.where(norms == 0, 1, norms)
+
+    @abstractmethod
+    def _project(self, embeddings: np.ndarray) -> np.ndarray:
+        """Map a matrix of embeddings, one per row, to the reduced dimensions."""
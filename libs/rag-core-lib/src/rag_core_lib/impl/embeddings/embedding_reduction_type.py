@@ -0,0 +1,12 @@
+"""Module containing the EmbeddingReductionType enumeration."""
+
+from enum import StrEnum, unique
+
+
+@unique
+class EmbeddingReductionType(StrEnum):
+    """An enumeration of the ways dense embeddings can be reduced to fewer dimensions."""
+
+    NONE = "none"
+    TRUNCATE = "truncate"
+    PCA = "pca"
@@ -0,0 +1,78 @@
+"""Module that contains the FastEmbedEmbedder class."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.embeddings import Embeddings
+
+from rag_core_lib.impl.embeddings.embedder import Embedder
+from rag_core_lib.impl.settings.fastembed_embedder_settings import FastEmbedEmbedderSettings
+
+logger = logging.getLogger(__name__)
+
+
+class FastEmbedEmbedder(Embedder, Embeddings):
+    """LangChain-compatible dense embedder running a local ONNX model via FastEmbed.
+
+    Texts are embedded in batches of ``batch_size``; with ``max_workers`` above one, the batches are embedded
+    concurrently on a thread pool. ONNX Runtime releases the GIL while it runs the model, so the threads run in
+    parallel.
+    """
+
+    def __init__(self, fastembed_embedder_settings: FastEmbedEmbedderSettings) -> None:
+        """Initialise the FastEmbed embedder and load the model.
+
+        Parameters
+        ----------
+        fastembed_embedder_settings : FastEmbedEmbedderSettings
+            Configuration of the local model.
+
+        Raises
+        ------
+        ImportError
+            If the fastembed package is not installed.
+        """
+        try:
+            from fastembed import TextEmbedding
+        except ImportError as e:
+            raise ImportError(
+                "The fastembed embedder requires the fastembed package, install it with `pip install fastembed`."
+            ) from e
+
+        self._settings = fastembed_embedder_settings
+        self._model = TextEmbedding(
+            model_name=fastembed_embedder_settings.model,
+            cache_dir=fastembed_embedder_settings.cache_dir,
+            threads=fastembed_embedder_settings.threads,
+        )
+        self._executor = (
+            ThreadPoolExecutor(max_workers=fastembed_embedder_settings.max_workers, thread_name_prefix="fastembed")
+            if fastembed_embedder_settings.max_workers > 1
+            else None
+        )
+
+    def get_embedder(self) -> "FastEmbedEmbedder":
+        """Return the embedder instance."""
+        return self
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed multiple documents with the local model, in batches."""
+        batch_size = self._settings.batch_size
+        batches = [texts[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+        if self._executor is None or len(batches) < 2:
+            results = map(self._embed_batch, batches)
+        else:
+            results = self._executor.map(self._embed_batch, batches)
+        return [embedding for batch in results for embedding in batch]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query with the local model."""
+        embeddings = list(self._model.query_embed(text))
+        if embeddings:
+            return embeddings[0].tolist()
+        logger.warning("No embeddings found for query: %s", text)
+        return []
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        # One batch per model call, the batching across calls is done by embed_documents.
+        return [embedding.tolist() for embedding in self._model.passage_embed(texts, batch_size=len(texts))]
@@ -0,0 +1,106 @@
+"""Module containing the PcaReducer class."""
+
+import hashlib
+
+import numpy as np
+
+from rag_core_lib.impl.embeddings.embedding_reducer import EmbeddingReducer
+
+
+class PcaReducer(EmbeddingReducer):
+    """Projects embeddings onto their principal components, fitted on a sample of the embedded corpus.
+
+    Works for any embedding model. The components are fitted without centering the sample, so the projection best
+    preserves the dot products the search ranks by. The projection is stored as a ``.npz`` file, and a collection
+    can only be searched with the projection its points were reduced with.
+    """
+
+    def __init__(self, components: np.ndarray):
+        """
+        Initialize the PcaReducer.
+
+        Parameters
+        ----------
+        components : np.ndarray
+            The orthonormal principal components, one per row, of shape (reduced dimensions, full dimensions).
+        """
+        if components.ndim != 2:
+            raise ValueError(f"The components must be a matrix, not of shape {components.shape}.")
+        self._components = components.astype(np.float32)
+        self._fingerprint = hashlib.sha256(self._components.tobytes()).hexdigest()[:12]
+
+    @property
+    def name(self) -> str:
+        """Identify the projection by its dimensions and a fingerprint, e.g. ``pca-256-3f2a9c0d81be``."""
+        return f"pca-{self.dimensions}-{self._fingerprint}"
+
+    @property
+    def dimensions(self) -> int:
+        """The number of dimensions of the reduced embeddings."""
+        return self._components.shape[0]
+
+    @classmethod
+    def fit(cls, embeddings: list[list[float]] | np.ndarray, dimensions: int) -> "PcaReducer":
+        """
+        Fit the projection on a sample of embeddings.
+
+        Parameters
+        ----------
+        embeddings : list[list[float]] | np.ndarray
+            The sample, one embedding per row. It needs at least as many embeddings as dimensions are kept.
+        dimensions : int
+            The number of principal components to keep.
+
+        Returns
+        -------
+        PcaReducer
+            The fitted projection.
+        """
+        sample = np.asarray(embeddings, dtype=np.float64)
+        if not 0 < dimensions <= min(sample.shape):
+            raise ValueError(
+                f"Cannot keep {dimensions} components of {sample.shape[0]} embeddings of dimension {sample.shape[1]}."
+            )
+        _, _, components = np.linalg.svd(sample, full_matrices=False)
+        return cls(components[:dimensions])
+
+    @classmethod
+    def load(cls, path: str) -> "PcaReducer":
+        """
+        Load a projection written by `save`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the ``.npz`` file.
+
+        Returns
+        -------
+        PcaReducer
+            The projection.
+        """
+        with np.load(path) as projection:
+            return cls(projection["components"])
+
+    def save(self, path: str) -> None:
+        """
+        Write the projection to a ``.npz`` file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Returns
+        -------
+        None
+        """
+        with open(path, "wb") as file:
+            np.savez(file, components=self._components)
+
+    def _project(self, embeddings: np.ndarray) -> np.ndarray:
+        if embeddings.shape[1] != self._components.shape[1]:
+            raise ValueError(
+                f"Embeddings have {embeddings.shape[1]} dimensions, the projection expects {self._components.shape[1]}."
+            )
+        return embeddings @ self._components.T
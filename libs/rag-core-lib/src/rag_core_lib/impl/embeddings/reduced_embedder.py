@@ -0,0 +1,124 @@
+"""Module that contains the ReducedEmbedder class and the factories of the embedding reduction."""
+
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+
+from rag_core_lib.impl.embeddings.embedder import Embedder
+from rag_core_lib.impl.embeddings.embedding_reducer import EmbeddingReducer
+from rag_core_lib.impl.embeddings.embedding_reduction_type import EmbeddingReductionType
+from rag_core_lib.impl.embeddings.pca_reducer import PcaReducer
+from rag_core_lib.impl.embeddings.truncation_reducer import TruncationReducer
+from rag_core_lib.impl.settings.embedding_reduction_settings import EmbeddingReductionSettings
+
+
+class ReducedEmbedder(Embedder, Embeddings):
+    """Wraps an embedder and reduces the dimensions of its embeddings.
+
+    Documents and queries are reduced the same way, so the same embedder has to be used for ingestion and search.
+    """
+
+    def __init__(self, embedder: Embedder, reducer: EmbeddingReducer):
+        """Initialise the wrapper.
+
+        Parameters
+        ----------
+        embedder : Embedder
+            The embedder computing the full embeddings.
+        reducer : EmbeddingReducer
+            The reduction applied to every embedding.
+        """
+        self._embedder = embedder
+        self._reducer = reducer
+
+    @property
+    def reducer(self) -> EmbeddingReducer:
+        """The reduction applied to every embedding."""
+        return self._reducer
+
+    def get_embedder(self) -> "ReducedEmbedder":
+        """Return the embedder instance."""
+        return self
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed multiple documents and reduce their embeddings."""
+        if not texts:
+            return []
+        return self._reducer.reduce(self._embedder.get_embedder().embed_documents(texts)).tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query and reduce its embedding."""
+        embedding = self._embedder.get_embedder().embed_query(text)
+        return self._reducer.reduce([embedding])[0].tolist()
+
+
+def embedding_reducer_from_settings(settings: EmbeddingReductionSettings) -> Optional[EmbeddingReducer]:
+    """
+    Create the reduction configured in the settings.
+
+    Parameters
+    ----------
+    settings : EmbeddingReductionSettings
+        The settings of the reduction.
+
+    Returns
+    -------
+    Optional[EmbeddingReducer]
+        The reduction, None if embeddings are not reduced.
+
+    Raises
+    ------
+    ValueError
+        If the setting required by the method is missing.
+    """
+    if settings.method == EmbeddingReductionType.TRUNCATE:
+        if settings.dimensions is None:
+            raise ValueError("EMBEDDING_REDUCTION_DIMENSIONS is required to truncate embeddings.")
+        return TruncationReducer(settings.dimensions)
+    if settings.method == EmbeddingReductionType.PCA:
+        if not settings.projection_path:
+            raise ValueError("EMBEDDING_REDUCTION_PROJECTION_PATH is required to project embeddings.")
+        return PcaReducer.load(settings.projection_path)
+    return None
+
+
+def with_embedding_reduction(embedder: Embedder, reducer: Optional[EmbeddingReducer]) -> Embedder:
+    """
+    Wrap an embedder so its embeddings are reduced.
+
+    Parameters
+    ----------
+    embedder : Embedder
+        The embedder computing the full embeddings.
+    reducer : Optional[EmbeddingReducer]
+        The reduction, None to keep the full embeddings.
+
+    Returns
+    -------
+    Embedder
+        The embedder itself without a reduction, a ReducedEmbedder otherwise.
+    """
+    return embedder if reducer is None else ReducedEmbedder(embedder, reducer)
+
+
+def reduced_embedding_model(model: Optional[str], reducer: Optional[EmbeddingReducer]) -> Optional[str]:
+    """
+    Name the embeddings of a model after the reduction, e.g. ``bge-m3+truncate-256``.
+
+    Precomputed vectors have to name the reduced model, so vectors reduced differently are rejected.
+
+    Parameters
+    ----------
+    model : Optional[str]
+        The ID of the embedding model, None if unknown.
+    reducer : Optional[EmbeddingReducer]
+        The reduction, None if embeddings are not reduced.
+
+    Returns
+    -------
+    Optional[str]
+        The ID of the reduced embeddings.
+    """
+    if model is None or reducer is None:
+        return model
+    return f"{model}+{reducer.name}"
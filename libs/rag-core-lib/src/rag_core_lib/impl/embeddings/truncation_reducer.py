@@ -0,0 +1,41 @@
+"""Module containing the TruncationReducer class."""
+
+import numpy as np
+
+from rag_core_lib.impl.embeddings.embedding_reducer import EmbeddingReducer
+
+
+class TruncationReducer(EmbeddingReducer):
+    """Keeps the leading dimensions of embeddings.
+
+    Only suited for models trained with Matryoshka representation learning, which concentrate the information in the
+    leading dimensions (e.g. nomic-embed-text-v1.5, OpenAI text-embedding-3, jina-embeddings-v3).
+    """
+
+    def __init__(self, dimensions: int):
+        """
+        Initialize the TruncationReducer.
+
+        Parameters
+        ----------
+        dimensions : int
+            The number of leading dimensions to keep.
+        """
+        if dimensions < 1:
+            raise ValueError("Embeddings have to keep at least one dimension.")
+        self._dimensions = dimensions
+
+    @property
+    def name(self) -> str:
+        """Identify the reduction, e.g. ``truncate-256``."""
+        return f"truncate-{self._dimensions}"
+
+    @property
+    def dimensions(self) -> int:
+        """The number of dimensions of the reduced embeddings."""
+        return self._dimensions
+
+    def _project(self, embeddings: np.ndarray) -> np.ndarray:
+        if embeddings.shape[1] < self._dimensions:
+            raise ValueError(f"Embeddings have {embeddings.shape[1]} dimensions, cannot keep {self._dimensions}.")
+        return embeddings[:, : self._dimensions]
@@ -13,7 +13,15 @@ logger = logging.getLogger(__name__)
 
 
 class S3Service(FileService):
-    """Class to handle I/O with S3 storage."""
+    """Class to handle I/O with S3 storage.
+
+    Attributes
+    ----------
+    DELETE_BATCH_SIZE : int
+        The number of objects deleted per request, the maximum S3 accepts.
+    """
+
+    DELETE_BATCH_SIZE = 1000
 
     def __init__(self, s3_settings: S3Settings):
         """Class to handle I/O with S3 storage.
@@ -128,3 +136,34 @@ class S3Service(FileService):
         except Exception:
             logger.exception("Error deleting file %s", file_name)
             raise
+
+    def delete_files(self, file_names: list[str]) -> dict[str, str]:
+        """Delete several files from the S3 bucket, with one request per batch of ``DELETE_BATCH_SIZE`` files.
+
+        Parameters
+        ----------
+        file_names : list[str]
+            The names of the files to be deleted from the S3 bucket.
+
+        Returns
+        -------
+        dict[str, str]
+            The error per file name that could not be deleted.
+        """
+        keys = list(dict.fromkeys(file_name.lstrip("/") for file_name in file_names))
+        errors = {}
+        for start in range(0, len(keys), self.DELETE_BATCH_SIZE):
+            batch = keys[start : start + self.DELETE_BATCH_SIZE]
+            try:
+                response = self._s3_client.delete_objects(
+                    Bucket=self._s3_settings.bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                logger.exception("Error deleting %d files", len(batch))
+                errors.update({key: str(e) for key in batch})
+                continue
+            for error in response.get("Errors", []):
+                errors[error["Key"]] = error.get("Message", error.get("Code", "Unknown error"))
+        logger.info("Deleted %d of %d files.", len(keys) - len(errors), len(keys))
+        return errors
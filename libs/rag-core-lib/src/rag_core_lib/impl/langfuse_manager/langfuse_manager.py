@@ -32,6 +32,7 @@ class LangfuseManager:
         langfuse: Langfuse,
         managed_prompts: dict[str, ChatPromptTemplate],
         llm: LLM,
+        chain_llms: Optional[dict[str, LLM]] = None,
     ):
         """
         Initialize the LangfuseManager.
@@ -45,9 +46,12 @@ class LangfuseManager:
             managed prompts.
         llm : LLM
             An instance of the LLM class.
+        chain_llms : Optional[dict[str, LLM]]
+            LLMs to use instead of `llm` for specific prompts, keyed by prompt name (default None).
         """
         self._langfuse = langfuse
         self._llm = llm
+        self._chain_llms = chain_llms or {}
         self._managed_prompts = managed_prompts
 
     def init_prompts(self) -> None:
@@ -95,7 +99,9 @@ class LangfuseManager:
 
             # Get LLM config (excluding API keys)
             llm_configurable_configs = {
-                config.id: config.default for config in self._llm.config_specs if self.API_KEY_FILTER not in config.id
+                config.id: config.default
+                for config in self._get_llm(base_prompt_name).config_specs
+                if self.API_KEY_FILTER not in config.id
             }
 
             self._langfuse.create_prompt(
@@ -128,12 +134,13 @@ class LangfuseManager:
             The base Large Language Model. If the Langfuse prompt is not found,
             returns the LLM with a fallback configuration.
         """
+        llm = self._get_llm(name)
         langfuse_prompt = self.get_langfuse_prompt(name)
         if not langfuse_prompt:
             logger.error("Using fallback for llm")
-            return self._llm
+            return llm
 
-        return self._llm.with_config({"configurable": langfuse_prompt.config})
+        return llm.with_config({"configurable": langfuse_prompt.config})
 
     def get_base_prompt(self, name: str) -> ChatPromptTemplate:
         """
@@ -185,6 +192,9 @@ class LangfuseManager:
         logger.error("Could not retrieve prompt template from langfuse. Using fallback value.")
         return self._managed_prompts[name]
 
+    def _get_llm(self, name: str) -> LLM:
+        return self._chain_llms.get(name, self._llm)
+
     def _convert_chat_prompt_to_langfuse_format(self, chat_prompt: ChatPromptTemplate) -> list[dict]:
         """
         Convert a ChatPromptTemplate to Langfuse chat format.
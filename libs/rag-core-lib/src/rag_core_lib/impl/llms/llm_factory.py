@@ -1,5 +1,7 @@
 """Module for creating and managing Large Language Models (LLMs) in the application."""
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models.base import BaseLanguageModel
@@ -43,6 +45,7 @@ _PROVIDER_KEY_MAP: dict[str, dict[str, str]] = {
 def chat_model_provider(
     settings: BaseSettings,
     provider: str = "openai",
+    model: Optional[str] = None,
 ) -> BaseLanguageModel:
     """
     Initialize a LangChain chat model with unified settings mapping and configurable fields.
@@ -53,6 +56,9 @@ def chat_model_provider(
         Pydantic settings subclass containing at least 'model'.
     provider : str, optional
         Name of the chat model provider (default 'openai').
+    model : Optional[str], optional
+        Model name overriding the 'model' of the settings, e.g. to serve auxiliary chains with a smaller model
+        of the same provider (default None).
 
     Returns
     -------
@@ -65,7 +71,8 @@ def chat_model_provider(
         If 'model' is not defined in settings or if the provider is unsupported.
     """
     data = settings.model_dump(exclude_none=True)
-    model_name = data.pop("model", None)
+    model_name = model or data.pop("model", None)
+    data.pop("model", None)
     if not model_name:
         raise ValueError("'model' must be defined in settings")
 
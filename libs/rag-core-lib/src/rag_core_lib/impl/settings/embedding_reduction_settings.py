@@ -0,0 +1,33 @@
+"""Settings regarding the dimension reduction of dense embeddings."""
+
+from typing import Optional
+
+from pydantic import Field, PositiveInt
+from pydantic_settings import BaseSettings
+
+from rag_core_lib.impl.embeddings.embedding_reduction_type import EmbeddingReductionType
+
+
+class EmbeddingReductionSettings(BaseSettings):
+    """Configuration of the reduction applied to every dense embedding, of documents and queries alike.
+
+    Attributes
+    ----------
+    method : EmbeddingReductionType
+        How embeddings are reduced (default "none").
+    dimensions : Optional[int]
+        The number of dimensions kept by "truncate" (default None).
+    projection_path : Optional[str]
+        The path of the PCA projection used by "pca", as written by
+        ``python -m rag_core_api.tuning.dimension_reduction fit`` (default None).
+    """
+
+    class Config:
+        """Configure environment integration for the settings."""
+
+        env_prefix = "EMBEDDING_REDUCTION_"
+        case_sensitive = False
+
+    method: EmbeddingReductionType = Field(default=EmbeddingReductionType.NONE)
+    dimensions: Optional[PositiveInt] = Field(default=None)
+    projection_path: Optional[str] = Field(default=None)
@@ -0,0 +1,36 @@
+"""Settings regarding the local FastEmbed embedder."""
+
+from typing import Optional
+
+from pydantic import Field, PositiveInt
+from pydantic_settings import BaseSettings
+
+
+class FastEmbedEmbedderSettings(BaseSettings):
+    """Configuration for a dense embeddings model running locally on ONNX Runtime via FastEmbed.
+
+    Attributes
+    ----------
+    model : str
+        The name of the FastEmbed model (default "BAAI/bge-small-en-v1.5").
+    batch_size : int
+        The number of texts embedded by one call of the model (default 64).
+    max_workers : int
+        The number of batches embedded concurrently; 1 embeds them one after another (default 1).
+    threads : Optional[int]
+        The number of ONNX Runtime threads per call, None lets ONNX Runtime decide (default None).
+    cache_dir : Optional[str]
+        The directory the model is downloaded to, None uses the FastEmbed default (default None).
+    """
+
+    class Config:
+        """Configure environment integration for the settings."""
+
+        env_prefix = "FASTEMBED_EMBEDDER_"
+        case_sensitive = False
+
+    model: str = Field(default="BAAI/bge-small-en-v1.5")
+    batch_size: PositiveInt = Field(default=64)
+    max_workers: PositiveInt = Field(default=1)
+    threads: Optional[PositiveInt] = Field(default=None)
+    cache_dir: Optional[str] = Field(default=None)
@@ -0,0 +1,128 @@
+"""Helpers to carry a per-request deadline through runnables, retries and LLM calls.
+
+The deadline is an absolute ``time.monotonic()`` timestamp. It is stored in the metadata of the
+``RunnableConfig`` under ``DEADLINE_METADATA_KEY`` and, for code that has no access to the config
+(e.g. the retry decorator), in a context variable. The context variable is inherited by tasks, ``asyncio.to_thread``
+and LangChain's ``run_in_executor`` with the default executor, which the ``aembed_*`` and ``ainvoke`` fallbacks of
+sync models use. ``loop.run_in_executor`` and ``Executor.submit`` do not copy the context; wrap the function with
+``contextvars.copy_context().run`` there.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+
+T = TypeVar("T")
+
+DEADLINE_METADATA_KEY = "deadline"
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("rag_request_deadline", default=None)
+
+
+def deadline_in(seconds: Optional[float]) -> Optional[float]:
+    """
+    Return the deadline that lies the given number of seconds in the future.
+
+    Parameters
+    ----------
+    seconds : Optional[float]
+        The time budget in seconds. None means no deadline.
+
+    Returns
+    -------
+    Optional[float]
+        The absolute deadline or None.
+    """
+    if seconds is None:
+        return None
+    return time.monotonic() + seconds
+
+
+def deadline_from_config(config: Optional[RunnableConfig] = None) -> Optional[float]:
+    """
+    Return the deadline of the config metadata, falling back to the deadline of the current context.
+
+    Parameters
+    ----------
+    config : Optional[RunnableConfig]
+        The config whose metadata may contain the deadline (default None).
+
+    Returns
+    -------
+    Optional[float]
+        The absolute deadline or None if there is no deadline.
+    """
+    metadata = (config or {}).get("metadata") or {}
+    deadline = metadata.get(DEADLINE_METADATA_KEY)
+    return _current_deadline.get() if deadline is None else deadline
+
+
+def remaining_seconds(config: Optional[RunnableConfig] = None) -> Optional[float]:
+    """
+    Return the remaining time budget in seconds.
+
+    Parameters
+    ----------
+    config : Optional[RunnableConfig]
+        The config whose metadata may contain the deadline (default None).
+
+    Returns
+    -------
+    Optional[float]
+        The remaining seconds (negative if the deadline passed) or None if there is no deadline.
+    """
+    deadline = deadline_from_config(config)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """
+    Make the deadline the deadline of the current context for the duration of the block.
+
+    Parameters
+    ----------
+    deadline : Optional[float]
+        The absolute deadline. None leaves the current deadline untouched.
+    """
+    if deadline is None:
+        yield
+        return
+    token = _current_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+async def wait_for_deadline(awaitable: Awaitable[T], config: Optional[RunnableConfig] = None) -> T:
+    """
+    Await the awaitable with the remaining time budget as timeout.
+
+    Parameters
+    ----------
+    awaitable : Awaitable[T]
+        The awaitable, e.g. the coroutine of an LLM call.
+    config : Optional[RunnableConfig]
+        The config whose metadata may contain the deadline (default None).
+
+    Returns
+    -------
+    T
+        The result of the awaitable.
+
+    Raises
+    ------
+    TimeoutError
+        If the deadline is reached before the awaitable completes.
+    """
+    remaining = remaining_seconds(config)
+    if remaining is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, timeout=max(remaining, 0.0))
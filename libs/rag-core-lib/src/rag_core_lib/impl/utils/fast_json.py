@@ -0,0 +1,100 @@
+"""Module with fast JSON encoding and decoding helpers for the APIs and mappers.
+
+The helpers use orjson. Values orjson can not encode, e.g. integers beyond 64 bit or dictionaries with keys that
+are not strings, fall back to the standard library.
+"""
+
+import json
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a value as JSON string.
+
+    Parameters
+    ----------
+    value : Any
+        The value to encode.
+
+    Returns
+    -------
+    str
+        The JSON encoded value.
+    """
+    try:
+        return orjson.dumps(value).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
+def loads(value: str | bytes) -> Any:
+    """
+    Decode a JSON string.
+
+    Parameters
+    ----------
+    value : str | bytes
+        The JSON to decode.
+
+    Returns
+    -------
+    Any
+        The decoded value.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the value is not valid JSON.
+    """
+    return orjson.loads(value)
+
+
+class ORJSONRequest(Request):
+    """Request decoding its JSON body with orjson."""
+
+    async def json(self) -> Any:
+        """
+        Decode the JSON body of the request.
+
+        Returns
+        -------
+        Any
+            The decoded body.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the body is not valid JSON.
+        """
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route decoding JSON request bodies with orjson, e.g. for ``APIRouter(route_class=ORJSONRoute)``.
+
+    Responses need no custom class: FastAPI serializes responses with a response model or return type directly
+    to JSON bytes.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """
+        Return the route handler, wrapping incoming requests in an `ORJSONRequest`.
+
+        Returns
+        -------
+        Callable[[Request], Coroutine[Any, Any, Response]]
+            The route handler.
+        """
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
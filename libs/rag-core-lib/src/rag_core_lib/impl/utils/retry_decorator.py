@@ -11,6 +11,7 @@ from typing import Callable, Optional, ParamSpec, TypeVar
 from pydantic_settings import BaseSettings
 
 from rag_core_lib.impl.settings.retry_decorator_settings import RetryDecoratorSettings
+from rag_core_lib.impl.utils.deadline import remaining_seconds
 from rag_core_lib.impl.utils.utils import (
     headers_from_exception,
     status_code_from_exception,
@@ -101,6 +102,22 @@ class _RetryEngine:
 
     def _calculate_wait_time(self, attempt: int, exc: BaseException) -> Optional[float]:
         """Return wait seconds or None to re-raise."""
+        wait = self._calculate_backoff_time(attempt, exc)
+        if wait is None:
+            return None
+        remaining = remaining_seconds()
+        if remaining is not None and remaining <= wait:
+            if self.logger:
+                self.logger.warning(
+                    "Giving up after attempt %d: remaining request budget %.2fs is below the next wait of %.2fs.",
+                    attempt + 1,
+                    max(remaining, 0.0),
+                    wait,
+                )
+            return None
+        return wait
+
+    def _calculate_backoff_time(self, attempt: int, exc: BaseException) -> Optional[float]:
         total_attempts = self.cfg.max_retries + 1
         if attempt == self.cfg.max_retries:
             if self.logger:
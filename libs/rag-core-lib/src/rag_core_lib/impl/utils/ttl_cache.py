@@ -0,0 +1,112 @@
+"""Module containing the TTLCache class."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A bounded, threadsafe least-recently-used cache whose entries expire after a fixed time to live."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the TTLCache.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of entries. The least recently used entry is evicted when the limit is exceeded.
+        ttl_seconds : float
+            The time in seconds after which an entry expires.
+        clock : Callable[[], float]
+            The clock used to determine the age of entries (default time.monotonic).
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including entries that have expired but were not evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the value stored for the key, if present and not expired.
+
+        Parameters
+        ----------
+        key : K
+            The key to look up.
+
+        Returns
+        -------
+        Optional[V]
+            The stored value or None if the key is unknown or the entry expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store the value for the key and reset its time to live.
+
+        Parameters
+        ----------
+        key : K
+            The key to store the value for.
+        value : V
+            The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Remove the entry for the key.
+
+        Parameters
+        ----------
+        key : K
+            The key to remove.
+
+        Returns
+        -------
+        Optional[V]
+            The removed value or None if the key was unknown.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[1] if entry else None
+
+    def _evict(self) -> None:
+        # Expired entries in the middle of the LRU order are dropped lazily by get().
+        now = self._clock()
+        while self._entries and next(iter(self._entries.values()))[0] <= now:
+            self._entries.popitem(last=False)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
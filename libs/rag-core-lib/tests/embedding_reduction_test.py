@@ -0,0 +1,80 @@
+"""Module for testing the reduction of dense embeddings."""
+
+import numpy as np
+import pytest
+
+from rag_core_lib.impl.embeddings.embedding_reduction_type import EmbeddingReductionType
+from rag_core_lib.impl.embeddings.langchain_community_embedder import LangchainCommunityEmbedder
+from rag_core_lib.impl.embeddings.pca_reducer import PcaReducer
+from rag_core_lib.impl.embeddings.reduced_embedder import (
+    ReducedEmbedder,
+    embedding_reducer_from_settings,
+    reduced_embedding_model,
+    with_embedding_reduction,
+)
+from rag_core_lib.impl.embeddings.truncation_reducer import TruncationReducer
+from rag_core_lib.impl.settings.embedding_reduction_settings import EmbeddingReductionSettings
+
+
+class _LookupEmbeddings:
+    def __init__(self, vectors: dict[str, list[float]]):
+        self._vectors = vectors
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._vectors[text]
+
+
+def test_truncation_keeps_the_leading_dimensions_and_renormalizes():
+    """Keep the leading dimensions and scale them back to unit length."""
+    reduced = TruncationReducer(2).reduce([[3.0, 4.0, 12.0], [0.0, 0.0, 1.0]])
+
+    np.testing.assert_allclose(reduced, [[0.6, 0.8], [0.0, 0.0]])
+
+
+def test_pca_projection_survives_saving_and_keeps_the_variance(tmp_path):
+    """Reduce alike after saving and loading, and preserve the dot products of data spanned by the components."""
+    rng = np.random.default_rng(0)
+    # Points on a plane through the origin in 6 dimensions: two components preserve all dot products.
+    sample = rng.normal(size=(200, 2)) @ rng.normal(size=(2, 6))
+    reducer = PcaReducer.fit(sample, 2)
+    path = str(tmp_path / "rag.pca-2.npz")
+
+    reducer.save(path)
+    loaded = PcaReducer.load(path)
+
+    assert loaded.name == reducer.name
+    assert loaded.name.startswith("pca-2-")
+    np.testing.assert_allclose(loaded.reduce(sample[:5]), reducer.reduce(sample[:5]), rtol=1e-5)
+    projected = sample @ reducer._components.T.astype(np.float64)
+    np.testing.assert_allclose(projected @ projected.T, sample @ sample.T, rtol=1e-3, atol=1e-3)
+
+
+def test_reduced_embedder_reduces_documents_and_queries_alike():
+    """Apply the same reduction to document and query embeddings."""
+    embedder = with_embedding_reduction(
+        LangchainCommunityEmbedder(_LookupEmbeddings({"a": [3.0, 4.0, 1.0], "b": [1.0, 0.0, 5.0]})),
+        TruncationReducer(2),
+    )
+
+    assert isinstance(embedder, ReducedEmbedder)
+    np.testing.assert_allclose(embedder.embed_documents(["a", "b"]), [[0.6, 0.8], [1.0, 0.0]], rtol=1e-6)
+    assert embedder.embed_query("a") == pytest.approx(embedder.embed_documents(["a"])[0])
+    assert embedder.embed_documents([]) == []
+
+
+def test_reduction_from_settings_names_the_reduced_model():
+    """Create the configured reduction and name the reduced embedding model after it."""
+    none = embedding_reducer_from_settings(EmbeddingReductionSettings())
+    truncate = embedding_reducer_from_settings(
+        EmbeddingReductionSettings(method=EmbeddingReductionType.TRUNCATE, dimensions=256)
+    )
+
+    assert none is None
+    assert reduced_embedding_model("bge-m3", none) == "bge-m3"
+    assert reduced_embedding_model("bge-m3", truncate) == "bge-m3+truncate-256"
+    assert reduced_embedding_model(None, truncate) is None
+    with pytest.raises(ValueError, match="EMBEDDING_REDUCTION_PROJECTION_PATH"):
+        embedding_reducer_from_settings(EmbeddingReductionSettings(method=EmbeddingReductionType.PCA))
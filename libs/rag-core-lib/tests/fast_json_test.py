@@ -0,0 +1,35 @@
+"""Module for testing the fast JSON helpers."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Body, FastAPI
+from fastapi.testclient import TestClient
+
+from rag_core_lib.impl.utils import fast_json
+from rag_core_lib.impl.utils.fast_json import ORJSONRoute
+
+
+def test_orjson_route_decodes_request_bodies():
+    """Decode valid JSON bodies and reject malformed ones with a validation error."""
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.post("/echo")
+    async def echo(items: Annotated[list[dict], Body()]) -> list[dict]:
+        return items
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.post("/echo", json=[{"key": "ä", "value": [1, 2]}])
+    assert response.status_code == 200
+    assert response.json() == [{"key": "ä", "value": [1, 2]}]
+
+    response = client.post("/echo", content=b"[{", headers={"content-type": "application/json"})
+    assert response.status_code == 422
+
+
+def test_dumps_falls_back_for_values_orjson_can_not_encode():
+    """Encode values orjson rejects with the standard library."""
+    assert fast_json.loads(fast_json.dumps({"key": ["value", 1]})) == {"key": ["value", 1]}
+    assert fast_json.dumps({1: 2**70}) == '{"1": 1180591620717411303424}'
@@ -0,0 +1,49 @@
+"""Module for testing the FastEmbedEmbedder."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from rag_core_lib.impl.embeddings.fastembed_embedder import FastEmbedEmbedder
+from rag_core_lib.impl.settings.fastembed_embedder_settings import FastEmbedEmbedderSettings
+
+
+class _FakeTextEmbedding:
+    def __init__(self, model_name: str, cache_dir=None, threads=None):
+        self.model_name = model_name
+        self.batches = []
+
+    def passage_embed(self, texts, batch_size=256):
+        self.batches.append(list(texts))
+        return (np.array([float(text), 0.0]) for text in texts)
+
+    def query_embed(self, query):
+        return iter([np.array([0.0, float(query)])])
+
+
+def _embedder(**settings) -> FastEmbedEmbedder:
+    with patch.dict(sys.modules, {"fastembed": SimpleNamespace(TextEmbedding=_FakeTextEmbedding)}):
+        return FastEmbedEmbedder(FastEmbedEmbedderSettings(**settings))
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_embed_documents_embeds_in_batches_and_keeps_the_order(max_workers: int):
+    """Embed the texts in batches, sequentially or on a thread pool, and return the vectors in input order."""
+    embedder = _embedder(batch_size=2, max_workers=max_workers)
+    texts = [str(index) for index in range(5)]
+
+    embeddings = embedder.embed_documents(texts)
+
+    assert embeddings == [[float(index), 0.0] for index in range(5)]
+    assert sorted(embedder._model.batches) == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_embed_query_uses_the_query_embedding():
+    """Embed queries with the query embedding of the model."""
+    embedder = _embedder()
+
+    assert embedder.embed_query("7") == [0.0, 7.0]
+    assert embedder.get_embedder() is embedder
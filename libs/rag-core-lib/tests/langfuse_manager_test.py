@@ -0,0 +1,32 @@
+"""Module for testing the per-chain LLM routing of the LangfuseManager."""
+
+from unittest.mock import MagicMock
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from rag_core_lib.impl.langfuse_manager.langfuse_manager import LangfuseManager
+
+
+def _mk_manager(chain_llms=None):
+    langfuse = MagicMock()
+    langfuse.get_prompt.return_value = MagicMock(config={"temperature": 0})
+    prompts = {name: ChatPromptTemplate.from_template("{question}") for name in ("Answer", "Rephrase")}
+    default_llm = MagicMock(name="default_llm")
+    return LangfuseManager(langfuse, prompts, default_llm, chain_llms=chain_llms), default_llm
+
+
+def test_get_base_llm_uses_chain_specific_llm():
+    """Use the LLM configured for a chain, with the config of its prompt."""
+    small_llm = MagicMock(name="small_llm")
+    manager, default_llm = _mk_manager({"Rephrase": small_llm})
+
+    assert manager.get_base_llm("Rephrase") is small_llm.with_config.return_value
+    assert manager.get_base_llm("Answer") is default_llm.with_config.return_value
+    small_llm.with_config.assert_called_once_with({"configurable": {"temperature": 0}})
+
+
+def test_get_base_llm_falls_back_to_default_llm():
+    """Use the default LLM for chains without a dedicated LLM."""
+    manager, default_llm = _mk_manager()
+
+    assert manager.get_base_llm("Rephrase") is default_llm.with_config.return_value
@@ -5,8 +5,10 @@ import time
 from typing import Optional
 
 import pytest
+from langchain_core.runnables.config import run_in_executor
 
 from rag_core_lib.impl.settings.retry_decorator_settings import RetryDecoratorSettings
+from rag_core_lib.impl.utils.deadline import deadline_in, deadline_scope
 from rag_core_lib.impl.utils.retry_decorator import retry_with_backoff
 
 
@@ -175,3 +177,33 @@ def test_sync_rate_limit_headers(counter, sync_sleeps):
     assert fn() == "ok"
     assert counter.n == 2
     assert any(x >= 2.0 for x in sync_sleeps)
+
+
+@pytest.mark.asyncio
+async def test_async_stops_retrying_when_deadline_is_too_close(counter, async_sleeps):
+    """Test that no retry is scheduled if the next wait exceeds the remaining request budget."""
+
+    @retry_with_backoff(settings=RetryDecoratorSettings(max_retries=3, retry_base_delay=5))
+    async def fn():
+        counter.inc()
+        raise DummyError("boom")
+
+    with deadline_scope(deadline_in(1.0)), pytest.raises(DummyError):
+        await fn()
+    assert counter.n == 1
+    assert async_sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_sync_call_in_executor_sees_the_deadline(counter, sync_sleeps):
+    """Test that sync retries run by LangChain's run_in_executor inherit the deadline of the request."""
+
+    @retry_with_backoff(settings=RetryDecoratorSettings(max_retries=3, retry_base_delay=5))
+    def fn():
+        counter.inc()
+        raise DummyError("boom")
+
+    with deadline_scope(deadline_in(1.0)), pytest.raises(DummyError):
+        await run_in_executor(None, fn)
+    assert counter.n == 1
+    assert sync_sleeps == []
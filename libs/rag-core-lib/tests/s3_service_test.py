@@ -0,0 +1,34 @@
+"""Module for testing the S3Service."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rag_core_lib.impl.file_services.s3_service import S3Service
+from rag_core_lib.impl.settings.s3_settings import S3Settings
+
+
+@pytest.fixture
+def s3_service(monkeypatch: pytest.MonkeyPatch) -> S3Service:
+    """Create an S3Service with settings from the environment and without a real client."""
+    monkeypatch.setenv("S3_ENDPOINT", "http://localhost:9000")
+    monkeypatch.setenv("S3_ACCESS_KEY_ID", "key")
+    monkeypatch.setenv("S3_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("S3_BUCKET", "bucket")
+    with patch("rag_core_lib.impl.file_services.s3_service.boto3"):
+        return S3Service(S3Settings())
+
+
+def test_delete_files_deletes_in_batches_and_reports_errors(s3_service: S3Service):
+    """Delete at most 1000 objects per request and return the keys that could not be deleted."""
+    client = MagicMock()
+    client.delete_objects.side_effect = [{}, {"Errors": [{"Key": "file-1000", "Code": "AccessDenied"}]}]
+    s3_service._s3_client = client
+
+    errors = s3_service.delete_files([f"/file-{index}" for index in range(1001)])
+
+    batches = [call.kwargs["Delete"]["Objects"] for call in client.delete_objects.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 1]
+    assert batches[0][0] == {"Key": "file-0"}
+    assert batches[1] == [{"Key": "file-1000"}]
+    assert errors == {"file-1000": "AccessDenied"}
@@ -0,0 +1,50 @@
+"""Module for testing the TTLCache class."""
+
+import pytest
+
+from rag_core_lib.impl.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Drop entries once their time to live has passed."""
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Evict the least recently read or written entry when the cache is full."""
+    cache = TTLCache(max_size=2, ttl_seconds=60, clock=FakeClock())
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalid_limits_are_rejected():
+    """Reject caches without capacity or time to live."""
+    with pytest.raises(ValueError, match="max_size"):
+        TTLCache(max_size=0, ttl_seconds=1)
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        TTLCache(max_size=1, ttl_seconds=0)